@@ -3,4 +3,5 @@ from . import Visualisations
 from .compare_perturbed_with_baseline_by_claude_idk_if_good import (
     load_parquet_as_graphs,
     process_one_network)
-from .compare_perturbed_to_baseline import evaluate_network_repeats
\ No newline at end of file
+from .compare_perturbed_to_baseline import evaluate_network_repeats
+from .repeat_edges import RepeatEdgeArrays
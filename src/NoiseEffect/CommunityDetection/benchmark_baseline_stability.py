@@ -1,7 +1,9 @@
 import igraph as ig
 import networkx as nx
 import itertools
+import numpy as np
 from NoiseEffect.CommunityDetection.utils import convertPartitionToLabels, getMetrics
+from NoiseEffect.CommunityDetection.consensus_stability import consensusStability
 from NoiseEffect.CommunityDetection.detection_algorithms import (
     leidenAlgorithmPartioning,
     infomapAlgorithmPartioning,
@@ -10,21 +12,34 @@ from NoiseEffect.CommunityDetection.detection_algorithms import (
 )
 
 
-def benchmarkBaselineStabilityAlgorithm(ig_graph: ig.Graph, list_of_seeds: list[int], algorithm: str, parameters: dict = {}):
+def benchmarkBaselineStabilityAlgorithm(ig_graph: ig.Graph, list_of_seeds: list[int], algorithm: str, parameters: dict = {}, mode: str = "pairwise"):
     """
     Runs a community detection algorithm multiple times to benchmark its stability.
 
+    In 'pairwise' mode all k(k-1)/2 pairs of runs are compared. In 'consensus'
+    mode the runs are summarized through their co-association on the edge set
+    (O(k·m)), which gives per-node and per-edge stability and a consensus
+    partition; every run is then compared once against that consensus.
+
     Args:
         ig_graph (igraph.Graph): The input graph.
         list_of_seeds (list[int]): A list of random seeds to run the algorithm with.
         algorithm (str): The name of the algorithm to use ('leiden', 'infomap').
         parameters (dict, optional): Extra parameters for the algorithm,
-                                     e.g., {'n_iterations': 5}. Defaults to {}.
+                                     e.g., {'n_iterations': 5}. For Leiden also
+                                     'backend', 'objective_function' and
+                                     'resolution'. Defaults to {}.
+        mode (str, optional): 'pairwise' or 'consensus'. Defaults to 'pairwise'.
 
     Returns:
-        list[dict]: A list of metric dictionaries, comparing all pairs
-                    of runs. Each dict contains 'ari', 'ami', etc.
+        list[dict] | dict: In 'pairwise' mode a list of metric dictionaries,
+                    comparing all pairs of runs. Each dict contains 'ari', 'ami', etc.
+                    In 'consensus' mode the output of `consensusStability`
+                    extended by 'comparisons', the metric dictionaries of
+                    every run against the consensus partition.
     """
+    if mode not in ("pairwise", "consensus"):
+        raise ValueError(f"Unknown mode: {mode}")
 
     num_nodes = ig_graph.vcount()
 
@@ -33,7 +48,12 @@ def benchmarkBaselineStabilityAlgorithm(ig_graph: ig.Graph, list_of_seeds: list[
             "n_iterations", 2
         )  # Get specified n_iterations or use default chosed by leidenalg package (which is 2)
         partitions = leidenAlgorithmPartioning(
-            ig_graph, list_of_seeds, n_iterations=n_iterations
+            ig_graph,
+            list_of_seeds,
+            n_iterations=n_iterations,
+            backend=parameters.get("backend", "leidenalg"),
+            objective_function=parameters.get("objective_function", "modularity"),
+            resolution=parameters.get("resolution", 1.0),
         )
     elif algorithm == "louvain":
         partitions = louvainPartioning(ig_graph, list_of_seeds)
@@ -57,6 +77,16 @@ def benchmarkBaselineStabilityAlgorithm(ig_graph: ig.Graph, list_of_seeds: list[
     for seed, partition in partitions.items():
         labels.append(convertPartitionToLabels(partition, num_nodes))
 
+    if mode == "consensus":
+        consensus = consensusStability(ig_graph, np.stack(labels))
+        consensus_labels = convertPartitionToLabels(
+            consensus["consensus_partition"], num_nodes
+        )
+        consensus["comparisons"] = [
+            getMetrics(run_labels, consensus_labels) for run_labels in labels
+        ]
+        return consensus
+
     all_ordered_pairs = itertools.combinations(labels, 2)
 
     results = []
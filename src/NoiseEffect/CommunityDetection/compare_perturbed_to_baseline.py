@@ -1,4 +1,5 @@
 import itertools
+import tempfile
 import numpy as np
 import pandas as pd
 import igraph as ig
@@ -10,6 +11,9 @@ from NoiseEffect.CommunityDetection.detection_algorithms import (
     infomapAlgorithmPartioning, labelPropagationPartitioning
 )
 from NoiseEffect.CommunityDetection.utils import convertPartitionToLabels
+from NoiseEffect.CommunityDetection.mutual_information import adjustedMutualInformation
+from NoiseEffect.CommunityDetection.repeat_edges import RepeatEdgeArrays
+from NoiseEffect.utils.sequential_sampling import sampleUntilConfident
 
 def run_algorithm(ig_graph, algo, seeds):
     if algo == "leiden": return leidenAlgorithmPartioning(ig_graph, seeds, n_iterations=2)
@@ -25,9 +29,16 @@ def safe_ari(labels_a, labels_b):
     try: return float(adjusted_rand_score(labels_a, labels_b))
     except: return np.nan
 
-def calculate_aris(label_matrix, baseline_labels=None):
+def safe_ami(labels_a, labels_b):
+    u_a, u_b = np.unique(labels_a), np.unique(labels_b)
+    if len(u_a) == 1 or len(u_b) == 1: return np.nan
+    if len(u_a) == len(labels_a) or len(u_b) == len(labels_b): return np.nan
+    try: return adjustedMutualInformation(labels_a, labels_b)
+    except: return np.nan
+
+def _calculate_scores(label_matrix, baseline_labels, score_fn):
     # Internal pairwise
-    internal_scores = [safe_ari(label_matrix[i], label_matrix[j]) 
+    internal_scores = [score_fn(label_matrix[i], label_matrix[j]) 
                        for i, j in itertools.combinations(range(len(label_matrix)), 2)]
     arr_int = np.array(internal_scores, dtype=float)
     valid_int = arr_int[~np.isnan(arr_int)]
@@ -37,7 +48,7 @@ def calculate_aris(label_matrix, baseline_labels=None):
     # Cross pairwise
     vs_base_mean, vs_base_std = np.nan, np.nan
     if baseline_labels is not None:
-        cross_scores = [safe_ari(label_matrix[i], baseline_labels[j]) 
+        cross_scores = [score_fn(label_matrix[i], baseline_labels[j]) 
                         for i in range(len(label_matrix)) for j in range(len(baseline_labels))]
         arr_cross = np.array(cross_scores, dtype=float)
         valid_cross = arr_cross[~np.isnan(arr_cross)]
@@ -46,13 +57,67 @@ def calculate_aris(label_matrix, baseline_labels=None):
         
     return within_mean, within_std, vs_base_mean, vs_base_std
 
-def _process_one_network(repeat_id, df_edges, n_nodes, algo, seeds, baseline_labels):
-    """Internal worker function for a single graph instance."""
-    g = ig.Graph.DataFrame(df_edges, directed=False)
-    partitions = run_algorithm(g, algo, seeds)
+def calculate_aris(label_matrix, baseline_labels=None):
+    return _calculate_scores(label_matrix, baseline_labels, safe_ari)
+
+def calculate_amis(label_matrix, baseline_labels=None):
+    return _calculate_scores(label_matrix, baseline_labels, safe_ami)
+
+def _run_adaptive(ig_graph, algo, seeds, n_nodes, baseline_labels, adaptive):
+    """
+    Runs seeds in batches until the mean ARI per seed (against the baseline
+    runs, or against the first seed without a baseline) is stable.
+    """
+    partitions, labels = {}, {}
+
+    def _evaluate_batch(batch):
+        partitions.update(run_algorithm(ig_graph, algo, batch))
+        scores = []
+        for s in batch:
+            labels[s] = convertPartitionToLabels(partitions[s], n_nodes)
+            if baseline_labels is not None:
+                pair_scores = np.array([safe_ari(labels[s], b) for b in baseline_labels], dtype=float)
+                valid = pair_scores[~np.isnan(pair_scores)]
+                scores.append(float(np.mean(valid)) if len(valid) > 0 else np.nan)
+            elif s != seeds[0]:
+                scores.append(safe_ari(labels[s], labels[seeds[0]]))
+            else:
+                scores.append(np.nan)
+        return scores
+
+    sampling = sampleUntilConfident(
+        _evaluate_batch, seeds,
+        tolerance=adaptive["tolerance"],
+        batch_size=adaptive.get("batch_size", 5),
+        min_samples=adaptive.get("min_seeds", 10),
+        max_samples=adaptive.get("max_seeds"),
+        confidence=adaptive.get("confidence", 0.95),
+    )
+    return partitions, sampling
+
+def _process_one_network(repeat_id, edges, n_nodes, algo, seeds, baseline_labels, start=None, stop=None, adaptive=None):
+    """Internal worker function for a single graph instance.
+
+    `edges` is either the edge array of this repeat or, together with
+    `start`/`stop`, the shared (memory-mapped) edge array of all repeats.
+    With `adaptive` (dict with 'tolerance' and optionally 'batch_size',
+    'min_seeds', 'max_seeds', 'confidence') only as many of `seeds` are run as
+    needed for a stable mean ARI.
+    """
+    if start is not None:
+        edges = edges[start:stop]
+    g = ig.Graph(n=n_nodes, edges=edges, directed=False)
+    if adaptive is None:
+        partitions = run_algorithm(g, algo, seeds)
+        converged = np.nan
+    else:
+        partitions, sampling = _run_adaptive(g, algo, seeds, n_nodes, baseline_labels, adaptive)
+        seeds = sampling["used"]
+        converged = sampling["converged"]
     label_matrix = np.stack([convertPartitionToLabels(partitions[s], n_nodes) for s in seeds])
     
     w_mean, w_std, vb_mean, vb_std = calculate_aris(label_matrix, baseline_labels)
+    w_ami_mean, w_ami_std, vb_ami_mean, vb_ami_std = calculate_amis(label_matrix, baseline_labels)
     
     return {
         "repeat_id": repeat_id,
@@ -60,19 +125,51 @@ def _process_one_network(repeat_id, df_edges, n_nodes, algo, seeds, baseline_lab
         "within_ari_std": w_std,
         "vs_baseline_ari_mean": vb_mean,
         "vs_baseline_ari_std": vb_std,
+        "within_ami_mean": w_ami_mean,
+        "within_ami_std": w_ami_std,
+        "vs_baseline_ami_mean": vb_ami_mean,
+        "vs_baseline_ami_std": vb_ami_std,
         "mean_n_communities": float(np.mean([len(partitions[s]) for s in seeds])),
         "std_n_communities": float(np.std([len(partitions[s]) for s in seeds])),
+        "n_seeds_used": len(seeds),
+        "seeds_used": list(seeds),
+        "converged": converged,
     }
 
-def evaluate_network_repeats(df_pert, n_nodes, algo, seeds, baseline_labels, n_jobs=1):
+def evaluate_network_repeats(df_pert, n_nodes, algo, seeds, baseline_labels, n_jobs=1, adaptive=None):
     """
-    Takes a mapped Parquet dataframe containing multiple repeats, 
-    processes them in parallel, and returns a list of dictionaries.
+    Takes a mapped Parquet dataframe (or `RepeatEdgeArrays`) containing
+    multiple repeats, processes them in parallel, and returns a list of
+    dictionaries.
+
+    `adaptive` enables early stopping over `seeds` per repeat, e.g.
+    {"tolerance": 0.01, "batch_size": 5, "min_seeds": 10}; the seeds that
+    were actually run are recorded in every result.
+
+    The edges of all repeats live in one contiguous int32 array. For parallel
+    runs it is memory-mapped once, and every task only receives its offsets.
     """
-    results = Parallel(n_jobs=n_jobs, backend="loky")(
-        delayed(_process_one_network)(
-            repeat_id, group[['source', 'target']], n_nodes, algo, seeds, baseline_labels
+    if isinstance(df_pert, RepeatEdgeArrays):
+        repeat_edges = df_pert
+    else:
+        repeat_edges = RepeatEdgeArrays.fromDataFrame(df_pert, n_nodes=n_nodes)
+
+    if n_jobs == 1:
+        return [
+            _process_one_network(
+                repeat_id, repeat_edges.edges, n_nodes, algo, seeds, baseline_labels, start, stop, adaptive
+            )
+            for repeat_id, start, stop in repeat_edges.slices()
+        ]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # A memmap is sent to the workers by file name, not by value
+        if not isinstance(repeat_edges.edges, np.memmap):
+            repeat_edges = repeat_edges.toMemmap(tmp_dir)
+        results = Parallel(n_jobs=n_jobs, backend="loky")(
+            delayed(_process_one_network)(
+                repeat_id, repeat_edges.edges, n_nodes, algo, seeds, baseline_labels, start, stop, adaptive
+            )
+            for repeat_id, start, stop in repeat_edges.slices()
         )
-        for repeat_id, group in df_pert.groupby("repeat")
-    )
-    return results
\ No newline at end of file
+    return results
@@ -1,13 +1,19 @@
 import argparse
 import itertools
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 import igraph as ig
 import numpy as np
 import pandas as pd
 from joblib import Parallel, delayed
+from tqdm import tqdm
 from sklearn.metrics import adjusted_rand_score
 from NoiseEffect.CommunityDetection.utils import convertPartitionToLabels, getMetrics
+from NoiseEffect.CommunityDetection.mutual_information import adjustedMutualInformation
+from NoiseEffect.CommunityDetection.repeat_edges import RepeatEdgeArrays
 from NoiseEffect.CommunityDetection.detection_algorithms import (
     leidenAlgorithmPartioning,
     infomapAlgorithmPartioning,
@@ -16,9 +22,20 @@ from NoiseEffect.CommunityDetection.detection_algorithms import (
 )
 
 
-NOISE_TYPES = ["noise_type_a", "noise_type_b", "noise_type_c"]  # replace with yours
+# Noise types written by NoiseNetworks.generateNoiseNetworksFromBaseline
+NOISE_TYPES = [
+    "added_edges",
+    "removed_edges",
+    "targeted_hub_addition",
+    "targeted_hub_removal",
+    "targeted_periphery_addition",
+    "targeted_periphery_removal",
+]
+ALGORITHMS = ["leiden", "louvain", "infomap", "label_propagation"]
 N_NOISE_LEVELS = 20
 SEEDS = list(range(5))  # 5 seeds → 10 within-pairs; tune to your time budget
+# Baseline edge lists are whitespace separated (nx.read_edgelist in NoiseNetworks._loadBaseline)
+BASELINE_SEP = r"\s+"
 
 # --------------------------------------------------------------------------- #
 # Community detection dispatcher                                               #
@@ -54,13 +71,27 @@ def safe_ari(labels_a: np.ndarray, labels_b: np.ndarray) -> float:
         return np.nan
 
 
-def pairwise_ari_stats(label_matrix: np.ndarray) -> tuple[float, float]:
+def safe_ami(labels_a: np.ndarray, labels_b: np.ndarray) -> float:
+    """AMI with the same guards for degenerate partitions as `safe_ari`."""
+    u_a, u_b = np.unique(labels_a), np.unique(labels_b)
+    if len(u_a) == 1 or len(u_b) == 1:
+        return np.nan
+    if len(u_a) == len(labels_a) or len(u_b) == len(labels_b):
+        return np.nan
+    try:
+        return adjustedMutualInformation(labels_a, labels_b)
+    except Exception:
+        return np.nan
+
+
+def pairwise_ari_stats(label_matrix: np.ndarray, score_fn=safe_ari) -> tuple[float, float]:
     """
     Given shape (k, n_nodes), compute mean/std ARI over all k(k-1)/2 pairs.
+    Pass `score_fn=safe_ami` for the same statistics on AMI.
     Returns (mean, std) — NaNs ignored.
     """
     scores = [
-        safe_ari(label_matrix[i], label_matrix[j])
+        score_fn(label_matrix[i], label_matrix[j])
         for i, j in itertools.combinations(range(len(label_matrix)), 2)
     ]
     arr = np.array(scores, dtype=float)
@@ -73,12 +104,13 @@ def pairwise_ari_stats(label_matrix: np.ndarray) -> tuple[float, float]:
 def cross_ari_stats(
     label_matrix: np.ndarray,      # (k_perturbed, n_nodes) — current run
     baseline_labels: np.ndarray,   # (k_baseline, n_nodes) — precomputed
+    score_fn=safe_ari,
 ) -> tuple[float, float]:
     """
-    Mean/std ARI across all k_perturbed × k_baseline pairs.
+    Mean/std ARI (or `score_fn`) across all k_perturbed × k_baseline pairs.
     """
     scores = [
-        safe_ari(label_matrix[i], baseline_labels[j])
+        score_fn(label_matrix[i], baseline_labels[j])
         for i in range(len(label_matrix))
         for j in range(len(baseline_labels))
     ]
@@ -95,7 +127,7 @@ def cross_ari_stats(
 
 def process_one_network(
     repeat_id: int,
-    edges: list[tuple[int, int]],
+    edges: np.ndarray,             # (n_edges, 2), or any sequence of pairs
     n_nodes: int,
     algo: str,
     seeds: list[int],
@@ -115,6 +147,10 @@ def process_one_network(
 
     within_mean, within_std = pairwise_ari_stats(label_matrix)
     vs_base_mean, vs_base_std = cross_ari_stats(label_matrix, baseline_labels)
+    within_ami_mean, within_ami_std = pairwise_ari_stats(label_matrix, score_fn=safe_ami)
+    vs_base_ami_mean, vs_base_ami_std = cross_ari_stats(
+        label_matrix, baseline_labels, score_fn=safe_ami
+    )
 
     mean_n_communities = float(np.mean([len(partitions[s]) for s in seeds]))
 
@@ -128,6 +164,10 @@ def process_one_network(
         "within_ari_std":     within_std,
         "vs_baseline_ari_mean": vs_base_mean,
         "vs_baseline_ari_std":  vs_base_std,
+        "within_ami_mean":    within_ami_mean,
+        "within_ami_std":     within_ami_std,
+        "vs_baseline_ami_mean": vs_base_ami_mean,
+        "vs_baseline_ami_std":  vs_base_ami_std,
         "mean_n_communities": mean_n_communities,
     }
 
@@ -136,17 +176,300 @@ def process_one_network(
 # Main                                                                         #
 # --------------------------------------------------------------------------- #
 
-def load_parquet_as_graphs(parquet_path: Path) -> list[tuple[int, list, int]]:
+def load_parquet_as_graphs(parquet_path: Path) -> list[tuple[int, np.ndarray, int]]:
     """
-    Returns list of (repeat_id, edge_list, n_nodes).
+    Returns list of (repeat_id, edge_array, n_nodes).
+
+    The parquet is read once into a contiguous int32 array; every edge_array
+    is a view of shape (n_edges, 2) into it, ready for `ig.Graph(n, edges=...)`.
+    n_nodes is shared by all repeats (largest node ID + 1 over the file), so
+    the label arrays of all repeats line up with each other and the baseline.
     Adjust column names to match your parquet schema.
     """
-    df = pd.read_parquet(parquet_path)
-    networks = []
-    for repeat_id, group in df.groupby("repeat"):
-        edges = list(zip(group["source"], group["target"]))
-        n_nodes = int(group[["source", "target"]].max().max()) + 1
-        networks.append((int(repeat_id), edges, n_nodes))
-    return networks
+    repeat_edges = RepeatEdgeArrays.fromParquet(parquet_path)
+    return [
+        (int(repeat_id), repeat_edges.edgesOf(index), repeat_edges.n_nodes)
+        for index, repeat_id in enumerate(repeat_edges.repeat_ids)
+    ]
+
+
+# --------------------------------------------------------------------------- #
+# Directory-wide driver                                                        #
+# --------------------------------------------------------------------------- #
+#
+#   python -m NoiseEffect.CommunityDetection.compare_perturbed_with_baseline_by_claude_idk_if_good \
+#       --network ppi data/baseline_networks/ppi.csv data/perturbed_networks/ppi \
+#       --output outputs/community_detection --n-workers 16
+#
+# Results are written as a hive-partitioned parquet dataset,
+#   {output}/network=../algorithm=../noise_type=../noise_level=../repeat_{r}.parquet
+# one file per (file x repeat x algorithm) task. Existing files are skipped,
+# so an interrupted run can simply be restarted.
+
+_PERTURBED_FILE_PATTERN = re.compile(
+    r"^(?P<network>.+)_(?P<noise_type>" + "|".join(NOISE_TYPES) + r")_noise_(?P<level>[0-9p]+)\.parquet$"
+)
+
+
+def discover_perturbed_files(perturbed_root: Path) -> list[dict]:
+    """
+    Finds all `{network}_{noise_type}_noise_{level}.parquet` files below a folder.
+    """
+    files = []
+    for path in sorted(Path(perturbed_root).rglob("*.parquet")):
+        match = _PERTURBED_FILE_PATTERN.match(path.name)
+        if match is None:
+            print(f"Skipping file with unknown naming scheme: {path}")
+            continue
+        files.append({
+            "path": path,
+            "noise_type": match["noise_type"],
+            "noise_level": float(match["level"].replace("p", ".")),
+        })
+    return files
+
+
+def read_baseline_edges(baseline_path: Path, sep: str = BASELINE_SEP) -> pd.DataFrame:
+    """
+    Source and target labels of a baseline edge list. Like nx.read_edgelist,
+    '#' starts a comment and columns after the first two (edge data) are ignored.
+    """
+    return pd.read_csv(
+        baseline_path, sep=sep, header=None, usecols=[0, 1], names=["source", "target"], comment="#", dtype=str
+    )
+
+
+def load_baseline_index(baseline_path: Path, sep: str = BASELINE_SEP) -> dict[str, int]:
+    """
+    Node label -> integer index of a baseline edge list. Labels are sorted so
+    the mapping matches NoiseNetworks._loadBaseline.
+    """
+    df_base = read_baseline_edges(baseline_path, sep)
+    labels = sorted(set(df_base["source"]) | set(df_base["target"]))
+    return {label: i for i, label in enumerate(labels)}
+
+
+def _baseline_labels_worker(baseline_path, sep, algo, seeds, cache_file) -> str:
+    """Computes and stores the (k, n_nodes) baseline label matrix of one algorithm."""
+    node_to_idx = load_baseline_index(baseline_path, sep)
+    df_base = read_baseline_edges(baseline_path, sep)
+    edges = np.column_stack([
+        df_base["source"].map(node_to_idx).to_numpy(),
+        df_base["target"].map(node_to_idx).to_numpy(),
+    ])
+    n_nodes = len(node_to_idx)
+    g = ig.Graph(n=n_nodes, edges=edges, directed=False)
+
+    partitions = run_algorithm(g, algo, seeds)
+    label_matrix = np.stack([convertPartitionToLabels(partitions[s], n_nodes) for s in seeds])
+    _atomic_save_npy(cache_file, label_matrix)
+    return str(cache_file)
+
+
+def _edge_cache_worker(parquet_path, node_to_idx, cache_prefix) -> list[int]:
+    """
+    Maps a perturbed parquet onto baseline indices and stores it as a
+    memory-mappable int32 edge array plus repeat offsets.
+    """
+    df = pd.read_parquet(parquet_path, columns=["source", "target", "repeat"])
+    df["source"] = df["source"].astype(str).map(node_to_idx)
+    df["target"] = df["target"].astype(str).map(node_to_idx)
+    df = df.dropna(subset=["source", "target"])
+    repeat_edges = RepeatEdgeArrays.fromDataFrame(df, n_nodes=len(node_to_idx))
+
+    np.savez(
+        f"{cache_prefix}_offsets.tmp.npz",
+        offsets=repeat_edges.offsets,
+        repeat_ids=repeat_edges.repeat_ids,
+    )
+    _atomic_save_npy(f"{cache_prefix}_edges.npy", repeat_edges.edges)
+    os.replace(f"{cache_prefix}_offsets.tmp.npz", f"{cache_prefix}_offsets.npz")
+    return [int(r) for r in repeat_edges.repeat_ids]
+
+
+def _evaluation_worker(task: dict) -> str:
+    """Runs one (file x repeat x algorithm) task and writes its result row."""
+    edges = np.load(task["edges_file"], mmap_mode="r")
+    offsets = np.load(task["offsets_file"])
+    repeat_index = int(np.flatnonzero(offsets["repeat_ids"] == task["repeat_id"])[0])
+    start, stop = offsets["offsets"][repeat_index], offsets["offsets"][repeat_index + 1]
+    baseline_labels = np.load(task["baseline_file"])
+
+    row = process_one_network(
+        repeat_id=task["repeat_id"],
+        edges=np.asarray(edges[start:stop]),
+        n_nodes=baseline_labels.shape[1],
+        algo=task["algorithm"],
+        seeds=task["seeds"],
+        baseline_labels=baseline_labels,
+        graph_id=task["network"],
+        noise_type=task["noise_type"],
+        noise_level=task["noise_level"],
+    )
+    # Partition columns are encoded in the path
+    for key in ("graph_id", "algorithm", "noise_type", "noise_level"):
+        row.pop(key)
+    row["source_file"] = task["source_file"]
+
+    out_file = Path(task["out_file"])
+    out_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = out_file.with_suffix(".tmp")
+    pd.DataFrame([row]).to_parquet(tmp_file, index=False)
+    os.replace(tmp_file, out_file)
+    return str(out_file)
+
+
+def run_directory_evaluation(
+    networks: list[tuple[str, Path, Path]],
+    output_dir: Path,
+    algorithms: list[str] = ALGORITHMS,
+    seeds: list[int] = SEEDS,
+    cache_dir: Path = None,
+    n_workers: int = None,
+    sep: str = BASELINE_SEP,
+) -> int:
+    """
+    Evaluates every perturbed network below the given folders against its baseline.
+
+    Args:
+        networks: (name, baseline edge list, folder with perturbed parquets) triples.
+        output_dir: Root of the partitioned parquet result dataset.
+        algorithms: Community detection algorithms to run.
+        seeds: Seeds used for the baseline and every perturbed network.
+        cache_dir: Folder for baseline label matrices and edge arrays.
+            Defaults to `{output_dir}/_cache`.
+        n_workers: Number of worker processes. Defaults to all cores.
+        sep: Separator of the baseline edge lists. Defaults to whitespace,
+            as in NoiseNetworks._loadBaseline.
+
+    Returns:
+        int: Number of tasks computed in this run (skipped tasks excluded).
+    """
+    output_dir = Path(output_dir)
+    cache_dir = Path(cache_dir) if cache_dir is not None else output_dir / "_cache"
+    seed_tag = f"seeds{len(seeds)}_{seeds[0]}" if seeds else "seeds0"
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        # 1. Baseline label matrices and edge arrays (cached across runs)
+        preparation = {}
+        baseline_files, edge_files, file_infos = {}, {}, {}
+        for name, baseline_path, perturbed_root in networks:
+            node_to_idx = load_baseline_index(baseline_path, sep)
+            for algo in algorithms:
+                cache_file = cache_dir / "baselines" / f"{name}_{algo}_{seed_tag}.npy"
+                baseline_files[(name, algo)] = cache_file
+                if not cache_file.exists():
+                    cache_file.parent.mkdir(parents=True, exist_ok=True)
+                    future = executor.submit(
+                        _baseline_labels_worker, baseline_path, sep, algo, seeds, cache_file
+                    )
+                    preparation[future] = f"baseline {name}/{algo}"
+
+            for info in discover_perturbed_files(perturbed_root):
+                cache_prefix = cache_dir / "edges" / name / info["path"].stem
+                key = (name, info["path"])
+                edge_files[key] = cache_prefix
+                file_infos[key] = info
+                if not Path(f"{cache_prefix}_offsets.npz").exists():
+                    cache_prefix.parent.mkdir(parents=True, exist_ok=True)
+                    future = executor.submit(
+                        _edge_cache_worker, info["path"], node_to_idx, cache_prefix
+                    )
+                    preparation[future] = f"edges {info['path']}"
+
+        for future in tqdm(as_completed(preparation), total=len(preparation), desc="Preparing"):
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Error preparing {preparation[future]}: {e}")
+
+        # 2. (file x repeat x algorithm) tasks, skipping finished ones
+        tasks = []
+        for (name, path), cache_prefix in edge_files.items():
+            offsets_file = Path(f"{cache_prefix}_offsets.npz")
+            if not offsets_file.exists():
+                continue
+            info = file_infos[(name, path)]
+            repeat_ids = np.load(offsets_file)["repeat_ids"]
+            for algo in algorithms:
+                if not baseline_files[(name, algo)].exists():
+                    continue
+                partition_dir = (
+                    output_dir
+                    / f"network={name}"
+                    / f"algorithm={algo}"
+                    / f"noise_type={info['noise_type']}"
+                    / f"noise_level={info['noise_level']}"
+                )
+                for repeat_id in repeat_ids:
+                    out_file = partition_dir / f"repeat_{int(repeat_id)}.parquet"
+                    if out_file.exists():
+                        continue
+                    tasks.append({
+                        "network": name,
+                        "algorithm": algo,
+                        "noise_type": info["noise_type"],
+                        "noise_level": info["noise_level"],
+                        "repeat_id": int(repeat_id),
+                        "seeds": list(seeds),
+                        "source_file": str(path),
+                        "edges_file": f"{cache_prefix}_edges.npy",
+                        "offsets_file": str(offsets_file),
+                        "baseline_file": str(baseline_files[(name, algo)]),
+                        "out_file": str(out_file),
+                    })
+
+        futures = {executor.submit(_evaluation_worker, task): task for task in tasks}
+        n_done = 0
+        for future in tqdm(as_completed(futures), total=len(futures), desc="Evaluating"):
+            try:
+                future.result()
+                n_done += 1
+            except Exception as e:
+                task = futures[future]
+                print(f"Error processing {task['source_file']} repeat {task['repeat_id']} ({task['algorithm']}): {e}")
+    return n_done
+
+
+def _atomic_save_npy(path, array: np.ndarray):
+    """Writes an .npy file under a temporary name and moves it into place."""
+    path = Path(path)
+    tmp_path = path.with_name(path.stem + ".tmp.npy")
+    np.save(tmp_path, array)
+    os.replace(tmp_path, path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compare community detection on perturbed networks with their baselines."
+    )
+    parser.add_argument(
+        "--network", nargs=3, action="append", required=True,
+        metavar=("NAME", "BASELINE", "PERTURBED_DIR"),
+        help="Network name, baseline edge list and folder containing its perturbed parquets. Repeatable.",
+    )
+    parser.add_argument("--output", required=True, help="Root folder of the parquet result dataset.")
+    parser.add_argument("--algorithms", nargs="+", default=ALGORITHMS, choices=ALGORITHMS)
+    parser.add_argument("--n-seeds", type=int, default=len(SEEDS), help="Seeds 0..n-1 per network.")
+    parser.add_argument("--cache-dir", default=None, help="Defaults to {output}/_cache.")
+    parser.add_argument("--n-workers", type=int, default=None, help="Defaults to all cores.")
+    parser.add_argument(
+        "--sep", default=BASELINE_SEP, help="Separator of the baseline edge lists (default: whitespace)."
+    )
+    args = parser.parse_args(argv)
+
+    networks = [(name, Path(baseline), Path(folder)) for name, baseline, folder in args.network]
+    n_done = run_directory_evaluation(
+        networks,
+        output_dir=Path(args.output),
+        algorithms=args.algorithms,
+        seeds=list(range(args.n_seeds)),
+        cache_dir=args.cache_dir,
+        n_workers=args.n_workers,
+        sep=args.sep,
+    )
+    print(f"Finished {n_done} tasks.")
 
 
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+import igraph as ig
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+
+def consensusStability(ig_graph: ig.Graph, label_matrix: np.ndarray, threshold: float = 0.5):
+    """
+    Summarizes the stability of k partitions of the same graph through their
+    co-association on the edge set.
+
+    Instead of comparing all k(k-1)/2 pairs of runs, every edge (u, v) gets
+    the fraction of runs in which u and v ended up in the same community. This
+    costs O(k·m) and yields stability scores per edge and per node as well as
+    a consensus partition.
+
+    Args:
+        ig_graph (igraph.Graph): The graph the partitions were computed on.
+        label_matrix (np.ndarray): Array of shape (k, n_nodes) with the
+            community label of every node in every run.
+        threshold (float, optional): Edges co-clustered in more than this
+            fraction of the runs are kept for the consensus partition.
+            Defaults to 0.5.
+
+    Returns:
+        dict: A dictionary containing:
+            - 'edges' (np.ndarray): The (m, 2) edge array the scores refer to.
+            - 'edge_coassociation' (np.ndarray): Co-clustering frequency per edge.
+            - 'edge_stability' (np.ndarray): |2c - 1| per edge, 1 if all runs
+              agree on whether the edge lies within a community, 0 if the runs
+              are split evenly.
+            - 'node_stability' (np.ndarray): Mean edge stability over the
+              incident edges of every node (NaN for isolated nodes).
+            - 'consensus_partition' (list[set]): The consensus communities.
+    """
+    num_nodes = ig_graph.vcount()
+    edges = _edgeArray(ig_graph)
+
+    coassociation = coAssociationOnEdges(label_matrix, edges)
+    edge_stability = edgeStability(coassociation)
+    node_stability = nodeStability(edge_stability, edges, num_nodes)
+    partition = consensusPartition(coassociation, edges, num_nodes, threshold=threshold)
+
+    return {
+        "edges": edges,
+        "edge_coassociation": coassociation,
+        "edge_stability": edge_stability,
+        "node_stability": node_stability,
+        "consensus_partition": partition,
+    }
+
+
+def coAssociationOnEdges(label_matrix: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """
+    Fraction of runs in which both endpoints of every edge share a community.
+
+    Args:
+        label_matrix (np.ndarray): Array of shape (k, n_nodes) with community labels.
+        edges (np.ndarray): Array of shape (m, 2) with node indices.
+
+    Returns:
+        np.ndarray: Co-association value in [0, 1] for every edge.
+    """
+    label_matrix = np.atleast_2d(label_matrix)
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    counts = np.zeros(edges.shape[0], dtype=np.int64)
+    # One run at a time keeps the memory at O(m) regardless of k
+    for labels in label_matrix:
+        counts += labels[edges[:, 0]] == labels[edges[:, 1]]
+    return counts / label_matrix.shape[0]
+
+
+def coAssociationMatrix(label_matrix: np.ndarray) -> sparse.csr_matrix:
+    """
+    Sparse node-node co-association matrix over all pairs that share a
+    community in at least one run.
+
+    The cost scales with the summed squared community sizes, so this is only
+    advisable for partitions without very large communities. For the edge set
+    alone use `coAssociationOnEdges`.
+
+    Args:
+        label_matrix (np.ndarray): Array of shape (k, n_nodes) with community labels.
+
+    Returns:
+        scipy.sparse.csr_matrix: Matrix C with C[u, v] the fraction of runs in
+        which u and v were co-clustered (the diagonal is 1).
+    """
+    label_matrix = np.atleast_2d(label_matrix)
+    num_runs, num_nodes = label_matrix.shape
+    node_ids = np.arange(num_nodes)
+
+    coassociation = sparse.csr_matrix((num_nodes, num_nodes), dtype=np.float64)
+    for labels in label_matrix:
+        _, community_ids = np.unique(labels, return_inverse=True)
+        membership = sparse.csr_matrix(
+            (np.ones(num_nodes), (node_ids, community_ids.ravel())),
+            shape=(num_nodes, community_ids.max() + 1),
+        )
+        coassociation = coassociation + membership @ membership.T
+    return (coassociation / num_runs).tocsr()
+
+
+def edgeStability(coassociation: np.ndarray) -> np.ndarray:
+    """
+    Agreement of the runs on every edge, |2c - 1| for co-association c.
+    """
+    return np.abs(2 * np.asarray(coassociation, dtype=np.float64) - 1)
+
+
+def nodeStability(edge_stability: np.ndarray, edges: np.ndarray, num_nodes: int) -> np.ndarray:
+    """
+    Mean stability over the incident edges of every node.
+
+    Args:
+        edge_stability (np.ndarray): Stability score per edge.
+        edges (np.ndarray): Array of shape (m, 2) with node indices.
+        num_nodes (int): Number of nodes in the graph.
+
+    Returns:
+        np.ndarray: Stability per node, NaN for nodes without edges.
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    endpoints = edges.ravel()
+    scores = np.repeat(edge_stability, 2)
+    totals = np.bincount(endpoints, weights=scores, minlength=num_nodes)
+    degrees = np.bincount(endpoints, minlength=num_nodes)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(degrees > 0, totals / degrees, np.nan)
+
+
+def consensusPartition(
+    coassociation: np.ndarray, edges: np.ndarray, num_nodes: int, threshold: float = 0.5
+) -> list[set]:
+    """
+    Consensus communities as the connected components of the edges that are
+    co-clustered in more than `threshold` of the runs.
+
+    Returns:
+        list[set]: The consensus partition, in the same format as the
+        detection algorithms return (isolated nodes form singletons).
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    kept = edges[np.asarray(coassociation) > threshold]
+    adjacency = sparse.csr_matrix(
+        (np.ones(kept.shape[0]), (kept[:, 0], kept[:, 1])), shape=(num_nodes, num_nodes)
+    )
+    _, component_labels = connected_components(adjacency, directed=False)
+
+    order = np.argsort(component_labels, kind="stable")
+    boundaries = np.flatnonzero(np.diff(component_labels[order])) + 1
+    return [set(group.tolist()) for group in np.split(order, boundaries)]
+
+
+####### Helper functions ##########
+
+
+def _edgeArray(ig_graph: ig.Graph) -> np.ndarray:
+    """Edge list of the graph as an (m, 2) array, without self-loops."""
+    edges = np.array(ig_graph.get_edgelist(), dtype=np.int64).reshape(-1, 2)
+    return edges[edges[:, 0] != edges[:, 1]]
@@ -3,28 +3,122 @@ from infomap import Infomap
 import igraph as ig
 import random
 import numpy as np
+from joblib import Parallel, delayed
 
 
-def leidenAlgorithmPartioning(ig_graph, list_of_seeds, n_iterations):
+def leidenAlgorithmPartioning(
+    ig_graph,
+    list_of_seeds,
+    n_iterations,
+    backend="leidenalg",
+    objective_function="modularity",
+    resolution=1.0,
+):
     """
     Finds communities using the Leiden algorithm on an igraph object.
 
     Args:
         ig_graph (igraph.Graph): The graph to analyze.
+        list_of_seeds (list[int]): Random seeds, one run per seed.
+        n_iterations (int): Number of Leiden iterations per run.
+        backend (str, optional): 'leidenalg' or 'igraph' (igraph's native C
+            implementation, considerably faster on large graphs).
+            Defaults to 'leidenalg'.
+        objective_function (str, optional): 'modularity' or 'CPM'.
+            Defaults to 'modularity'.
+        resolution (float, optional): Resolution parameter. Defaults to 1.0.
 
     Returns:
-        list[set[int]]: A list of sets, where each set contains the integer
-                        vertex IDs of a community.
+        dict[int, list[set[int]]]: Per seed a list of sets, where each set
+                        contains the integer vertex IDs of a community.
     """
-    partitions = {}
-    for seed in list_of_seeds:
-        partition_ig = la.find_partition(
-            ig_graph, la.ModularityVertexPartition, seed=seed, n_iterations=n_iterations
-        )
-        partitions[seed] = [set(community) for community in partition_ig]
+    return leidenResolutionSweep(
+        ig_graph,
+        list_of_seeds,
+        [resolution],
+        n_iterations=n_iterations,
+        objective_function=objective_function,
+        backend=backend,
+    )[resolution]
+
+
+def leidenResolutionSweep(
+    ig_graph,
+    list_of_seeds,
+    resolutions,
+    n_iterations=2,
+    objective_function="CPM",
+    backend="igraph",
+):
+    """
+    Runs the Leiden algorithm for a whole grid of resolution parameters per seed.
+
+    The graph preprocessing (node weights and normalization) is computed once
+    and shared by all runs.
+
+    Args:
+        ig_graph (igraph.Graph): The graph to analyze.
+        list_of_seeds (list[int]): Random seeds, one run per seed and resolution.
+        resolutions (list[float]): The resolution grid.
+        n_iterations (int, optional): Number of Leiden iterations per run. Defaults to 2.
+        objective_function (str, optional): 'CPM' or 'modularity'. Defaults to 'CPM'.
+        backend (str, optional): 'igraph' or 'leidenalg'. Defaults to 'igraph'.
+
+    Returns:
+        dict[float, dict[int, list[set[int]]]]: Partitions per resolution and seed.
+    """
+    if objective_function not in ("modularity", "CPM"):
+        raise ValueError(f"Unknown objective function: {objective_function}")
 
-    # Return the full partition, converted to a list of sets of integer IDs.
-    return partitions
+    sweep = {resolution: {} for resolution in resolutions}
+
+    if backend == "igraph":
+        node_weights, resolution_scale = _igraphLeidenPreprocessing(
+            ig_graph, objective_function
+        )
+        for seed in list_of_seeds:
+            for resolution in resolutions:
+                # igraph draws from Python's random module
+                random.seed(seed)
+                clustering = ig_graph.community_leiden(
+                    objective_function="CPM",
+                    node_weights=node_weights,
+                    resolution=resolution * resolution_scale,
+                    n_iterations=n_iterations,
+                )
+                sweep[resolution][seed] = _membershipToPartition(
+                    np.asarray(clustering.membership)
+                )
+
+    elif backend == "leidenalg":
+        for seed in list_of_seeds:
+            for resolution in resolutions:
+                if objective_function == "modularity" and resolution == 1.0:
+                    partition_ig = la.find_partition(
+                        ig_graph,
+                        la.ModularityVertexPartition,
+                        seed=seed,
+                        n_iterations=n_iterations,
+                    )
+                else:
+                    partition_type = (
+                        la.CPMVertexPartition
+                        if objective_function == "CPM"
+                        else la.RBConfigurationVertexPartition
+                    )
+                    partition_ig = la.find_partition(
+                        ig_graph,
+                        partition_type,
+                        seed=seed,
+                        n_iterations=n_iterations,
+                        resolution_parameter=resolution,
+                    )
+                sweep[resolution][seed] = [set(community) for community in partition_ig]
+
+    else:
+        raise ValueError(f"Unknown Leiden backend: {backend}")
+
+    return sweep
 
 
 def infomapAlgorithmPartioning(ig_graph, list_of_seeds, n_iterations):
@@ -65,85 +159,88 @@ def infomapAlgorithmPartioning(ig_graph, list_of_seeds, n_iterations):
     return all_partitions
 
 
-def louvainPartioning(ig_graph, list_of_seeds):
+def louvainPartioning(ig_graph, list_of_seeds, n_jobs=1):
     """
     Finds communities using the Louvain algorithm (Multilevel).
-    Uses vertex attributes to track original IDs through the permutation.
-    """
-    all_partitions = {}
-
-    # 1. Attach original IDs to the graph so they survive the shuffle
-    # We use a temporary attribute '_orig_id'
-    if "_orig_id" not in ig_graph.vertex_attributes():
-        ig_graph.vs["_orig_id"] = range(ig_graph.vcount())
-
-    for seed in list_of_seeds:
-        random.seed(seed)
-
-        # 2. Create random permutation
-        perm = list(range(ig_graph.vcount()))
-        random.shuffle(perm)
 
-        # 3. Permute the graph
-        # This reorders vertices AND their attributes (including _orig_id)
-        g_permuted = ig_graph.permute_vertices(perm)
-
-        # 4. Run Louvain on the shuffled graph
-        vertex_partition = g_permuted.community_multilevel(weights=None)
-
-        # 5. Extract communities using the attached '_orig_id'
-        communities = []
-        for subgraph in vertex_partition:
-            # subgraph contains indices for g_permuted (e.g., 0, 1, 2...)
-            # We look up what '_orig_id' these nodes hold
-            original_nodes = {
-                g_permuted.vs[node_idx]["_orig_id"] for node_idx in subgraph
-            }
-            communities.append(original_nodes)
-
-        all_partitions[seed] = communities
-
-    # Cleanup: Remove the temporary attribute from the original graph
-    if "_orig_id" in ig_graph.vertex_attributes():
-        del ig_graph.vs["_orig_id"]
-
-    return all_partitions
+    The vertices are shuffled per seed to make the run stochastic; the
+    communities are mapped back to the original IDs with the inverse
+    permutation. The input graph is never modified, so seeds can be run
+    concurrently with `n_jobs` worker processes.
+    """
+    return _runPermutedSeeds(ig_graph, list_of_seeds, "louvain", n_jobs)
 
 
-def labelPropagationPartitioning(ig_graph, list_of_seeds):
+def labelPropagationPartitioning(ig_graph, list_of_seeds, n_jobs=1):
     """
     Label Propagation: Fast but unstable.
     Great for proving your stability metric works (should have low ARI on noise).
+    Seeds can be run concurrently with `n_jobs` worker processes.
     """
-    all_partitions = {}
+    return _runPermutedSeeds(ig_graph, list_of_seeds, "label_propagation", n_jobs)
 
-    # 1. Attach original IDs
-    if "_orig_id" not in ig_graph.vertex_attributes():
-        ig_graph.vs["_orig_id"] = range(ig_graph.vcount())
 
-    for seed in list_of_seeds:
-        random.seed(seed)
+####### Helper functions ##########
 
-        # 2. Shuffle to trigger stochastic behavior
-        perm = list(range(ig_graph.vcount()))
-        random.shuffle(perm)
-        g_permuted = ig_graph.permute_vertices(perm)
 
-        # 3. Run Label Propagation
+def _runPermutedSeeds(ig_graph, list_of_seeds, algorithm, n_jobs):
+    """
+    Runs one permuted-graph partitioning per seed, optionally in parallel.
+
+    igraph draws its random numbers from Python's global `random` module, so
+    concurrent seeds use separate processes rather than threads.
+    """
+    if n_jobs == 1:
+        return {
+            seed: _permutedPartition(ig_graph, seed, algorithm)
+            for seed in list_of_seeds
+        }
+
+    results = Parallel(n_jobs=n_jobs, backend="loky")(
+        delayed(_permutedPartition)(ig_graph, seed, algorithm)
+        for seed in list_of_seeds
+    )
+    return dict(zip(list_of_seeds, results))
+
+
+def _permutedPartition(ig_graph, seed, algorithm):
+    """Partitions a randomly permuted copy of the graph for a single seed."""
+    random.seed(seed)
+
+    # 1. Create random permutation: vertex j of the permuted graph is the
+    #    original vertex perm[j]
+    perm = list(range(ig_graph.vcount()))
+    random.shuffle(perm)
+    g_permuted = ig_graph.permute_vertices(perm)
+
+    # 2. Run the algorithm on the shuffled graph
+    if algorithm == "louvain":
+        vertex_partition = g_permuted.community_multilevel(weights=None)
+    else:
         vertex_partition = g_permuted.community_label_propagation()
 
-        # 4. Map back
-        communities = []
-        for subgraph in vertex_partition:
-            original_nodes = {
-                g_permuted.vs[node_idx]["_orig_id"] for node_idx in subgraph
-            }
-            communities.append(original_nodes)
+    # 3. Map the membership back to the original vertex IDs
+    inv_perm = np.argsort(perm)
+    membership = np.asarray(vertex_partition.membership)[inv_perm]
+    return _membershipToPartition(membership)
 
-        all_partitions[seed] = communities
 
-    # Cleanup
-    if "_orig_id" in ig_graph.vertex_attributes():
-        del ig_graph.vs["_orig_id"]
+def _igraphLeidenPreprocessing(ig_graph, objective_function):
+    """
+    Node weights and resolution scaling for igraph's CPM-based Leiden.
 
-    return all_partitions
+    Modularity with resolution g equals CPM with the degrees as node weights
+    and resolution g / 2m, so both objectives share one code path and the
+    degrees are only computed once per graph.
+    """
+    if objective_function == "CPM":
+        return None, 1.0
+    num_edges = ig_graph.ecount()
+    return ig_graph.degree(), (1.0 / (2 * num_edges) if num_edges else 1.0)
+
+
+def _membershipToPartition(membership):
+    """Converts a membership array into a list of sets, ordered by community ID."""
+    order = np.argsort(membership, kind="stable")
+    boundaries = np.flatnonzero(np.diff(membership[order])) + 1
+    return [set(nodes.tolist()) for nodes in np.split(order, boundaries)]
@@ -0,0 +1,108 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class RepeatEdgeArrays:
+    """
+    Edge lists of all repeats of one perturbed network in a single contiguous
+    int32 array.
+
+    The edges of repeat i are `edges[offsets[i]:offsets[i + 1]]`. Workers only
+    need the (shared or memory-mapped) array plus two offsets, instead of a
+    pickled DataFrame slice or a list of Python tuples per repeat.
+    """
+
+    edges: np.ndarray  # (total number of edges, 2), int32
+    offsets: np.ndarray  # (number of repeats + 1,), int64
+    repeat_ids: np.ndarray  # (number of repeats,)
+    n_nodes: int
+
+    @classmethod
+    def fromDataFrame(
+        cls,
+        df: pd.DataFrame,
+        n_nodes: int = None,
+        source: str = "source",
+        target: str = "target",
+        repeat: str = "repeat",
+    ) -> "RepeatEdgeArrays":
+        """
+        Builds the arrays from a DataFrame with integer node IDs and a repeat column.
+
+        Args:
+            df (pd.DataFrame): Edges of all repeats.
+            n_nodes (int, optional): Number of nodes shared by all repeats.
+                Defaults to the largest node ID + 1 over all repeats.
+            source, target, repeat (str, optional): Column names.
+
+        Returns:
+            RepeatEdgeArrays: The contiguous representation.
+        """
+        repeats = df[repeat].to_numpy()
+        edges = np.empty((len(df), 2), dtype=np.int32)
+        edges[:, 0] = df[source].to_numpy()
+        edges[:, 1] = df[target].to_numpy()
+
+        # Repeats are usually written one after another; only sort if not
+        if repeats.size and np.any(repeats[1:] < repeats[:-1]):
+            order = np.argsort(repeats, kind="stable")
+            repeats = repeats[order]
+            edges = edges[order]
+
+        boundaries = np.flatnonzero(repeats[1:] != repeats[:-1]) + 1
+        offsets = np.concatenate(([0], boundaries, [repeats.size])).astype(np.int64)
+        repeat_ids = repeats[offsets[:-1]] if repeats.size else repeats[:0]
+
+        if n_nodes is None:
+            n_nodes = int(edges.max()) + 1 if edges.size else 0
+
+        return cls(edges=edges, offsets=offsets, repeat_ids=repeat_ids, n_nodes=int(n_nodes))
+
+    @classmethod
+    def fromParquet(
+        cls,
+        path,
+        n_nodes: int = None,
+        source: str = "source",
+        target: str = "target",
+        repeat: str = "repeat",
+    ) -> "RepeatEdgeArrays":
+        """
+        Reads only the edge and repeat columns of a parquet file.
+        """
+        df = pd.read_parquet(path, columns=[source, target, repeat])
+        return cls.fromDataFrame(
+            df, n_nodes=n_nodes, source=source, target=target, repeat=repeat
+        )
+
+    def __len__(self) -> int:
+        return self.repeat_ids.size
+
+    def edgesOf(self, index: int) -> np.ndarray:
+        """View (no copy) on the edges of the repeat at position `index`."""
+        return self.edges[self.offsets[index] : self.offsets[index + 1]]
+
+    def slices(self):
+        """Yields (repeat_id, start, stop) for every repeat."""
+        for index, repeat_id in enumerate(self.repeat_ids):
+            yield repeat_id, int(self.offsets[index]), int(self.offsets[index + 1])
+
+    def toMemmap(self, folder) -> "RepeatEdgeArrays":
+        """
+        Stores the edge array in `folder` and returns a copy backed by a
+        read-only memory map, so all worker processes share the same pages.
+        """
+        folder = Path(folder)
+        folder.mkdir(parents=True, exist_ok=True)
+        edge_file = folder / "edges.npy"
+        np.save(edge_file, self.edges)
+        return RepeatEdgeArrays(
+            edges=np.load(edge_file, mmap_mode="r"),
+            offsets=self.offsets,
+            repeat_ids=self.repeat_ids,
+            n_nodes=self.n_nodes,
+        )
@@ -3,6 +3,7 @@ import scipy.special
 import numpy as np
 import networkx as nx
 from collections import defaultdict
+from functools import lru_cache
 from ..module_result import ModuleResult
 import logging
 
@@ -22,34 +23,49 @@ logger = logging.getLogger(__name__)
 # ================================================================================
 
 
+# Rows of tail probabilities kept per process, one row per (k, N, s)
+_PVALUE_ROW_CACHE_SIZE = 2**16
+
+
+@lru_cache(maxsize=8)
 def compute_all_gamma_ln(N):
     """
-    precomputes all logarithmic gammas
+    precomputes all logarithmic gammas, gamma_ln[i] = log((i - 1)!) for i <= N
     """
-    gamma_ln = {}
-    for i in range(1, N + 1):
-        gamma_ln[i] = scipy.special.gammaln(i)
-    return gamma_ln
+    return scipy.special.gammaln(np.arange(N + 1, dtype=np.float64))
 
 
 def logchoose(n, k, gamma_ln):
-    if n - k + 1 <= 0:
-        return -np.inf  # Fixed: returns negative infinity for log prob
-    lgn1 = gamma_ln[n + 1]
-    lgk1 = gamma_ln[k + 1]
-    lgnk1 = gamma_ln[n - k + 1]
-    return lgn1 - (lgnk1 + lgk1)  # Fixed: bracket syntax error in original
-
-
-def gauss_hypergeom(x, r, b, n, gamma_ln):
-    return np.exp(
-        logchoose(r, x, gamma_ln)
-        + logchoose(b, n - x, gamma_ln)
-        - logchoose(r + b, n, gamma_ln)
+    """log(n choose k), -inf where k > n; vectorized over k."""
+    k = np.asarray(k)
+    valid = n - k + 1 > 0
+    k_valid = k[valid]
+    result = np.full(k.shape, -np.inf)
+    result[valid] = gamma_ln[n + 1] - (gamma_ln[n - k_valid + 1] + gamma_ln[k_valid + 1])
+    return result
+
+
+@lru_cache(maxsize=_PVALUE_ROW_CACHE_SIZE)
+def _pvalue_row(k, N, s):
+    """
+    p-values for all kb at once: entry kb is the probability to draw at
+    least kb seeds with k draws among N nodes containing s seeds.
+    """
+    gamma_ln = compute_all_gamma_ln(N + 1)
+    n = np.arange(min(k, s) + 1)
+    log_pmf = (
+        logchoose(s, n, gamma_ln)
+        + logchoose(N - s, k - n, gamma_ln)
+        - logchoose(N, np.array([k]), gamma_ln)
     )
+    # Tails summed from the smallest terms on
+    tails = np.cumsum(np.exp(log_pmf)[::-1])[::-1]
+    tails = np.minimum(tails, 1.0)  # Ensure p <= 1
+    tails.flags.writeable = False
+    return tails
 
 
-def pvalue(kb, k, N, s, gamma_ln):
+def pvalue(kb, k, N, s):
     r"""
     -------------------------------------------------------------------
     Computes the p-value for a node that has kb out of k links to
@@ -57,14 +73,12 @@ def pvalue(kb, k, N, s, gamma_ln):
 
     p-val = \sum_{n=kb}^{k} HypergemetricPDF(n,k,N,s)
     -------------------------------------------------------------------
+    The tail probabilities of all kb for a given (k, N, s) are computed as
+    one cumulative array and cached per process, so they are shared by all
+    DIAMOnD runs on networks of the same size.
     """
-    p = 0.0
-    for n in range(kb, k + 1):
-        if n > s:
-            break
-        prob = gauss_hypergeom(n, s, N - s, k, gamma_ln)
-        p += prob
-    return min(p, 1.0)  # Ensure p <= 1
+    row = _pvalue_row(k, N, s)
+    return float(row[kb]) if kb < row.size else 0.0
 
 
 def get_neighbors_and_degrees(G):
@@ -171,11 +185,6 @@ def diamond(G, S, X=200, alpha=1):
     s0 += (alpha - 1) * s0
     N += (alpha - 1) * s0
 
-    # ------------------------------------------------------------------
-    # precompute the logarithmic gamma functions
-    # ------------------------------------------------------------------
-    gamma_ln = compute_all_gamma_ln(N + 1)
-
     # ------------------------------------------------------------------
     # Setting initial set of nodes not in cluster
     # ------------------------------------------------------------------
@@ -189,8 +198,6 @@ def diamond(G, S, X=200, alpha=1):
     #
     # ------------------------------------------------------------------
 
-    all_p = {}
-
     logger.info(f"Starting DIAMOnD with {len(S)} seeds, aiming to add {X} nodes...")
 
     while len(added_nodes_data) < X:
@@ -212,18 +219,10 @@ def diamond(G, S, X=200, alpha=1):
         )
 
         for node, kbk in reduced_not_in_cluster.items():
-            # Getting the p-value of this kb,k
-            # combination and save it in all_p, so computing it only once!
+            # Getting the p-value of this kb,k combination
+            # (cached per process, so computing it only once!)
             kb, k = kbk
-
-            # Memoization of p-values
-            if (
-                (k, kb, s0) in all_p
-            ):  # Modified: Checking if already calcualted, instead of try except logic
-                p = all_p[(k, kb, s0)]
-            else:
-                p = pvalue(kb, k, N, s0, gamma_ln)
-                all_p[(k, kb, s0)] = p
+            p = pvalue(kb, k, N, s0)
 
             # recording the node with smallest p-value
             if p < pmin:
@@ -253,3 +252,180 @@ def diamond(G, S, X=200, alpha=1):
         algorithm_type="diamond",
         metadata={"algorithm": "DIAMOnD", "alpha": alpha, "n_requested": X},
     )
+
+
+# ======================================================================================
+#  Incremental Algorithm
+# ======================================================================================
+def diamond_incremental(G, S, X=200, alpha=1):
+    """
+    Same result as diamond(), without recounting the links of every
+    candidate in every iteration.
+
+    Every candidate keeps a counter kb of its links into the module; when a
+    node is added, only its neighbors are updated. Candidates are kept in
+    buckets by their (weighted) (kb, k) combination. As in the reference, the
+    p-value only depends on this combination (and the module size), so every
+    iteration only evaluates the few combinations that survive
+    reduce_not_in_cluster_nodes and then picks a node from the winning
+    bucket.
+
+    Ties are broken exactly as in diamond(): the candidate set is updated
+    with the same set operations, so it iterates in the same order, and the
+    last node of the winning bucket in that order is chosen. If several
+    combinations have exactly the same p-value, the reference selection is
+    run on the counters.
+
+    Parameters and return value as in diamond().
+    """
+    all_genes = set(G.nodes())
+    S_orig = len(S)
+    S = set(S) & all_genes
+    if len(S) < S_orig:
+        print(
+            f"DIAMOnD found {S_orig - len(S)} seed genes that are not in the network and will be ignored."
+        )
+
+    if len(S) == 0:
+        print("DIAMOnD Warning: No seed genes found in network.")
+        return []
+
+    N = G.number_of_nodes()
+    added_nodes_data = []
+    neighbors, all_degrees = get_neighbors_and_degrees(G)
+
+    # The same set operations as in diamond(), see the docstring
+    cluster_nodes = set(S)
+    not_in_cluster = set()
+    s0 = len(cluster_nodes)
+    s0 += (alpha - 1) * s0
+    N += (alpha - 1) * s0
+    for node in cluster_nodes:
+        not_in_cluster |= neighbors[node]
+    not_in_cluster -= cluster_nodes
+
+    # Links into the module and buckets of candidates per (kb, k)
+    links = defaultdict(int)
+    for node in cluster_nodes:
+        for neighbor in neighbors[node]:
+            if neighbor not in cluster_nodes:
+                links[neighbor] += 1
+    buckets = defaultdict(set)
+    for node in not_in_cluster:
+        buckets[_weighted_kb_k(links[node], all_degrees[node], alpha)].add(node)
+
+    logger.info(
+        f"Starting incremental DIAMOnD with {len(S)} seeds, aiming to add {X} nodes..."
+    )
+
+    while len(added_nodes_data) < X:
+        if not not_in_cluster:
+            break
+
+        # Smallest p-value among the combinations reduce_not_in_cluster_nodes keeps
+        best = []
+        pmin = 10
+        for kb, k in _reduced_combinations(buckets):
+            p = pvalue(kb, k, N, s0)
+            if p < pmin:
+                pmin = p
+                best = [(kb, k)]
+            elif p == pmin:
+                best.append((kb, k))
+
+        if not best:
+            break
+        if len(best) == 1:
+            # diamond() keeps the last node of a combination in iteration order
+            bucket = buckets[best[0]]
+            if len(bucket) == 1:
+                next_node = next(iter(bucket))
+            else:
+                next_node = next(
+                    node for node in reversed(list(not_in_cluster)) if node in bucket
+                )
+        else:
+            next_node, pmin = _reference_choice(
+                not_in_cluster, links, all_degrees, alpha, N, s0
+            )
+            if next_node is None:
+                break
+
+        added_nodes_data.append((next_node, pmin))
+
+        # Moving the node into the module, only its neighbors change
+        buckets[_weighted_kb_k(links[next_node], all_degrees[next_node], alpha)].discard(
+            next_node
+        )
+        cluster_nodes.add(next_node)
+        s0 = len(cluster_nodes)
+        new_candidates = neighbors[next_node] - cluster_nodes
+        not_in_cluster |= new_candidates
+        not_in_cluster.remove(next_node)
+        for neighbor in new_candidates:
+            if links[neighbor] > 0:
+                buckets[
+                    _weighted_kb_k(links[neighbor], all_degrees[neighbor], alpha)
+                ].discard(neighbor)
+            links[neighbor] += 1
+            buckets[
+                _weighted_kb_k(links[neighbor], all_degrees[neighbor], alpha)
+            ].add(neighbor)
+        _drop_empty_buckets(buckets)
+
+    return ModuleResult(
+        nodes_diamond=added_nodes_data,
+        algorithm_type="diamond",
+        metadata={"algorithm": "DIAMOnD", "alpha": alpha, "n_requested": X},
+    )
+
+
+def _weighted_kb_k(kb, k, alpha):
+    """(kb, k) with the seed weight applied, as in reduce_not_in_cluster_nodes."""
+    k += (alpha - 1) * kb
+    kb += (alpha - 1) * kb
+    return kb, k
+
+
+def _reduced_combinations(buckets):
+    """
+    The (kb, k) combinations that reduce_not_in_cluster_nodes keeps: the
+    smallest k per kb, and of those the largest kb per k.
+    """
+    min_k = {}
+    for kb, k in buckets:
+        if kb not in min_k or k < min_k[kb]:
+            min_k[kb] = k
+    max_kb = {}
+    for kb, k in min_k.items():
+        if k not in max_kb or kb > max_kb[k]:
+            max_kb[k] = kb
+    return [(kb, k) for k, kb in max_kb.items()]
+
+
+def _drop_empty_buckets(buckets):
+    for combination in [c for c, nodes in buckets.items() if not nodes]:
+        del buckets[combination]
+
+
+def _reference_choice(not_in_cluster, links, all_degrees, alpha, N, s0):
+    """The selection of diamond() for one iteration, on the link counters."""
+    kb2k = defaultdict(dict)
+    for node in not_in_cluster:
+        kb, k = _weighted_kb_k(links[node], all_degrees[node], alpha)
+        kb2k[kb][k] = node
+
+    k2kb = defaultdict(dict)
+    for kb, k2node in kb2k.items():
+        min_k = min(k2node.keys())
+        k2kb[min_k][kb] = k2node[min_k]
+
+    pmin = 10
+    next_node = None
+    for k, kb2node in k2kb.items():
+        kb = max(kb2node.keys())
+        p = pvalue(kb, k, N, s0)
+        if p < pmin:
+            pmin = p
+            next_node = kb2node[kb]
+    return next_node, pmin
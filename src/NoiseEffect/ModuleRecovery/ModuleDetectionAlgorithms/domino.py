@@ -3,16 +3,80 @@ import sys
 import subprocess
 import tempfile
 import shutil
+import hashlib
 import networkx as nx
 import logging
 from ..module_result import ModuleResult
 
 
+class DominoSliceCache:
+    """
+    SIF and slices files of the networks DOMINO runs on.
+
+    The slices only depend on the network, so all seed groups run on the
+    same network share one call to the slicer. Networks are identified by a
+    hash of their edges, so a reloaded copy of a network also hits the
+    cache. `clear()` deletes the files once a network is finished.
+    """
+
+    def __init__(self, workspace_dir: str = None):
+        # workspace_dir: where the files are written, defaults to the temp directory
+        self.workspace_dir = workspace_dir
+        self._workspaces = {}  # graph hash -> (temp dir, SIF path, slices path)
+
+    def files(self, G: nx.Graph, slicer_exe: str) -> tuple[str, str]:
+        """
+        Returns the (SIF path, slices path) of G, slicing it on first use.
+        """
+        key = _graphContentHash(G)
+        if key not in self._workspaces:
+            temp_dir = tempfile.mkdtemp(
+                prefix="domino_slices_", dir=self.workspace_dir
+            )
+            sif_path = os.path.join(temp_dir, "network.sif")
+            slices_path = os.path.join(temp_dir, "network.slices")
+            try:
+                _writeSIF(G, sif_path)
+                cmd_slicer = [
+                    slicer_exe,
+                    "--network_file",
+                    sif_path,
+                    "--output_file",
+                    slices_path,
+                ]
+                # We capture output to avoid spamming the console
+                subprocess.run(cmd_slicer, check=True, capture_output=True)
+            except BaseException:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                raise
+            self._workspaces[key] = (temp_dir, sif_path, slices_path)
+        _, sif_path, slices_path = self._workspaces[key]
+        return sif_path, slices_path
+
+    def clear(self):
+        """Deletes the files of all cached networks."""
+        for temp_dir, _, _ in self._workspaces.values():
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        self._workspaces.clear()
+
+    def __len__(self):
+        return len(self._workspaces)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.clear()
+
+
 def domino(
     G: nx.Graph,
     seeds: list,
     keep_files=False,
     DOMINO_PYTHON: str = "/opt/miniconda3/envs/domino-env/bin/python",  # on my machine
+    slice_cache: DominoSliceCache = None,
+    workspace_dir: str = None,
+    timeout: float = None,
 ):
     """
     Runs DOMINO on a NetworkX graph and a list of seed nodes.
@@ -21,56 +85,83 @@ def domino(
         G: The NetworkX graph (node IDs can be strings or ints).
         seeds: List of seed node IDs.
         keep_files: If True, won't delete temp folder (for debugging).
+        slice_cache: Cache of the sliced networks, shared by the runs of all
+            seed groups on G. Without it, G is sliced for this run only.
+        workspace_dir: Directory for the temporary files (e.g. /dev/shm).
+            Defaults to the system temp directory.
+        timeout: Seconds after which the DOMINO run is stopped.
 
     Returns:
         set: A set of gene IDs (strings) found in the module.
     """
+    own_slice_cache = slice_cache is None
+    if own_slice_cache:
+        slice_cache = DominoSliceCache(workspace_dir=workspace_dir)
 
-    # --- CONFIGURATION ---
-    # 1. Path to the Python executable inside your domino-env
+    try:
+        # --- STEP 1: SLICER ---
+        # Network as SIF and its slices, only computed once per network
+        sif_path, slices_path = slice_cache.files(G, slicerPath(DOMINO_PYTHON))
+
+        # --- STEP 2: DOMINO ---
+        return dominoOnSlices(
+            sif_path=sif_path,
+            slices_path=slices_path,
+            seeds=seeds,
+            keep_files=keep_files,
+            DOMINO_PYTHON=DOMINO_PYTHON,
+            workspace_dir=workspace_dir,
+            timeout=timeout,
+        )
+
+    finally:
+        if own_slice_cache and not keep_files:
+            slice_cache.clear()
+
+
+def dominoOnSlices(
+    sif_path: str,
+    slices_path: str,
+    seeds: list,
+    keep_files=False,
+    DOMINO_PYTHON: str = "/opt/miniconda3/envs/domino-env/bin/python",
+    workspace_dir: str = None,
+    timeout: float = None,
+) -> ModuleResult:
+    """
+    Runs DOMINO for one seed group on an already sliced network.
+
+    Every call works in its own temporary folder, so several calls on the
+    same network files can run at the same time.
+
+    Args:
+        sif_path: The network as SIF with 'g' prefix, see DominoSliceCache.
+        slices_path: The slices of the network.
+        seeds, keep_files, DOMINO_PYTHON, workspace_dir, timeout: As in domino().
 
-    # 2. Path to the scripts (slicer and your patched serial runner)
-    #    Ideally, put 'domino_serial.py' in the same folder as this wrapper.
+    Returns:
+        ModuleResult: The modules, with the run status ('ok', 'no_module',
+        'failed' or 'timeout') and, for every status but 'ok', the end of
+        the run's stdout and stderr in the metadata.
+    """
+    # --- CONFIGURATION ---
+    # Path to the patched serial runner, in the same folder as this wrapper.
     CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
     DOMINO_SCRIPT = os.path.join(CURRENT_DIR, "domino_serial.py")
-    # Slicer is usually in the bin folder of the domino-env python
-    SLICER_EXE = os.path.join(os.path.dirname(DOMINO_PYTHON), "slicer")
 
     # 1. Setup Temporary Workspace
-    temp_dir = tempfile.mkdtemp(prefix="domino_run_")
+    temp_dir = tempfile.mkdtemp(prefix="domino_run_", dir=workspace_dir)
 
     try:
         # --- PREPARATION ---
-        # Convert Graph to SIF with 'g' prefix (Safety for DOMINO)
-        sif_path = os.path.join(temp_dir, "network.sif")
         seed_path = os.path.join(temp_dir, "active_genes.txt")
-        slices_path = os.path.join(temp_dir, "network.slices")
         output_dir = os.path.join(temp_dir, "output")
 
-        # Write Network
-        with open(sif_path, "w") as f:
-            for u, v in G.edges():
-                # We use 'pp' as the interaction type
-                f.write(f"g{u}\tpp\tg{v}\n")
-
         # Write Seeds (must match 'g' prefix)
         with open(seed_path, "w") as f:
             for s in seeds:
                 f.write(f"g{s}\n")
 
-        # --- STEP 1: SLICER ---
-        cmd_slicer = [
-            SLICER_EXE,
-            "--network_file",
-            sif_path,
-            "--output_file",
-            slices_path,
-        ]
-
-        # We capture output to avoid spamming the console
-        subprocess.run(cmd_slicer, check=True, capture_output=True)
-
-        # --- STEP 2: DOMINO ---
         cmd_domino = [
             DOMINO_PYTHON,  # Use the specific environment python
             DOMINO_SCRIPT,  # Run the patched script
@@ -84,16 +175,29 @@ def domino(
             output_dir,
         ]
 
-        res = subprocess.run(cmd_domino, capture_output=True, text=True)
-
         # --- PARSING RESULTS ---
         modules = set()
+        stdout = stderr = None
+
+        try:
+            res = subprocess.run(
+                cmd_domino, capture_output=True, text=True, timeout=timeout
+            )
+        except subprocess.TimeoutExpired as error:
+            logging.error(f"DOMINO timed out after {timeout} s.")
+            status = "timeout"
+            stdout, stderr = error.stdout, error.stderr
+            res = None
+
+        if res is not None:
+            stdout, stderr = res.stdout, res.stderr
 
         # Check if successful (Exit code 0)
-        if res.returncode == 0:
+        if res is not None and res.returncode == 0:
             result_file = os.path.join(output_dir, "active_genes", "modules.out")
 
             if os.path.exists(result_file):
+                status = "ok"
                 modules = []
                 with open(result_file, "r") as f:
                     # DOMINO output is just gene names separated by newlines/spaces
@@ -108,33 +212,75 @@ def domino(
                             ]
                             modules.append(current_list)
             else:
+                status = "no_module"
                 logging.warning(
                     "DOMINO ran but produced no 'modules.out'. (Likely no significant module found)"
                 )
-        else:
+        elif res is not None:
             # Handle the "Empty List" crash gracefully (It just means no result)
             if "union_all to an empty list" in res.stderr:
+                status = "no_module"
                 logging.info(
                     "DOMINO found 0 significant modules (Standard statistical filter)."
                 )
             else:
+                status = "failed"
                 logging.error(
                     f"DOMINO Failed!\nSTDOUT: {res.stdout}\nSTDERR: {res.stderr}"
                 )
 
         module_sizes = [len(m) for m in modules] if modules else 0
 
-        return ModuleResult(
-            nodes_set=modules,
-            algorithm_type="set",
-            metadata={
-                "algorithm": "DOMINO",
-                "n_valid_seeds": len(seeds),
-                "module_sizes": module_sizes,
-            },
-        )
+        metadata = {
+            "algorithm": "DOMINO",
+            "n_valid_seeds": len(seeds),
+            "module_sizes": module_sizes,
+            "status": status,
+        }
+        if status != "ok":
+            # DOMINO reports on stdout why it found no module
+            metadata["stdout"] = _tail(stdout)
+            metadata["stderr"] = _tail(stderr)
+        return ModuleResult(nodes_set=modules, algorithm_type="set", metadata=metadata)
 
     finally:
         # --- CLEANUP ---
         if not keep_files and os.path.exists(temp_dir):
             shutil.rmtree(temp_dir)
+
+
+def slicerPath(DOMINO_PYTHON: str) -> str:
+    """The slicer executable, usually in the bin folder of the domino-env python."""
+    return os.path.join(os.path.dirname(DOMINO_PYTHON), "slicer")
+
+
+####### Helper functions ##########
+
+
+def _writeSIF(G, sif_path):
+    """Writes G as SIF with 'g' prefix (Safety for DOMINO)."""
+    with open(sif_path, "w") as f:
+        for u, v in G.edges():
+            # We use 'pp' as the interaction type
+            f.write(f"g{u}\tpp\tg{v}\n")
+
+
+def _graphContentHash(G):
+    """Hash of the edge set of G, independent of node and edge order."""
+    edges = sorted(
+        "\t".join(sorted((str(u), str(v)))) for u, v in G.edges()
+    )
+    digest = hashlib.sha256()
+    for edge in edges:
+        digest.update(edge.encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def _tail(output, length=2000):
+    """The last `length` characters of a subprocess output, for the metadata."""
+    if output is None:
+        return None
+    if isinstance(output, bytes):
+        output = output.decode(errors="replace")
+    return output[-length:]
@@ -0,0 +1,86 @@
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor
+import networkx as nx
+from ..module_result import ModuleResult
+from .domino import DominoSliceCache, dominoOnSlices, slicerPath
+
+# Create the logging channel for this file
+logger = logging.getLogger(__name__)
+
+# Memory-backed file system for the DOMINO workspaces, if available
+_SHARED_MEMORY_DIR = "/dev/shm"
+
+
+def dominoWorkspaceDir() -> str:
+    """
+    /dev/shm if it exists and is writable, otherwise None (the system temp
+    directory).
+    """
+    if os.path.isdir(_SHARED_MEMORY_DIR) and os.access(_SHARED_MEMORY_DIR, os.W_OK):
+        return _SHARED_MEMORY_DIR
+    return None
+
+
+def dominoBatch(
+    G: nx.Graph,
+    seed_groups: dict[str, list[str]],
+    DOMINO_PYTHON: str = "/opt/miniconda3/envs/domino-env/bin/python",
+    slice_cache: DominoSliceCache = None,
+    n_workers: int = None,
+    timeout: float = None,
+    workspace_dir: str = None,
+) -> dict[str, ModuleResult]:
+    """
+    Runs DOMINO for several seed groups on the same network at once.
+
+    The network is sliced once; then up to `n_workers` DOMINO subprocesses
+    run at the same time, each in its own workspace. The work happens in
+    the subprocesses, so a thread per running subprocess is enough.
+
+    Args:
+        G: The NetworkX graph.
+        seed_groups: Seed group ID -> seed nodes. Groups must not be empty.
+        DOMINO_PYTHON: Python executable of the DOMINO environment.
+        slice_cache: Cache of the sliced networks. Without it, G is sliced
+            for this batch only.
+        n_workers: Maximum number of DOMINO runs at the same time. Defaults
+            to the number of CPUs.
+        timeout: Seconds after which a single DOMINO run is stopped.
+        workspace_dir: Directory for the temporary files. Defaults to
+            /dev/shm if available (see dominoWorkspaceDir).
+
+    Returns:
+        dict: Seed group ID -> ModuleResult, in the order of `seed_groups`.
+    """
+    if workspace_dir is None:
+        workspace_dir = dominoWorkspaceDir()
+    n_workers = n_workers or os.cpu_count() or 1
+    own_slice_cache = slice_cache is None
+    if own_slice_cache:
+        slice_cache = DominoSliceCache(workspace_dir=workspace_dir)
+
+    try:
+        sif_path, slices_path = slice_cache.files(G, slicerPath(DOMINO_PYTHON))
+        logger.info(
+            f"Running DOMINO for {len(seed_groups)} seed groups with {n_workers} workers"
+        )
+
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            futures = {
+                seed_id: pool.submit(
+                    dominoOnSlices,
+                    sif_path=sif_path,
+                    slices_path=slices_path,
+                    seeds=seed_nodes,
+                    DOMINO_PYTHON=DOMINO_PYTHON,
+                    workspace_dir=workspace_dir,
+                    timeout=timeout,
+                )
+                for seed_id, seed_nodes in seed_groups.items()
+            }
+            return {seed_id: future.result() for seed_id, future in futures.items()}
+
+    finally:
+        if own_slice_cache:
+            slice_cache.clear()
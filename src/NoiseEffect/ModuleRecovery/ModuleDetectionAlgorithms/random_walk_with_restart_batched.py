@@ -0,0 +1,157 @@
+import networkx as nx
+import numpy as np
+from ..module_result import ModuleResult
+from NoiseEffect.utils.random_walk_solvers import (
+    componentLabels,
+    initialVector,
+    localPushOnSeedComponents,
+    solveRWR,
+)
+
+_ALGORITHM_NAMES = {
+    "row": "RandomWalkWithRestartRowNormalization",
+    "symmetric": "RandomWalkWithRestartSymmetricNormalization",
+}
+
+
+def randomWalkWithRestartBatch(
+    G: nx.Graph,
+    seed_groups: dict[str, list[str]],
+    normalization: str = "row",
+    restart: float = 0.85,
+    tol: float = 1e-6,
+    max_iter: int = 1000,
+    p_init: dict[str, dict] = None,
+    local_push: bool = False,
+    solver: str = "auto",
+) -> dict[str, ModuleResult]:
+    """
+    Random walk with restart for several seed groups on the same graph.
+
+    The adjacency matrix is built once and all groups are solved
+    together as the columns of an (n x groups) matrix. With the power
+    iteration a column stops being updated as soon as it converged, so the
+    results are the same as calling randomWalkWithRestartRowNormalization /
+    ...SymmetricNormalization once per group; with the direct solver one
+    factorization is shared by all groups.
+
+    Parameters
+    ----------
+    G : networkx.Graph
+        The input undirected graph.
+    seed_groups : dict
+        Seed group ID -> seed nodes. Groups must not be empty.
+    normalization : str, optional
+        "row" (P = D^-1 A) or "symmetric" (S = D^-1/2 A D^-1/2).
+    restart, tol, max_iter : optional
+        As in the single-group functions.
+    p_init : dict, optional
+        Seed group ID -> previous scores (node -> score, seeds included, see
+        ModuleResult.scores) used as warm start.
+    local_push : bool, optional
+        Only propagate the residual of `p_init` on G, for the groups that
+        have one; the others are iterated from their seed vector.
+    solver : str, optional
+        "power", "cg", "direct" or "auto" (see selectRWRSolver).
+
+    Returns
+    -------
+    dict
+        Seed group ID -> ModuleResult, in the order of `seed_groups`.
+    """
+    if normalization not in _ALGORITHM_NAMES:
+        raise ValueError(f"Unknown normalization: {normalization}")
+    p_init = p_init or {}
+
+    # Get consistent node ordering
+    nodelist = list(G.nodes())
+    node_to_idx = {node: idx for idx, node in enumerate(nodelist)}
+    n = len(nodelist)
+    group_ids = list(seed_groups)
+
+    # Building the matrix and its components once for all groups
+    A = nx.to_scipy_sparse_array(G, nodelist=nodelist, format="csr", dtype=float)
+    labels = componentLabels(A)
+
+    # One restart column per seed group
+    P0 = np.zeros((n, len(group_ids)))
+    for column, group_id in enumerate(group_ids):
+        seed_indices = [node_to_idx[seed] for seed in seed_groups[group_id]]
+        P0[seed_indices, column] = 1.0 / len(seed_indices)
+
+    # Groups with a previous solution are corrected by local push, if requested
+    pushed = [c for c, g in enumerate(group_ids) if local_push and g in p_init]
+    iterated = [c for c in range(len(group_ids)) if c not in set(pushed)]
+
+    P = np.empty_like(P0)
+    converged = np.zeros(len(group_ids), dtype=bool)
+    iterations = np.zeros(len(group_ids), dtype=int)
+    residual = np.zeros(len(group_ids))
+    used_solver = np.full(len(group_ids), "local_push", dtype=object)
+    solved_nodes = np.full(len(group_ids), n)
+    for column in pushed:
+        solution = localPushOnSeedComponents(
+            A,
+            P0[:, column],
+            restart,
+            tol,
+            max_iter,
+            initialVector(p_init[group_ids[column]], nodelist),
+            normalization,
+            labels=labels,
+        )
+        P[:, column] = solution["p"]
+        converged[column] = solution["converged"]
+        iterations[column] = solution["iterations"]
+        residual[column] = solution["residual"]
+        solved_nodes[column] = solution["solved_nodes"]
+
+    if iterated:
+        P_init = P0[:, iterated].copy()
+        for position, column in enumerate(iterated):
+            if group_ids[column] in p_init:
+                P_init[:, position] = initialVector(p_init[group_ids[column]], nodelist)
+        solution = solveRWR(
+            A,
+            P0[:, iterated],
+            restart,
+            tol,
+            max_iter,
+            normalization=normalization,
+            solver=solver,
+            P_init=P_init,
+            labels=labels,
+        )
+        P[:, iterated] = solution["P"]
+        converged[iterated] = solution["converged"]
+        iterations[iterated] = solution["iterations"]
+        residual[iterated] = solution["residual"]
+        used_solver[iterated] = solution["solver"]
+        solved_nodes[iterated] = solution["solved_nodes"]
+
+    results = {}
+    for column, group_id in enumerate(group_ids):
+        seed_nodes = seed_groups[group_id]
+        # Create ranked dictionary without the seed nodes
+        nodes_to_scores = dict(zip(nodelist, P[:, column]))
+        for seed in seed_nodes:
+            nodes_to_scores.pop(seed, None)
+        nodes_to_scores_sorted = dict(
+            sorted(nodes_to_scores.items(), key=lambda item: item[1], reverse=True)
+        )
+        results[group_id] = ModuleResult(
+            nodes_ranked=nodes_to_scores_sorted,
+            algorithm_type="ranked",
+            scores=dict(zip(nodelist, P[:, column])),
+            metadata={
+                "algorithm": _ALGORITHM_NAMES[normalization],
+                "converged": bool(converged[column]),
+                "iterations": int(iterations[column]),
+                "solver": used_solver[column],
+                "residual": float(residual[column]),
+                "solved_nodes": int(solved_nodes[column]),
+                "restart_prob": restart,
+                "n_valid_seeds": len(seed_nodes),
+            },
+        )
+    return results
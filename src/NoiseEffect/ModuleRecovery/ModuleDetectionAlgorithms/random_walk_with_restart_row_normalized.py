@@ -1,7 +1,12 @@
 import networkx as nx
 import numpy as np
-from scipy.sparse import csr_matrix
+from scipy.sparse import diags
 from ..module_result import ModuleResult
+from NoiseEffect.utils.random_walk_solvers import (
+    initialVector,
+    powerIterationRWR,
+    localPushRWR,
+)
 
 
 def randomWalkWithRestartRowNormalized(
@@ -10,6 +15,8 @@ def randomWalkWithRestartRowNormalized(
     restart: float = 0.85,
     tol: float = 1e-6,
     max_iter: int = 1000,
+    p_init: dict = None,
+    local_push: bool = False,
 ) -> ModuleResult:
     """
     Perform a random walk with restart (RWR) on graph G starting from a set of seed nodes.
@@ -26,6 +33,12 @@ def randomWalkWithRestartRowNormalized(
         Convergence tolerance (default: 1e-6). The iteration stops when the L1 norm change is below this value.
     max_iter : int, optional
         Maximum number of iterations allowed (default: 100).
+    p_init : dict, optional
+        Previous scores for the same seed nodes (node -> score), seeds
+        included, e.g. the `scores` of the baseline network's result. The
+        iteration starts from them instead of p0.
+    local_push : bool, optional
+        Only propagate the residual of `p_init` on G (requires `p_init`).
 
     Returns
     -------
@@ -79,7 +92,7 @@ def randomWalkWithRestartRowNormalized(
     # Compute the transition probability matrix P
     # d[i] = sum of row i = degree of node i
     d = A @ np.ones(n)
-    D_inv = csr_matrix(np.diag(1 / d))
+    D_inv = diags(1 / d)
     P = D_inv @ A
 
     # Initialize starting probability vector
@@ -88,15 +101,21 @@ def randomWalkWithRestartRowNormalized(
     p0[seed_indices] = 1.0 / len(seed_indices)
 
     # Iterative RWR
-    p = p0.copy()
-    converged = False
-
-    for i in range(max_iter):
-        p_next = (1 - restart) * P.T @ p + restart * p0
-        if np.linalg.norm(p_next - p, ord=1) < tol:
-            converged = True
-            break
-        p = p_next
+    if local_push:
+        if p_init is None:
+            raise ValueError("local_push requires p_init.")
+        p, converged, iterations = localPushRWR(
+            P.T, p0, restart, tol, max_iter, initialVector(p_init, nodelist)
+        )
+    else:
+        p, converged, iterations = powerIterationRWR(
+            P.T,
+            p0,
+            restart,
+            tol,
+            max_iter,
+            p_init=None if p_init is None else initialVector(p_init, nodelist),
+        )
 
     """
     if not converged:
@@ -118,9 +137,10 @@ def randomWalkWithRestartRowNormalized(
     return ModuleResult(
         nodes_ranked=nodes_to_probs_sorted,
         algorithm_type="ranked",
+        scores=dict(zip(nodelist, p)),
         metadata={
             "converged": converged,
-            "iterations": i + 1,
+            "iterations": iterations,
             "restart_prob": restart,
             "n_valid_seeds": len(seed_indices),
         },
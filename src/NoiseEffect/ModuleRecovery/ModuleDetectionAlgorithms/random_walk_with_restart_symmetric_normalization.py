@@ -1,7 +1,11 @@
 import networkx as nx
 import numpy as np
-from scipy.sparse import csr_matrix
 from ..module_result import ModuleResult
+from NoiseEffect.utils.random_walk_solvers import (
+    initialVector,
+    localPushOnSeedComponents,
+    solveRWR,
+)
 
 
 def randomWalkWithRestartSymmetricNormalization(
@@ -10,6 +14,9 @@ def randomWalkWithRestartSymmetricNormalization(
     restart: float = 0.85,
     tol: float = 1e-6,
     max_iter: int = 1000,
+    p_init: dict = None,
+    local_push: bool = False,
+    solver: str = "auto",
 ) -> ModuleResult:
     """
     Perform a random walk with restart (RWR) on graph G starting from a set of seed nodes.
@@ -27,6 +34,15 @@ def randomWalkWithRestartSymmetricNormalization(
         Convergence tolerance (default: 1e-6). The iteration stops when the L1 norm change is below this value.
     max_iter : int, optional
         Maximum number of iterations allowed (default: 100).
+    p_init : dict, optional
+        Previous scores for the same seed nodes (node -> score), seeds
+        included, e.g. the `scores` of the baseline network's result. The
+        iteration starts from them instead of p0.
+    local_push : bool, optional
+        Only propagate the residual of `p_init` on G (requires `p_init`).
+    solver : str, optional
+        "power", "cg", "direct" or "auto" (default), see solveRWR. Ignored
+        with local_push.
 
     Returns
     -------
@@ -40,34 +56,41 @@ def randomWalkWithRestartSymmetricNormalization(
     # Building the matrix using the same order as nodelist
     A = nx.to_scipy_sparse_array(G, nodelist=nodelist, format="csr", dtype=float)
 
-    # Compute symmetric normalization: S = D^(-1/2) * A * D^(-1/2)
-    # Calculate degrees d
-    d = A @ np.ones(n)
-
-    # D^(-1/2)
-    d_inv_sqrt = 1.0 / np.sqrt(d)
-    D_inv_sqrt = csr_matrix(np.diag(d_inv_sqrt))
-
-    # S = D^(-1/2) * A * D^(-1/2)
-    S = D_inv_sqrt @ A @ D_inv_sqrt
-
     # Initialize starting probability vector
     p0 = np.zeros(n)
     seed_indices = [nodelist.index(seed) for seed in seed_nodes]
     p0[seed_indices] = 1.0 / len(seed_indices)
 
-    # Iterative RWR
-    # For symmetric normalization, S can be used directly (not S.T)
-    # because S is symmetric: S.T = S
-    p = p0.copy()
-    converged = False
-
-    for i in range(max_iter):
-        p_next = (1 - restart) * S @ p + restart * p0
-        if np.linalg.norm(p_next - p, ord=1) < tol:
-            converged = True
-            break
-        p = p_next
+    # Iterative RWR on S = D^(-1/2) * A * D^(-1/2)
+    if local_push:
+        if p_init is None:
+            raise ValueError("local_push requires p_init.")
+        solution = localPushOnSeedComponents(
+            A, p0, restart, tol, max_iter, initialVector(p_init, nodelist), "symmetric"
+        )
+        p = solution["p"]
+        converged = solution["converged"]
+        iterations = solution["iterations"]
+        residual = solution["residual"]
+        used_solver = "local_push"
+        solved_nodes = solution["solved_nodes"]
+    else:
+        solution = solveRWR(
+            A,
+            p0[:, None],
+            restart,
+            tol,
+            max_iter,
+            normalization="symmetric",
+            solver=solver,
+            P_init=None if p_init is None else initialVector(p_init, nodelist)[:, None],
+        )
+        p = solution["P"][:, 0]
+        converged = bool(solution["converged"][0])
+        iterations = int(solution["iterations"][0])
+        residual = float(solution["residual"][0])
+        used_solver = solution["solver"]
+        solved_nodes = int(solution["solved_nodes"][0])
 
     # Create ranked dicitonary
     # Remember, this is now no loger a visting probability but a steady-state score
@@ -85,10 +108,14 @@ def randomWalkWithRestartSymmetricNormalization(
     return ModuleResult(
         nodes_ranked=nodes_to_scores_sorted,
         algorithm_type="ranked",
+        scores=dict(zip(nodelist, p)),
         metadata={
             "algorithm": "RandomWalkWithRestartSymmetricNormalization",
             "converged": converged,
-            "iterations": i + 1,
+            "iterations": iterations,
+            "solver": used_solver,
+            "residual": residual,
+            "solved_nodes": solved_nodes,
             "restart_prob": restart,
             "n_valid_seeds": len(seed_nodes),
         },
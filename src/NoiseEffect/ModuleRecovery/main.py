@@ -5,11 +5,20 @@ import logging
 from tqdm import tqdm
 import json
 import gzip
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from .run_algorithm_and_compare import _runAlgorithmAndSaveResultsToFile
-from .utils import _setupOutputCSV, _networkMapFromDirectory
+from .run_algorithm_and_compare import (
+    _runAlgorithmAndSaveResultsToFile,
+    _runBatchedRWRAndSaveResults,
+    _runBatchedDominoAndSaveResults,
+    BATCHED_RWR_NORMALIZATIONS,
+)
+from .utils import _setupOutputCSV, _networkMapFromDirectory, _graphFromParquetRepeat
 from .seeds_preprocessing import filterForSeedsInNetwork
 from .start_algorithm import startAlgorithm
+from .ModuleDetectionAlgorithms.domino import DominoSliceCache
+from .ModuleDetectionAlgorithms.domino_runner import dominoBatch, dominoWorkspaceDir
 
 # Create the logging channel for this file
 logger = logging.getLogger(__name__)
@@ -28,7 +37,27 @@ def benchmarkModuleDetectionAlgorithms(
     output_file_location: str,
     experiment_identifier: str,
     domino_env_path: str = None,
+    rwr_warm_start: bool = True,
+    rwr_local_push: bool = False,
+    rwr_solver: str = "auto",
+    domino_workers: int = None,
+    domino_timeout: float = None,
+    n_workers: int = 1,
 ):
+    """
+    rwr_warm_start: start the RWR algorithms on every perturbed network from
+    the baseline scores of the same seed group instead of the seed vector.
+    rwr_local_push: instead, only propagate the residual of the baseline
+    scores on the perturbed network (implies rwr_warm_start).
+    rwr_solver: "power", "cg", "direct" or "auto" for the RWR algorithms.
+    domino_workers: number of DOMINO runs at the same time (default: CPUs;
+    on the perturbed networks with n_workers > 1, CPUs // n_workers, at
+    least 1, so that the worker processes together do not oversubscribe).
+    domino_timeout: seconds after which a single DOMINO run is stopped.
+    n_workers: number of worker processes for the perturbed networks. Every
+    worker runs all algorithms on one network at a time and writes its own
+    output shard; the shards are merged into the result files at the end.
+    """
     # 1.
     # Initialize output CSV
     # This is where all results will be stored
@@ -53,7 +82,12 @@ def benchmarkModuleDetectionAlgorithms(
         output_file_location=output_file_location,
         experiment_identifier=experiment_identifier,
         domino_env_path=domino_env_path,
+        rwr_solver=rwr_solver,
+        domino_workers=domino_workers,
+        domino_timeout=domino_timeout,
     )
+    if not (rwr_warm_start or rwr_local_push):
+        baseline_cache = {}
     print("--- Baseline processing complete. Loading perturbed networks. ---")
 
     # 3.
@@ -68,15 +102,36 @@ def benchmarkModuleDetectionAlgorithms(
     # Calculate the modules on all perturbed networks and compare each to the baseline
     # Results of comparisons are appended to the output CSV
     # Optionally raw outputs of the algorithms can be saved to disk
-    _computeModulesOnPerturbedNetworks(
+    network_settings = dict(
         perturbed_networks_directory=perturbed_networks_directory,
-        tasks=tasks,
         algorithms_config=algorithms_config,
         seed_groups=cleaned_seed_groups,
-        output_file_location=output_file_location,
         experiment_identifier=experiment_identifier,
         domino_env_path=domino_env_path,
+        baseline_cache=baseline_cache,
+        local_push=rwr_local_push,
+        rwr_solver=rwr_solver,
+        domino_workers=domino_workers,
+        domino_timeout=domino_timeout,
     )
+    if n_workers > 1:
+        # Every worker process starts its own DOMINO runs, so they share the CPUs
+        if domino_workers is None:
+            network_settings["domino_workers"] = max(
+                1, (os.cpu_count() or 1) // n_workers
+            )
+        _computeModulesOnPerturbedNetworksParallel(
+            tasks=tasks,
+            output_file_location=output_file_location,
+            n_workers=n_workers,
+            **network_settings,
+        )
+    else:
+        _computeModulesOnPerturbedNetworks(
+            tasks=tasks,
+            output_file_location=output_file_location,
+            **network_settings,
+        )
 
 
 #############################################
@@ -92,24 +147,47 @@ def _computeBaselineModules(
     output_file_location: str,
     experiment_identifier: str,
     domino_env_path: str = None,
+    rwr_solver: str = "auto",
+    domino_workers: int = None,
+    domino_timeout: float = None,
 ):
     logger.info("Starting algorithms on baseline network...")
     baseline_cache = {}
+    # The baseline is sliced once for the DOMINO runs of all seed groups
+    domino_slice_cache = DominoSliceCache(workspace_dir=dominoWorkspaceDir())
 
     for algo in tqdm([algo for algo, active in algorithms_config.items() if active]):
         algorithm_cache = []
+
+        # DOMINO: all seed groups are run in parallel subprocesses
+        domino_results = {}
+        if algo == "DOMINO":
+            domino_results = dominoBatch(
+                G=baseline_G,
+                seed_groups={k: v for k, v in seed_groups.items() if len(v) > 0},
+                DOMINO_PYTHON=domino_env_path,
+                slice_cache=domino_slice_cache,
+                n_workers=domino_workers,
+                timeout=domino_timeout,
+            )
+
         for seed_id, seed_nodes in seed_groups.items():
             logger.info(
                 f"Running {algo} on baseline network ({baseline_network_path}) with seed {seed_id}"
             )
 
             # Run algorithm on network
-            results = startAlgorithm(
-                algorithm=algo,
-                G=baseline_G,
-                seed_nodes=seed_nodes,
-                domino_env_path=domino_env_path,
-            )
+            if seed_id in domino_results:
+                results = domino_results[seed_id]
+            else:
+                results = startAlgorithm(
+                    algorithm=algo,
+                    G=baseline_G,
+                    seed_nodes=seed_nodes,
+                    domino_env_path=domino_env_path,
+                    rwr_solver=rwr_solver,
+                    domino_slice_cache=domino_slice_cache,
+                )
 
             # Get the returned modules
             if results.algorithm_type == "set":
@@ -137,6 +215,11 @@ def _computeBaselineModules(
 
             algorithm_cache.append(metrics_dict)
 
+            # Keep the full solution (seeds included) as warm start for the
+            # perturbed networks; the saved ranking leaves the seeds out
+            if results.scores is not None:
+                baseline_cache.setdefault(algo, {})[seed_id] = results.scores
+
         _saveBatchToDisk(
             results_batch=algorithm_cache,
             outputfile_location=output_file_location,
@@ -144,6 +227,7 @@ def _computeBaselineModules(
             experiment_identifier=experiment_identifier,
         )
 
+    domino_slice_cache.clear()
     logger.info("Algorithms on baseline network complete.")
     return baseline_cache
 
@@ -160,14 +244,26 @@ def _computeModulesOnPerturbedNetworks(
     output_file_location: str,
     experiment_identifier: str,
     domino_env_path: str = None,
+    baseline_cache: dict = None,
+    local_push: bool = False,
+    rwr_solver: str = "auto",
+    domino_workers: int = None,
+    domino_timeout: float = None,
+    show_progress: bool = True,
 ):
+    # baseline_cache: {algorithm: {seed_id: baseline scores}} used as warm start
+    baseline_cache = baseline_cache or {}
+    # Slices of the current network, shared by the DOMINO runs of all seed groups
+    domino_slice_cache = DominoSliceCache(workspace_dir=dominoWorkspaceDir())
     # Iterate through files (Outer Loop)
-    for filename, noise_type, noise_level, repeat, network_name in tqdm(tasks):
+    for filename, noise_type, noise_level, repeat, network_name in tqdm(
+        tasks, disable=not show_progress
+    ):
         logger.info(f"Loading perturbed network: {filename}")
 
         # 1. Load Perturbed Network
         perturbed_G = _loadPerturbedNetworkFromFile(
-            perturbed_networks_directory, filename
+            perturbed_networks_directory, filename, repeat
         )
         # If the file is missing, skip
         if perturbed_G is None:
@@ -188,6 +284,44 @@ def _computeModulesOnPerturbedNetworks(
 
         # 3. Run all algorithms on this specific graph
         for algo in [algo for algo, active in algorithms_config.items() if active]:
+            # RWR: all seed groups share one operator and one batched iteration
+            if algo in BATCHED_RWR_NORMALIZATIONS:
+                batch_results = _runBatchedRWRAndSaveResults(
+                    perturbed_G=perturbed_G,
+                    algorithm_name=algo,
+                    noise_type=noise_type,
+                    noise_level=noise_level,
+                    repeat=repeat,
+                    filename=filename,
+                    seed_groups=seed_groups_in_network,
+                    p_init=baseline_cache.get(algo),
+                    local_push=local_push,
+                    rwr_solver=rwr_solver,
+                )
+                _saveBatchToDisk(
+                    batch_results, output_file_location, algo, experiment_identifier
+                )
+                continue
+
+            # DOMINO: all seed groups are run in parallel subprocesses
+            if algo == "DOMINO":
+                batch_results = _runBatchedDominoAndSaveResults(
+                    perturbed_G=perturbed_G,
+                    noise_type=noise_type,
+                    noise_level=noise_level,
+                    repeat=repeat,
+                    filename=filename,
+                    seed_groups=seed_groups_in_network,
+                    domino_env_path=domino_env_path,
+                    domino_slice_cache=domino_slice_cache,
+                    domino_workers=domino_workers,
+                    domino_timeout=domino_timeout,
+                )
+                _saveBatchToDisk(
+                    batch_results, output_file_location, algo, experiment_identifier
+                )
+                continue
+
             # Also start the algorithm on each individual seed group
             batch_results = []
             for seed_id, seed_nodes in seed_groups_in_network.items():
@@ -202,6 +336,10 @@ def _computeModulesOnPerturbedNetworks(
                     seed_nodes=seed_nodes,
                     seed_id=seed_id,
                     domino_env_path=domino_env_path,
+                    p_init=baseline_cache.get(algo, {}).get(seed_id),
+                    local_push=local_push and seed_id in baseline_cache.get(algo, {}),
+                    rwr_solver=rwr_solver,
+                    domino_slice_cache=domino_slice_cache,
                 )
                 batch_results.append(row_of_results)
 
@@ -210,15 +348,103 @@ def _computeModulesOnPerturbedNetworks(
             )
 
         # Explicitly delete graph to ensure memory is freed
+        domino_slice_cache.clear()
         del perturbed_G
         batch_results.clear()
+    if show_progress:
+        print("--- Benchmarking Complete ---")
+
+
+#############################################
+# Parallel version: one perturbed network per worker process
+#############################################
+
+# Settings of the worker processes, set once per process by the initializer
+_WORKER_SETTINGS = {}
+
+
+def _computeModulesOnPerturbedNetworksParallel(
+    tasks: list[tuple[str, str, str, str, str]],
+    output_file_location: str,
+    experiment_identifier: str,
+    n_workers: int,
+    **network_settings,
+):
+    # Every task writes into its own shard folder, so workers never share a
+    # file. Merging in task order gives the same files as the serial loop.
+    shard_root = Path(output_file_location) / f".shards_{experiment_identifier}"
+    # Shards left by a crashed run would be appended to and merged again
+    shutil.rmtree(shard_root, ignore_errors=True)
+    shard_root.mkdir(parents=True)
+    worker_settings = dict(
+        network_settings,
+        experiment_identifier=experiment_identifier,
+        shard_root=str(shard_root),
+    )
+
+    # Consecutive tasks (e.g. repeats of one parquet file) go to the same worker
+    chunk_size = max(1, len(tasks) // (4 * n_workers))
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=_initPerturbedNetworkWorker,
+        initargs=(worker_settings,),
+    ) as executor:
+        for _ in tqdm(
+            executor.map(
+                _computeModulesOnPerturbedNetworkShard,
+                enumerate(tasks),
+                chunksize=chunk_size,
+            ),
+            total=len(tasks),
+        ):
+            pass
+
+    _mergeShards(shard_root, output_file_location, experiment_identifier)
     print("--- Benchmarking Complete ---")
 
 
+def _initPerturbedNetworkWorker(worker_settings: dict):
+    # Sent once per process instead of once per task (baseline_cache is large)
+    _WORKER_SETTINGS.clear()
+    _WORKER_SETTINGS.update(worker_settings)
+
+
+def _computeModulesOnPerturbedNetworkShard(indexed_task: tuple[int, tuple]):
+    index, task = indexed_task
+    settings = dict(_WORKER_SETTINGS)
+    shard_root = Path(settings.pop("shard_root"))
+    _computeModulesOnPerturbedNetworks(
+        tasks=[task],
+        output_file_location=str(shard_root / f"task_{index:07d}"),
+        show_progress=False,
+        **settings,
+    )
+
+
+def _mergeShards(
+    shard_root: Path, output_file_location: str, experiment_identifier: str
+):
+    # A concatenation of gzip files is a valid gzip file, so the shards are
+    # appended as they are, without decompressing them
+    for shard_folder in sorted(shard_root.iterdir()):
+        for shard in sorted(
+            shard_folder.glob(f"results_{experiment_identifier}_*.jsonl.gz")
+        ):
+            with open(Path(output_file_location) / shard.name, "ab") as merged:
+                with open(shard, "rb") as f:
+                    shutil.copyfileobj(f, merged)
+    shutil.rmtree(shard_root)
+
+
 # Load a perturbed network
-def _loadPerturbedNetworkFromFile(perturbed_networks_directory: str, filename: str):
+def _loadPerturbedNetworkFromFile(
+    perturbed_networks_directory: str, filename: str, repeat: str = None
+):
     full_path = os.path.join(perturbed_networks_directory, filename)
     try:
+        if filename.endswith(".parquet"):
+            # All repeats share one file, `repeat` is the task's 'rep{N}' id
+            return _graphFromParquetRepeat(full_path, int(repeat[3:]))
         perturbed_G = nx.read_edgelist(full_path, delimiter="\t")
         return perturbed_G
     except FileNotFoundError:
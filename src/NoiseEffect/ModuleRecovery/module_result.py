@@ -19,6 +19,8 @@ class ModuleResult:
     nodes_diamond: Optional[List[Tuple[str, float]]] = None  # For DIAMOnD
     algorithm_type: str = "ranked"  # 'ranked', 'set', 'diamond
     metadata: Optional[Dict] = None
+    # Scores of all nodes, seeds included (RWR). Only used as warm start, not saved
+    scores: Optional[Dict[str, float]] = None
 
     def get_top_k(self, k: int) -> Set[str]:
         """Extract top-k nodes regardless of algorithm type."""
@@ -7,6 +7,17 @@ from pathlib import Path
 from .utils import _saveRawToDisk
 from .start_algorithm import startAlgorithm
 from .module_result import ModuleResult
+from .ModuleDetectionAlgorithms.random_walk_with_restart_batched import (
+    randomWalkWithRestartBatch,
+)
+from .ModuleDetectionAlgorithms.domino import DominoSliceCache
+from .ModuleDetectionAlgorithms.domino_runner import dominoBatch
+
+# RWR algorithms that are run for all seed groups of a network at once
+BATCHED_RWR_NORMALIZATIONS = {
+    "RandomWalkWithRestartRowNormalization": "row",
+    "RandomWalkWithRestartSymmetricNormalization": "symmetric",
+}
 
 
 # Create the logging channel for this file
@@ -24,6 +35,10 @@ def _runAlgorithmAndSaveResultsToFile(
     seed_nodes: list[str],
     seed_id: str,
     domino_env_path: str = None,
+    p_init: dict = None,
+    local_push: bool = False,
+    rwr_solver: str = "auto",
+    domino_slice_cache: DominoSliceCache = None,
 ):
     if len(seed_nodes) == 0:
         results = _handleEmptySeeds(
@@ -44,6 +59,10 @@ def _runAlgorithmAndSaveResultsToFile(
         G=perturbed_G,
         seed_nodes=seed_nodes,
         domino_env_path=domino_env_path,
+        p_init=p_init,
+        local_push=local_push,
+        rwr_solver=rwr_solver,
+        domino_slice_cache=domino_slice_cache,
     )
 
     # Log convergence info if available
@@ -71,6 +90,134 @@ def _runAlgorithmAndSaveResultsToFile(
     return restults_dict
 
 
+# Run a batched RWR for all seed groups and arrange the results per group
+def _runBatchedRWRAndSaveResults(
+    perturbed_G: nx.Graph,
+    algorithm_name: str,
+    noise_type: str,
+    noise_level: str,
+    repeat: str,
+    filename: str,
+    seed_groups: dict[str, list[str]],
+    p_init: dict[str, dict] = None,
+    local_push: bool = False,
+    rwr_solver: str = "auto",
+):
+    p_init = p_init or {}
+    non_empty_groups = {
+        seed_id: seed_nodes
+        for seed_id, seed_nodes in seed_groups.items()
+        if len(seed_nodes) > 0
+    }
+    logger.info(
+        f"Running {algorithm_name} on {filename} with {len(non_empty_groups)} seed groups"
+    )
+
+    # 1. Recover Modules of all seed groups with one operator
+    batch_results = {}
+    if non_empty_groups:
+        batch_results = randomWalkWithRestartBatch(
+            G=perturbed_G,
+            seed_groups=non_empty_groups,
+            normalization=BATCHED_RWR_NORMALIZATIONS[algorithm_name],
+            p_init={k: v for k, v in p_init.items() if k in non_empty_groups},
+            local_push=local_push,
+            solver=rwr_solver,
+        )
+
+    # 2. Arrange the results in the order of the seed groups
+    return _batchResultsForSaving(
+        batch_results=batch_results,
+        algorithm_name=algorithm_name,
+        noise_type=noise_type,
+        noise_level=noise_level,
+        repeat=repeat,
+        seed_groups=seed_groups,
+    )
+
+
+# Run DOMINO for all seed groups of a network in parallel
+def _runBatchedDominoAndSaveResults(
+    perturbed_G: nx.Graph,
+    noise_type: str,
+    noise_level: str,
+    repeat: str,
+    filename: str,
+    seed_groups: dict[str, list[str]],
+    domino_env_path: str = None,
+    domino_slice_cache: DominoSliceCache = None,
+    domino_workers: int = None,
+    domino_timeout: float = None,
+):
+    non_empty_groups = {
+        seed_id: seed_nodes
+        for seed_id, seed_nodes in seed_groups.items()
+        if len(seed_nodes) > 0
+    }
+    logger.info(
+        f"Running DOMINO on {filename} with {len(non_empty_groups)} seed groups"
+    )
+
+    # 1. Recover Modules of all seed groups, several DOMINO runs at a time
+    batch_results = {}
+    if non_empty_groups:
+        batch_results = dominoBatch(
+            G=perturbed_G,
+            seed_groups=non_empty_groups,
+            DOMINO_PYTHON=domino_env_path,
+            slice_cache=domino_slice_cache,
+            n_workers=domino_workers,
+            timeout=domino_timeout,
+        )
+
+    # 2. Arrange the results in the order of the seed groups
+    return _batchResultsForSaving(
+        batch_results=batch_results,
+        algorithm_name="DOMINO",
+        noise_type=noise_type,
+        noise_level=noise_level,
+        repeat=repeat,
+        seed_groups=seed_groups,
+    )
+
+
+def _batchResultsForSaving(
+    batch_results: dict[str, ModuleResult],
+    algorithm_name: str,
+    noise_type: str,
+    noise_level: str,
+    repeat: str,
+    seed_groups: dict[str, list[str]],
+):
+    # Seed groups without a result had no seeds in the network
+    rows = []
+    for seed_id, seed_nodes in seed_groups.items():
+        if seed_id not in batch_results:
+            rows.append(
+                _handleEmptySeeds(
+                    algorithm_name=algorithm_name,
+                    noise_type=noise_type,
+                    noise_level=noise_level,
+                    repeat=repeat,
+                    seed_id=seed_id,
+                    seed_nodes=seed_nodes,
+                )
+            )
+            continue
+        rows.append(
+            _dictForSaving(
+                results_obj=batch_results[seed_id],
+                algorithm_name=algorithm_name,
+                noise_type=noise_type,
+                noise_level=noise_level,
+                repeat=repeat,
+                seed_id=seed_id,
+                seed_nodes=seed_nodes,
+            )
+        )
+    return rows
+
+
 def _dictForSaving(
     results_obj: ModuleResult,
     algorithm_name: str,
@@ -118,6 +265,7 @@ def _handleEmptySeeds(
     if algorithm_name in [
         "RandomWalkWithRestartRowNormalization",
         "RandomWalkWithRestartSymmetricNormalization",
+        "ApproximatePersonalizedPageRank",
     ]:
         # Return empty ranked list
         perturbedResult_obj = ModuleResult(
@@ -6,8 +6,11 @@ from .ModuleDetectionAlgorithms.random_walk_with_restart_row_normalization impor
 from .ModuleDetectionAlgorithms.random_walk_with_restart_symmetric_normalization import (
     randomWalkWithRestartSymmetricNormalization,
 )
-from .ModuleDetectionAlgorithms.diamond import diamond
-from .ModuleDetectionAlgorithms.domino import domino
+from .ModuleDetectionAlgorithms.approximate_personalized_pagerank import (
+    approximatePersonalizedPageRank,
+)
+from .ModuleDetectionAlgorithms.diamond import diamond_incremental
+from .ModuleDetectionAlgorithms.domino import domino, DominoSliceCache
 from .ModuleDetectionAlgorithms.first_neighbors import firstNeighbors
 from .module_result import ModuleResult
 
@@ -16,16 +19,30 @@ logger = logging.getLogger(__name__)
 
 
 def startAlgorithm(
-    algorithm: str, G: nx.Graph, seed_nodes: list[str], domino_env_path: str = None
+    algorithm: str,
+    G: nx.Graph,
+    seed_nodes: list[str],
+    domino_env_path: str = None,
+    p_init: dict = None,
+    local_push: bool = False,
+    rwr_solver: str = "auto",
+    domino_slice_cache: DominoSliceCache = None,
 ) -> ModuleResult:
+    # p_init / local_push / rwr_solver: options of the RWR algorithms, ignored by the others
+    # domino_slice_cache: slices of G shared by the DOMINO runs of all seed groups
     if algorithm == "1stNeighbors":
         results = firstNeighbors(G=G, seed_nodes=seed_nodes)
 
     elif algorithm == "DIAMOnD":
-        results = diamond(G=G, S=seed_nodes)
+        results = diamond_incremental(G=G, S=seed_nodes)
 
     elif algorithm == "DOMINO":
-        results = domino(G=G, seeds=seed_nodes, DOMINO_PYTHON=domino_env_path)
+        results = domino(
+            G=G,
+            seeds=seed_nodes,
+            DOMINO_PYTHON=domino_env_path,
+            slice_cache=domino_slice_cache,
+        )
 
     elif algorithm == "ROBUST":
         print("Not implemented yet")
@@ -36,13 +53,26 @@ def startAlgorithm(
         results = ModuleResult(nodes_set=set(), algorithm_type="ranked")
 
     elif algorithm == "RandomWalkWithRestartRowNormalization":
-        results = randomWalkWithRestartRowNormalization(G=G, seed_nodes=seed_nodes)
+        results = randomWalkWithRestartRowNormalization(
+            G=G,
+            seed_nodes=seed_nodes,
+            p_init=p_init,
+            local_push=local_push,
+            solver=rwr_solver,
+        )
 
     elif algorithm == "RandomWalkWithRestartSymmetricNormalization":
         results = randomWalkWithRestartSymmetricNormalization(
-            G=G, seed_nodes=seed_nodes
+            G=G,
+            seed_nodes=seed_nodes,
+            p_init=p_init,
+            local_push=local_push,
+            solver=rwr_solver,
         )
 
+    elif algorithm == "ApproximatePersonalizedPageRank":
+        results = approximatePersonalizedPageRank(G=G, seed_nodes=seed_nodes)
+
     else:
         raise ValueError(f"Unknown algorithm specified: {algorithm}")
 
@@ -1,9 +1,14 @@
 import os
 import csv
 import re
+from functools import lru_cache
 from pathlib import Path
+import numpy as np
+import pandas as pd
 import networkx as nx
 
+_NOISE_TYPES = r"targeted_hub_addition|targeted_hub_removal|targeted_periphery_addition|targeted_periphery_removal|added_edges|removed_edges"
+
 
 def _setupOutputCSV(output_csv_path: str):
     columns = [
@@ -45,13 +50,18 @@ def _networkMapFromDirectory(directory_path: str):
     # Group 2: Perturbation Type
     # Group 3: Noise Level (e.g., 0p05 or just 1)
     # Group 4: Repeat number
-    regex_str = r"(.*)_(targeted_hub_addition|targeted_hub_removal|targeted_periphery_addition|targeted_periphery_removal|added_edges|removed_edges)_noise(\d+(?:p\d+)?)_repeat(\d+)"
+    regex_str = r"(.*)_(" + _NOISE_TYPES + r")_noise(\d+(?:p\d+)?)_repeat(\d+)"
     pattern = re.compile(regex_str)
 
     path_obj = Path(directory_path)
 
-    # Grab both .txt and .tsv just to be completely safe
-    files = list(path_obj.glob("*.txt")) + list(path_obj.glob("*.tsv"))
+    # Grab both .txt and .tsv just to be completely safe, plus the parquet
+    # files written by generateNoiseNetworksFromBaseline
+    files = (
+        list(path_obj.glob("*.txt"))
+        + list(path_obj.glob("*.tsv"))
+        + list(path_obj.glob("*.parquet"))
+    )
     files = sorted([f.name for f in files])
 
     for filename in files:
@@ -59,6 +69,11 @@ def _networkMapFromDirectory(directory_path: str):
         if filename.startswith("._"):
             continue
 
+        # One parquet file holds all repeats of one noise level
+        if filename.endswith(".parquet"):
+            tasks.extend(_parquetTasks(path_obj / filename))
+            continue
+
         match = pattern.search(filename)
         if match:
             network_name = match.group(1)
@@ -79,6 +94,64 @@ def _networkMapFromDirectory(directory_path: str):
     return tasks
 
 
+####### Parquet perturbed networks ##########
+
+_PARQUET_PATTERN = re.compile(
+    r"(.*)_(" + _NOISE_TYPES + r")_noise_(\d+(?:p\d+)?)\.parquet$"
+)
+
+
+def _parquetTasks(path: Path):
+    """
+    One task per repeat of a `{network}_{noise_type}_noise_{level}.parquet`
+    file. Only the repeat column is read.
+    """
+    match = _PARQUET_PATTERN.search(path.name)
+    if match is None:
+        print(f"Warning: File '{path.name}' was ignored because it didn't match the regex.")
+        return []
+
+    network_name, p_type = match.group(1), match.group(2)
+    p_level = float(match.group(3).replace("p", "."))
+    repeats = np.unique(pd.read_parquet(path, columns=["repeat"])["repeat"].to_numpy())
+    return [
+        (path.name, p_type, p_level, f"rep{repeat}", network_name) for repeat in repeats
+    ]
+
+
+@lru_cache(maxsize=1)
+def _parquetRepeatEdges(path: str) -> dict:
+    """
+    Edge arrays of every repeat in a parquet file, {repeat: (sources, targets)}.
+
+    Tasks of one file are processed one after another, so caching the last
+    file reads every parquet file only once.
+    """
+    df = pd.read_parquet(path, columns=["source", "target", "repeat"])
+    repeats = df["repeat"].to_numpy()
+    order = np.argsort(repeats, kind="stable")
+    repeats = repeats[order]
+    # Node labels are compared with the (string) seed and baseline labels
+    sources = df["source"].to_numpy().astype(str)[order]
+    targets = df["target"].to_numpy().astype(str)[order]
+
+    boundaries = np.flatnonzero(repeats[1:] != repeats[:-1]) + 1
+    starts = np.concatenate(([0], boundaries))
+    stops = np.concatenate((boundaries, [repeats.size]))
+    return {
+        int(repeats[start]): (sources[start:stop], targets[start:stop])
+        for start, stop in zip(starts, stops)
+    }
+
+
+def _graphFromParquetRepeat(path: str, repeat: int) -> nx.Graph:
+    """Builds the graph of one repeat directly from the cached edge arrays."""
+    sources, targets = _parquetRepeatEdges(str(path))[repeat]
+    G = nx.Graph()
+    G.add_edges_from(zip(sources.tolist(), targets.tolist()))
+    return G
+
+
 def _saveRawToDisk(module_list, filename, algo, seed_id):
     # Construct a filename that identifies the run
     # e.g., results/raw/autocore_noise0.05_diamond_seed1.txt
@@ -4,6 +4,8 @@ import numpy as np
 import pandas as pd
 import gzip
 from pathlib import Path
+from NoiseEffect.utils.sequential_sampling import sampleUntilStandardError
+from NoiseEffect.utils.noise_grid import refineNoiseGrid
 
 ##################################################
 # Code generates networks with artificially,
@@ -26,6 +28,8 @@ def generateNoiseNetworksFromBaseline(
     ],
     num_repeats_per_noise_level: int = 10,
     network_name: str = "network",
+    adaptive_repeats: dict = None,
+    adaptive_levels: dict = None,
 ):
     """
     Orchestrates the process of generating networks with randomly
@@ -41,6 +45,10 @@ def generateNoiseNetworksFromBaseline(
     :type num_repeats_per_noise_level: int
     :param network_name: Information on the main network, will be included in the file name of the pertrubed networks. Optional, defaults to "network"
     :type network_name: str
+    :param adaptive_repeats: Optional sequential sampling of the repeats. Dictionary with "metric" (callable mapping a perturbed networkx graph to a float), "max_standard_error", "min_repeats" (defaults to 3) and "max_repeats" (defaults to num_repeats_per_noise_level). Repeats are added to a (noise type, noise level) cell only while the standard error of the metric is above the threshold.
+    :type adaptive_repeats: dict
+    :param adaptive_levels: Optional adaptive refinement of the noise grid per noise type. Dictionary with "metric" (callable mapping a perturbed networkx graph to a float), "resolution", "threshold" (optional) and "max_levels" (optional). noise_levels is used as the coarse starting grid, and the interval where the mean metric crosses the threshold (or changes most) is bisected down to the resolution.
+    :type adaptive_levels: dict
     """
     # Load the baseline network
     g, idx_to_node, node_to_idx = _loadBaseline(path_to_edgelist)
@@ -49,47 +57,130 @@ def generateNoiseNetworksFromBaseline(
         "nodes": list(g.nodes()),
         "edges": list(g.edges())
     }
-    for noise_level in noise_levels:
-        num_edges_to_modify = _calcualteNumberOfEdgesToModify(
-            g, noise_level, noise_types, graph_info
+
+    def _generateCell(noise_level, noise_type, metric=None):
+        return _generateNoiseCell(
+            g,
+            graph_info,
+            idx_to_node,
+            noise_level,
+            noise_type,
+            noise_types,
+            num_repeats_per_noise_level,
+            adaptive_repeats,
+            metric,
+            folder_to_save_perturbed,
+            network_name,
+        )
+
+    if adaptive_levels is None:
+        for noise_level in noise_levels:
+            for noise_type in noise_types:
+                _generateCell(noise_level, noise_type)
+        return
+
+    # Adaptive grid: every noise type gets its own refined set of levels
+    for noise_type in noise_types:
+        refinement = refineNoiseGrid(
+            lambda noise_level: np.nanmean(
+                _generateCell(noise_level, noise_type, metric=adaptive_levels["metric"])
+            ),
+            initial_levels=noise_levels,
+            resolution=adaptive_levels["resolution"],
+            threshold=adaptive_levels.get("threshold"),
+            max_levels=adaptive_levels.get("max_levels"),
         )
-        for noise_type in noise_types:
-            # List to hold the repeat results
-            all_dfs = []
-            for repeat in range(num_repeats_per_noise_level):
-                # Generate perturbed graph based on the action word
-                if "add" in noise_type:
-                    G_perturbed = _addEdgesToNetwork(g, num_edges_to_modify, noise_type, graph_info)
-                elif "remov" in noise_type:
-                    G_perturbed = _removeEdgesFromNetwork(
-                        g, num_edges_to_modify, noise_type, graph_info
-                    )
-                else:
-                    raise ValueError(f"Unknown noise type: {noise_type}")
-
-                # Extract edges and convert to DataFrame
-                df_repeat = pd.DataFrame(G_perturbed.edges(), columns=["source", "target"])
-
-                # Relabel nodes in the DataFrame back to original labels
-                df_repeat["source"] = df_repeat["source"].map(idx_to_node)
-                df_repeat["target"] = df_repeat["target"].map(idx_to_node)
-
-                # Add the repeat ID as a column
-                df_repeat["repeat"] = repeat
-
-                # Store this DataFrame
-                all_dfs.append(df_repeat)
-
-            # Combine all repeats into single DataFrame
-            final_df = pd.concat(all_dfs, ignore_index=True)
-
-            _saveParquet(
-                final_df,
-                folder_to_save_perturbed,
-                noise_level,
-                network_name,
-                modification_type=noise_type,
-            )
+        print(
+            f"{noise_type}: evaluated levels {refinement['levels']}, "
+            f"breakdown interval {refinement['interval']}"
+        )
+
+
+def _generateNoiseCell(
+    g,
+    graph_info,
+    idx_to_node,
+    noise_level,
+    noise_type,
+    noise_types,
+    num_repeats,
+    adaptive_repeats,
+    metric,
+    folder_to_save_perturbed,
+    network_name,
+):
+    """
+    Generates and saves all repeats of one (noise level, noise type) cell.
+
+    :param metric: Optional callable evaluated on every perturbed graph
+    :type metric: callable
+    :return: The metric value of every repeat (empty without a metric)
+    :rtype: list[float]
+    """
+    num_edges_to_modify = _calcualteNumberOfEdgesToModify(
+        g, noise_level, noise_types, graph_info
+    )
+    # List to hold the repeat results
+    all_dfs = []
+    metric_values = []
+
+    def _generateRepeats(repeats):
+        batch_values = []
+        for repeat in repeats:
+            # Generate perturbed graph based on the action word
+            if "add" in noise_type:
+                G_perturbed = _addEdgesToNetwork(g, num_edges_to_modify, noise_type, graph_info)
+            elif "remov" in noise_type:
+                G_perturbed = _removeEdgesFromNetwork(
+                    g, num_edges_to_modify, noise_type, graph_info
+                )
+            else:
+                raise ValueError(f"Unknown noise type: {noise_type}")
+
+            # Extract edges and convert to DataFrame
+            df_repeat = pd.DataFrame(G_perturbed.edges(), columns=["source", "target"])
+
+            # Relabel nodes in the DataFrame back to original labels
+            df_repeat["source"] = df_repeat["source"].map(idx_to_node)
+            df_repeat["target"] = df_repeat["target"].map(idx_to_node)
+
+            # Add the repeat ID as a column
+            df_repeat["repeat"] = repeat
+
+            # Store this DataFrame
+            all_dfs.append(df_repeat)
+
+            if metric is not None:
+                metric_values.append(metric(G_perturbed))
+            if adaptive_repeats is not None:
+                batch_values.append(adaptive_repeats["metric"](G_perturbed))
+        return batch_values
+
+    if adaptive_repeats is None:
+        _generateRepeats(range(num_repeats))
+    else:
+        sampling = sampleUntilStandardError(
+            _generateRepeats,
+            range(adaptive_repeats.get("max_repeats", num_repeats)),
+            max_standard_error=adaptive_repeats["max_standard_error"],
+            min_samples=adaptive_repeats.get("min_repeats", 3),
+        )
+        print(
+            f"{noise_type} at noise level {noise_level}: {len(sampling['used'])} repeats, "
+            f"standard error {sampling['standard_error']:.4g}"
+        )
+
+    # Combine all repeats into single DataFrame
+    final_df = pd.concat(all_dfs, ignore_index=True)
+
+    _saveParquet(
+        final_df,
+        folder_to_save_perturbed,
+        noise_level,
+        network_name,
+        modification_type=noise_type,
+    )
+    return metric_values
 
 
 ############################################################
@@ -2,62 +2,66 @@ import random
 import os
 import numpy as np
 import networkx as nx
-from collections import Counter
 from scipy.sparse.linalg import eigsh
 from scipy.sparse import csr_matrix, csgraph
+from NoiseEffect.utils.sparse_graph import adjacencyMatrix
+from NoiseEffect.utils.path_lengths import sampledPathLengths
+from NoiseEffect.utils.hyperanf import hyperANF
+from NoiseEffect.NoisePipeline.RecoveryMethods.GlobalStructure.triangle_counting import (
+    clusteringMetrics,
+)
 
 
-def generateGlobalStructureMetrics(G, samples=100):
+def generateGlobalStructureMetrics(
+    G, samples=100, path_length_method="sampled", num_nodes=None
+):
+    """
+    G: networkx graph, scipy sparse adjacency matrix or (m, 2) edge array of
+    integer node indices (then `num_nodes` is required).
+    path_length_method: "sampled" (BFS from `samples` nodes of the LCC) or
+    "hyperanf" (HyperLogLog sketch over all reachable pairs of the graph).
+    """
+    # Components are computed once and shared by all metrics
+    A = adjacencyMatrix(G, num_nodes=num_nodes)
+    _, component_labels = csgraph.connected_components(A, directed=False)
+    component_sizes = np.bincount(component_labels)
+    lcc = np.flatnonzero(component_labels == np.argmax(component_sizes))
+    A_lcc = A[lcc][:, lcc]
+
     metrics = {}
-    metrics["number_of_components"] = _numberOfComponents(G)
-    metrics["average_shortest_path_approx_lcc"] = _averageShortestPathApproximateOnLCC(
-        G, samples=samples
-    )
-    metrics["average_clustering_coeff_approx_lcc"] = (
-        _averageClusteringCoeffApproximateOnLCC(G, samples=samples)
-    )
+    metrics["number_of_components"] = _numberOfComponents(component_sizes)
+    if path_length_method == "sampled":
+        path_lengths = _pathLengthsApproximateOnLCC(A_lcc, samples=samples)
+        metrics["average_shortest_path_approx_lcc"] = path_lengths["mean"]
+        metrics["effective_diameter_approx_lcc"] = path_lengths["effective_diameter"]
+    elif path_length_method == "hyperanf":
+        path_lengths = hyperANF(A)
+        metrics["average_shortest_path_hyperanf"] = path_lengths["mean"]
+        metrics["effective_diameter_hyperanf"] = path_lengths["effective_diameter"]
+        metrics["reachable_pairs_hyperanf"] = path_lengths["num_reachable_pairs"]
+    else:
+        raise ValueError(f"Unknown path_length_method: {path_length_method}")
+    # Exact clustering from a sparse triangle count, restricted to the LCC
+    clustering = clusteringMetrics(A_lcc)
+    metrics["average_clustering_coeff_lcc"] = clustering["average_clustering"]
+    metrics["transitivity_lcc"] = clustering["transitivity"]
     return metrics
 
 
 ####### Individual global structure metrics ##########
 
 
-def _numberOfComponents(G):
-    sizes = [len(c) for c in nx.connected_components(G)]
-    return dict(Counter(sizes))
-
-
-def _averageShortestPathApproximateOnLCC(G, samples=100):
-    # Only use LCC to approximate path lengths
-    lcc = max(nx.connected_components(G), key=len)
-    LCC_G = G.subgraph(lcc)
-    # Calculate average shortest path using a sample of nodes
-    nodes = random.sample(list(LCC_G.nodes()), min(samples, len(LCC_G)))
-    total = 0
-    count = 0
-    for n in nodes:
-        lengths = nx.single_source_shortest_path_length(LCC_G, n)
-        total += sum(lengths.values())
-        count += len(lengths) - 1
-    return total / count
-
-
-def _averageClusteringCoeffApproximateOnLCC(G, samples=1000):
-    # Only use LCC to approximate path lengths
-    lcc = max(nx.connected_components(G), key=len)
-    LCC_G = G.subgraph(lcc)
-    # Calculate average clustering on the subsample
-    nodes = random.sample(list(LCC_G.nodes()), min(samples, len(LCC_G)))
-    triads = triangles = 0
-    for v in nodes:
-        neighbors = list(G.neighbors(v))
-        k = len(neighbors)
-        if k < 2:
-            continue
-        triads += k * (k - 1) / 2
-        sub = G.subgraph(neighbors)
-        triangles += len(sub.edges())
-    return (3 * triangles) / triads if triads > 0 else 0
+def _numberOfComponents(component_sizes):
+    # Histogram {component size: number of components}
+    sizes, counts = np.unique(component_sizes, return_counts=True)
+    return {int(size): int(count) for size, count in zip(sizes, counts)}
+
+
+def _pathLengthsApproximateOnLCC(A_lcc, samples=100):
+    # Multi-source BFS from a sample of LCC nodes
+    num_nodes = A_lcc.shape[0]
+    sources = random.sample(range(num_nodes), min(samples, num_nodes))
+    return sampledPathLengths(A_lcc, sources=sources)
 
 
 """
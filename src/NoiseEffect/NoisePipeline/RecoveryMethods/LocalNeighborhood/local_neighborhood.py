@@ -2,6 +2,7 @@ from scipy.spatial.distance import jensenshannon
 from scipy.stats import spearmanr
 import ast
 from NoiseEffect.NoisePipeline.RecoveryMethods.LocalNeighborhood.random_walk import (
+    randomWalkGraph,
     randomWalkWithRestart,
 )
 import numpy as np
@@ -12,13 +13,32 @@ import numpy as np
 ####################################
 
 
-def localNeighborhoodAnalysis(modified_network_nx, original_neighborhood):
+def localNeighborhoodAnalysis(
+    modified_network_nx,
+    original_neighborhood,
+    start_points=None,
+    warm_start=True,
+    local_push=False,
+):
+    # warm_start: start each RWR from the baseline solution of the same start set
+    # local_push: only propagate the baseline solution's residual on the modified network
+    # Start sets are parsed from the result keys unless passed directly
+    if start_points is None:
+        starts = [(key, ast.literal_eval(key)) for key in original_neighborhood]
+    else:
+        starts = [(str(start), start) for start in start_points]
+    # The matrix and its components are built once for all start sets
+    walk_graph = randomWalkGraph(modified_network_nx)
     similarity_results = {}
-    for start_str in original_neighborhood.keys():
-        start = ast.literal_eval(start_str)
+    for start_str, start in starts:
         new_neighborhood = randomWalkWithRestart(
             G=modified_network_nx,
             seed_nodes=start,
+            p_init=original_neighborhood[start_str]
+            if (warm_start or local_push)
+            else None,
+            local_push=local_push,
+            walk_graph=walk_graph,
         )
         similarity_results[start_str] = _calculateSimilarityMetrics(
             original_neighborhood=original_neighborhood[start_str],
@@ -1,9 +1,59 @@
-from scipy.sparse import csr_matrix
+from scipy.sparse import diags
 import numpy as np
 import networkx as nx
+from NoiseEffect.utils.random_walk_solvers import (
+    initialVector,
+    powerIterationRWR,
+    localPushRWR,
+    componentLabels,
+    seedComponentNodes,
+)
 
 
-def randomWalkWithRestart(G, seed_nodes, restart=0.85, tol=1e-6, max_iter=1000):
+def randomWalkGraph(G):
+    """
+    Node order, adjacency matrix and component labels of G for
+    `randomWalkWithRestart`. Isolated nodes get a self-loop so that the walk
+    stays on them.
+
+    Build it once per network and pass it to every walk on that network.
+
+    Parameters
+    ----------
+    G : networkx.Graph
+        The input undirected graph.
+
+    Returns
+    -------
+    tuple
+        (nodelist, A, labels)
+    """
+    nodelist = list(G.nodes())
+    n = len(nodelist)
+
+    A = nx.to_scipy_sparse_array(G, format="csr", dtype=float)
+    d_orig = A @ np.ones(n)
+    # Identify the nodes with zero degree
+    sink_nodes = np.where(d_orig == 0)[0]
+    # Add a self loop to these nodes
+    if len(sink_nodes) > 0:
+        A_lil = A.tolil()
+        A_lil[sink_nodes, sink_nodes] = 1.0
+        A = A_lil.tocsr()
+
+    return nodelist, A, componentLabels(A)
+
+
+def randomWalkWithRestart(
+    G,
+    seed_nodes,
+    restart=0.85,
+    tol=1e-6,
+    max_iter=1000,
+    p_init=None,
+    local_push=False,
+    walk_graph=None,
+):
     """
     Perform a random walk with restart (RWR) on graph G starting from a set of seed nodes.
 
@@ -19,46 +69,55 @@ def randomWalkWithRestart(G, seed_nodes, restart=0.85, tol=1e-6, max_iter=1000):
         Convergence tolerance (default: 1e-6). The iteration stops when the L1 norm change is below this value.
     max_iter : int, optional
         Maximum number of iterations allowed (default: 100).
+    p_init : dict, optional
+        Previous solution for the same seed nodes (node -> probability), e.g.
+        on the unperturbed network. The iteration starts from it instead of p0.
+    local_push : bool, optional
+        Only propagate the residual of `p_init` on G (requires `p_init`).
+        Converges in few rounds when G differs from the network of `p_init`
+        in a few edges.
+    walk_graph : tuple, optional
+        `randomWalkGraph(G)`, shared by several walks on G. Built if not given.
 
     Returns
     -------
     p : np.ndarray
         Steady-state visiting probabilities for each node in the graph.
     """
-    nodelist = list(G.nodes())
+    if walk_graph is None:
+        walk_graph = randomWalkGraph(G)
+    nodelist, A, labels = walk_graph
     n = len(nodelist)
 
-    A = nx.to_scipy_sparse_array(G, format="csr", dtype=float)
-    d_orig = A @ np.ones(n)
-    # Identify the nodes with zero degree
-    sink_nodes = np.where(d_orig == 0)[0]
-    # Add a self loop to these nodes
-    if len(sink_nodes) > 0:
-        A_lil = A.tolil()
-        A_lil[sink_nodes, sink_nodes] = 1.0
-        A = A_lil.tocsr()
+    # The walk never leaves the components of the seeds, only iterate on them
+    component_nodes = seedComponentNodes(labels, seed_nodes)
+    A_sub = A[component_nodes][:, component_nodes]
 
     # Recompute degrees after adding self-loops
-    d = A @ np.ones(n)
+    d = A_sub @ np.ones(component_nodes.size)
 
-    D_inv = csr_matrix(np.diag(1 / d))
-    P = D_inv @ A
+    D_inv = diags(1 / d)
+    P = D_inv @ A_sub
 
     # Initialize starting probability vector
-    p0 = np.zeros(n)
-    p0[seed_nodes] = 1.0 / len(seed_nodes)
-
-    p = p0.copy()
-    for _ in range(max_iter):
-        p_next = (1 - restart) * P.T @ p + restart * p0
-        if np.linalg.norm(p_next - p, ord=1) < tol:
-            break
-        p = p_next
-
-        if _ == max_iter - 1:
-            print(
-                "Warning: RWR did not converge within the maximum number of iterations."
-            )
+    p0 = np.zeros(component_nodes.size)
+    p0[np.searchsorted(component_nodes, seed_nodes)] = 1.0 / len(seed_nodes)
+    if p_init is not None:
+        p_init = initialVector(p_init, nodelist)[component_nodes]
+
+    if local_push:
+        if p_init is None:
+            raise ValueError("local_push requires p_init.")
+        p_sub, converged, _ = localPushRWR(P.T, p0, restart, tol, max_iter, p_init)
+    else:
+        p_sub, converged, _ = powerIterationRWR(
+            P.T, p0, restart, tol, max_iter, p_init=p_init
+        )
+    p = np.zeros(n)
+    p[component_nodes] = p_sub
+
+    if not converged:
+        print("Warning: RWR did not converge within the maximum number of iterations.")
 
     nodes_to_probs = dict(zip(nodelist, p))
     nodes_to_probs_sorted = dict(
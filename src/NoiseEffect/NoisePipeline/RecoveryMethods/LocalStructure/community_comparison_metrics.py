@@ -1,9 +1,9 @@
 from sklearn.metrics import (
     adjusted_rand_score,
     normalized_mutual_info_score,
-    adjusted_mutual_info_score,
 )
 import numpy as np
+from NoiseEffect.CommunityDetection.mutual_information import adjustedMutualInformation
 
 
 class CommunityComparisonMetrics:
@@ -66,9 +66,7 @@ class CommunityComparisonMetrics:
         try:
             # Calculate metrics
             ari = adjusted_rand_score(labels_true=true_labels, labels_pred=noisy_labels)
-            ami = adjusted_mutual_info_score(
-                labels_true=true_labels, labels_pred=noisy_labels
-            )
+            ami = adjustedMutualInformation(true_labels, noisy_labels)
             return {
                 "status": "success",
                 "num_clusters": n_noisy_labels,
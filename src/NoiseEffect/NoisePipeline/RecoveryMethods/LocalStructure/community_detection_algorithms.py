@@ -2,23 +2,47 @@ import leidenalg as la
 from infomap import Infomap
 import igraph as ig
 import networkx as nx
+from NoiseEffect.CommunityDetection.detection_algorithms import (
+    leidenAlgorithmPartioning,
+    leidenResolutionSweep,
+)
 
 
 class CommunityDetectionAlgorithms:
     """A collection of static methods for community detection"""
 
     @staticmethod
-    def leidenAlgorithmPartioning(ig_graph, list_of_seeds):
+    def leidenAlgorithmPartioning(
+        ig_graph,
+        list_of_seeds,
+        backend="leidenalg",
+        objective_function="modularity",
+        resolution=1.0,
+    ):
         """
         Finds communities using the Leiden algorithm on an igraph object.
 
         Args:
             ig_graph (igraph.Graph): The graph to analyze.
+            backend (str, optional): 'leidenalg' or 'igraph' (native C
+                implementation). Defaults to 'leidenalg'.
+            objective_function (str, optional): 'modularity' or 'CPM'.
+            resolution (float, optional): Resolution parameter. Defaults to 1.0.
 
         Returns:
             list[set[int]]: A list of sets, where each set contains the integer
                             vertex IDs of a community.
         """
+        if backend != "leidenalg" or objective_function != "modularity" or resolution != 1.0:
+            return leidenAlgorithmPartioning(
+                ig_graph,
+                list_of_seeds,
+                n_iterations=2,
+                backend=backend,
+                objective_function=objective_function,
+                resolution=resolution,
+            )
+
         partitions = {}
         for seed in list_of_seeds:
             partition_ig = la.find_partition(
@@ -29,6 +53,25 @@ class CommunityDetectionAlgorithms:
         # Return the full partition, converted to a list of sets of integer IDs.
         return partitions
 
+    @staticmethod
+    def leidenResolutionSweep(
+        ig_graph, list_of_seeds, resolutions, objective_function="CPM", backend="igraph"
+    ):
+        """
+        Runs Leiden over a grid of resolutions for every seed, sharing the
+        graph preprocessing across resolutions.
+
+        Returns:
+            dict[float, dict[int, list[set[int]]]]: Partitions per resolution and seed.
+        """
+        return leidenResolutionSweep(
+            ig_graph,
+            list_of_seeds,
+            resolutions,
+            objective_function=objective_function,
+            backend=backend,
+        )
+
     @staticmethod
     # 2.2 Infomap Algorithm #####
     def infomapAlgorithmPartioning(ig_graph, list_of_seeds):
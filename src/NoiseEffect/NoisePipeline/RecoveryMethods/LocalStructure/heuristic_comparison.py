@@ -1,6 +1,7 @@
 from NoiseEffect.NoisePipeline.RecoveryMethods.LocalStructure.community_comparison_metrics import (
     CommunityComparisonMetrics,
 )
+from NoiseEffect.utils.sequential_sampling import sampleUntilConfident
 from collections import Counter
 import numpy as np
 
@@ -12,11 +13,55 @@ class CompareHeuristicClusterings:
         self.comparison_results = {}
 
     def makeComparison(self):
+        metrics_summary = self._compareSeeds(self.perturbed_communities)
+        self.summarizeResults(metrics_summary)
+
+    def makeAdaptiveComparison(
+        self,
+        detect_communities,
+        candidate_seeds,
+        tolerance,
+        batch_size=5,
+        min_seeds=10,
+        max_seeds=None,
+        confidence=0.95,
+    ):
+        """
+        Adds seeds in batches until the confidence interval of the mean ARI is
+        narrower than `tolerance` (or `max_seeds` is reached).
+
+        `detect_communities(seeds)` has to return {seed: partition} of the
+        perturbed network for the given seeds; the original communities must
+        contain the same seeds.
+        """
+        metrics_summary = {}
+
+        def _evaluateBatch(seeds):
+            partitions = detect_communities(seeds)
+            self.perturbed_communities.update(partitions)
+            batch_metrics = self._compareSeeds(partitions)
+            metrics_summary.update(batch_metrics)
+            return [batch_metrics[seed]["ari"] for seed in seeds]
+
+        sampling = sampleUntilConfident(
+            _evaluateBatch,
+            candidate_seeds,
+            tolerance=tolerance,
+            batch_size=batch_size,
+            min_samples=min_seeds,
+            max_samples=max_seeds,
+            confidence=confidence,
+        )
+        self.summarizeResults(metrics_summary)
+        self.comparison_results["ari"]["ci_half_width"] = sampling["half_width"]
+        self.comparison_results["converged"] = sampling["converged"]
+
+    def _compareSeeds(self, perturbed_communities):
         metrics_summary = {}
         # Go through the obtained clusterings for each random seed
-        for seed in self.perturbed_communities:
+        for seed in perturbed_communities:
             original_partition = self.original_communities[seed]
-            perturbed_partition = self.perturbed_communities[seed]
+            perturbed_partition = perturbed_communities[seed]
 
             # Generate labels for both partitions
             original_labels = CommunityComparisonMetrics.convertPartitionToLabels(
@@ -33,8 +78,7 @@ class CompareHeuristicClusterings:
             )
 
             metrics_summary[seed] = metrics_dict
-
-        self.summarizeResults(metrics_summary)
+        return metrics_summary
 
     def summarizeResults(self, metrics_dict):
         ari_values = []
@@ -69,6 +113,7 @@ class CompareHeuristicClusterings:
             },
             "status_counts": dict(Counter(status_list)),
             "num_clusters_counts": dict(Counter(num_clusters_list)),
+            "seeds_used": list(metrics_dict),
         }
 
         self.comparison_results = summary
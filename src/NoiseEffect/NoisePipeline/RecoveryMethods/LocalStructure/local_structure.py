@@ -9,33 +9,60 @@ from NoiseEffect.NoisePipeline.RecoveryMethods.LocalStructure.heuristic_comparis
 )
 
 
-def localStructureAnalysis(G_nx, G_ig, original_communities, random_seed_list):
+def localStructureAnalysis(
+    G_nx,
+    G_ig,
+    original_communities,
+    random_seed_list,
+    adaptive_seeds=None,
+    extend_baseline=None,
+):
+    """
+    Compares Leiden and Infomap communities of a perturbed network with the
+    baseline communities, seed by seed.
+
+    With `adaptive_seeds` (a dict with 'tolerance' and optionally
+    'batch_size', 'min_seeds', 'max_seeds', 'confidence') seeds from
+    `random_seed_list` are added in batches until the mean ARI is stable.
+    `extend_baseline(algorithm, seeds)` is called first for seeds whose
+    baseline communities were not computed yet.
+    """
     recovery_results = {}
-    # Leiden Algorithm Comparison
-    leiden_clusters = CommunityDetectionAlgorithms.leidenAlgorithmPartioning(
-        G_ig, list_of_seeds=random_seed_list
-    )
-    original_leiden_clusters = original_communities["leiden_algorithm"]
-
-    comparison_obj = CompareHeuristicClusterings(
-        original_communities=original_leiden_clusters,
-        perturbed_communities=leiden_clusters,
-    )
-    comparison_obj.makeComparison()
-    comparison_results = comparison_obj.comparison_results
-    recovery_results["leiden_algorithm"] = comparison_results
-
-    # Infomap Algorithm Comparison
-    infomap_clusters = CommunityDetectionAlgorithms.infomapAlgorithmPartioning(
-        G_ig, list_of_seeds=random_seed_list
-    )
-    original_infomap_clusters = original_communities["infomap_algorithm"]
-
-    comparison_obj = CompareHeuristicClusterings(
-        original_communities=original_infomap_clusters,
-        perturbed_communities=infomap_clusters,
-    )
-    comparison_obj.makeComparison()
-    comparison_results = comparison_obj.comparison_results
-    recovery_results["infomap_algorithm"] = comparison_results
+    algorithms = {
+        "leiden_algorithm": CommunityDetectionAlgorithms.leidenAlgorithmPartioning,
+        "infomap_algorithm": CommunityDetectionAlgorithms.infomapAlgorithmPartioning,
+    }
+
+    for algorithm, partitioning in algorithms.items():
+        original_clusters = original_communities[algorithm]
+
+        if adaptive_seeds is None:
+            clusters = partitioning(G_ig, list_of_seeds=random_seed_list)
+            comparison_obj = CompareHeuristicClusterings(
+                original_communities=original_clusters,
+                perturbed_communities=clusters,
+            )
+            comparison_obj.makeComparison()
+        else:
+
+            def _detectCommunities(seeds, algorithm=algorithm, partitioning=partitioning):
+                if extend_baseline is not None:
+                    extend_baseline(algorithm, seeds)
+                return partitioning(G_ig, list_of_seeds=seeds)
+
+            comparison_obj = CompareHeuristicClusterings(
+                original_communities=original_clusters,
+                perturbed_communities={},
+            )
+            comparison_obj.makeAdaptiveComparison(
+                _detectCommunities,
+                random_seed_list,
+                tolerance=adaptive_seeds["tolerance"],
+                batch_size=adaptive_seeds.get("batch_size", 5),
+                min_seeds=adaptive_seeds.get("min_seeds", 10),
+                max_seeds=adaptive_seeds.get("max_seeds"),
+                confidence=adaptive_seeds.get("confidence", 0.95),
+            )
+
+        recovery_results[algorithm] = comparison_obj.comparison_results
     return recovery_results
@@ -9,10 +9,20 @@ import functools
 
 
 class NetworkNoiseAnalysis:
-    def __init__(self, network_metadata_list, num_instances=1, num_of_random_seeds=50):
+    def __init__(
+        self,
+        network_metadata_list,
+        num_instances=1,
+        num_of_random_seeds=50,
+        adaptive_seeds=None,
+    ):
         self.network_metadata_list = network_metadata_list
         self.num_instances = num_instances
         self.random_seed_list = random.sample(range(1, 10000), num_of_random_seeds)
+        # E.g. {"tolerance": 0.01, "batch_size": 5, "min_seeds": 10}: stop adding
+        # community detection seeds once the mean ARI is known to +-tolerance.
+        # num_of_random_seeds then acts as the maximum.
+        self.adaptive_seeds = adaptive_seeds
 
         self.results_dict = {}
         self.expanded_requests = (
@@ -44,7 +54,9 @@ class NetworkNoiseAnalysis:
                 # and collects the results in order.
                 results_as_list_of_tuples = pool.map(
                     functools.partial(
-                        workerFunction, random_seed_list=self.random_seed_list
+                        workerFunction,
+                        random_seed_list=self.random_seed_list,
+                        adaptive_seeds=self.adaptive_seeds,
                     ),
                     self.expanded_requests,
                 )
@@ -17,9 +17,11 @@ from NoiseEffect.NoisePipeline.utils.generateRWRstarts import generateRWRstarts
 
 
 class OriginalNetwork:
-    def __init__(self, network_request, random_seed_list):
+    def __init__(self, network_request, random_seed_list, adaptive_seeds=None):
         self.network_request = network_request
         self.random_seed_list = random_seed_list
+        # Optional early stopping over seeds, see localStructureAnalysis
+        self.adaptive_seeds = adaptive_seeds
         self.original_network_nx = None
         self.original_network_ig = None
         self.idx_to_node = None
@@ -27,6 +29,7 @@ class OriginalNetwork:
         self.original_communities = {}
         self.original_num_communities = {}
         self.original_neighborhood = {}
+        self.rwr_start_points = []
         self.original_global_structure = {}
 
     def generateEvaluationBaseline(self):
@@ -131,26 +134,56 @@ class OriginalNetwork:
         if self.original_network_nx.number_of_edges() == 0:
             raise ValueError("Network without edges can not have communities.")
 
+        # In adaptive mode only the minimum number of seeds is computed upfront,
+        # further seeds are added on demand by extendBaselineCommunities
+        if self.adaptive_seeds is None:
+            seeds = self.random_seed_list
+        else:
+            seeds = self.random_seed_list[: self.adaptive_seeds.get("min_seeds", 10)]
+
         self.original_communities["leiden_algorithm"] = (
             CommunityDetectionAlgorithms.leidenAlgorithmPartioning(
-                self.original_network_ig, list_of_seeds=self.random_seed_list
+                self.original_network_ig, list_of_seeds=seeds
             )
         )
         self.original_communities["infomap_algorithm"] = (
             CommunityDetectionAlgorithms.infomapAlgorithmPartioning(
-                self.original_network_ig, list_of_seeds=self.random_seed_list
+                self.original_network_ig, list_of_seeds=seeds
             )
         )
 
+    def extendBaselineCommunities(self, algorithm, seeds):
+        """
+        Computes the baseline communities of `algorithm` ('leiden_algorithm' or
+        'infomap_algorithm') for all seeds that are not cached yet.
+        """
+        missing_seeds = [
+            seed for seed in seeds if seed not in self.original_communities[algorithm]
+        ]
+        if not missing_seeds:
+            return
+
+        if algorithm == "leiden_algorithm":
+            partitioning = CommunityDetectionAlgorithms.leidenAlgorithmPartioning
+        elif algorithm == "infomap_algorithm":
+            partitioning = CommunityDetectionAlgorithms.infomapAlgorithmPartioning
+        else:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+
+        self.original_communities[algorithm].update(
+            partitioning(self.original_network_ig, list_of_seeds=missing_seeds)
+        )
+
     #####################################################
     #### 3. Get the baseline neighborhood structure #####
     #####################################################
 
     def getBaselineNeighborhoodStructure(self):
-        start_points = generateRWRstarts(
+        # Reproducible from the seed list, kept as lists next to the string keys
+        self.rwr_start_points = generateRWRstarts(
             self.random_seed_list, self.original_network_nx
         )
-        for start in start_points:
+        for start in self.rwr_start_points:
             p = randomWalkWithRestart(
                 G=self.original_network_nx,
                 seed_nodes=start,
@@ -163,5 +196,7 @@ class OriginalNetwork:
 
     def getBaselineGlobalNetworkProperties(self):
         self.original_global_structure = generateGlobalStructureMetrics(
-            self.original_network_nx, samples=100
+            np.asarray(self.original_network_ig.get_edgelist(), dtype=np.int64),
+            samples=100,
+            num_nodes=self.original_network_ig.vcount(),
         )
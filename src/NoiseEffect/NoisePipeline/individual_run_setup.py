@@ -8,11 +8,14 @@ from NoiseEffect.NoisePipeline.recovery import NoisyNetworkRecovery
 
 
 class IndividualAnalysis:
-    def __init__(self, network_request, noise_information, random_seed_list):
+    def __init__(
+        self, network_request, noise_information, random_seed_list, adaptive_seeds=None
+    ):
         # Initialize with the following parameters
         self.network_request = network_request
         self.noise_information = noise_information
         self.random_seed_list = random_seed_list
+        self.adaptive_seeds = adaptive_seeds
 
         # Following attributes house subclasses and results used during analysis
         self.original_network = None
@@ -36,7 +39,9 @@ class IndividualAnalysis:
     def run(self):
         # 1. Create ground truth network
         self.original_network = OriginalNetwork(
-            self.network_request, self.random_seed_list
+            self.network_request,
+            self.random_seed_list,
+            adaptive_seeds=self.adaptive_seeds,
         )
         self.original_network.generateEvaluationBaseline()
 
@@ -25,6 +25,12 @@ class PerturbedEdges:
         )
         num_noise_repeats = self.noise_information.get("num_repeats", 3)
 
+        # With adaptive repeats only the minimum is generated upfront, the
+        # recovery adds further repeats per noise level via addRepeat
+        adaptive_repeats = self.noise_information.get("adaptive_repeats")
+        if adaptive_repeats is not None:
+            num_noise_repeats = adaptive_repeats.get("min_repeats", 3)
+
         for percentage in modification_percentages:
             num_modify = self._calcualteNumberOfEdgesToModify(percentage)
 
@@ -39,6 +45,26 @@ class PerturbedEdges:
                     num_modify
                 )
 
+    def addRepeat(self, modification_type, percentage, repetition):
+        """
+        Generates one more perturbed edge set of the given type and noise level
+        and returns its marker.
+        """
+        num_modify = self._calcualteNumberOfEdgesToModify(percentage)
+        marker = f"{percentage}_{repetition}"
+
+        if modification_type == "added_edges":
+            self.random_added_edges_dict[marker] = self._randomEdgesToAdd(num_modify)
+        elif modification_type == "removed_edges":
+            self.random_removed_edges_dict[marker] = self._randomEdgesToRemove(
+                num_modify
+            )
+        else:
+            raise ValueError(
+                "modification_type must be 'added_edges' or 'removed_edges'"
+            )
+        return marker
+
     ### 1 Calcualtes how many edges shall be modified ###
     def _calcualteNumberOfEdgesToModify(self, percentage):
         num_edges = len(self.original_network.edges)
@@ -8,7 +8,10 @@ from NoiseEffect.NoisePipeline.RecoveryMethods.LocalStructure.local_structure im
 from NoiseEffect.NoisePipeline.RecoveryMethods.LocalNeighborhood.local_neighborhood import (
     localNeighborhoodAnalysis,
 )
+from NoiseEffect.utils.sequential_sampling import sampleUntilStandardError
+from NoiseEffect.utils.noise_grid import refineNoiseGrid
 import igraph as ig
+import numpy as np
 
 
 class NoisyNetworkRecovery:
@@ -43,43 +46,158 @@ class NoisyNetworkRecovery:
                 "modification_type must be 'added_edges' or 'removed_edges'"
             )
 
-        for perturbation in edge_dict:
-            # Create entry in the results dictionary
-            self.recovery_results[modification_type][f"noise_{perturbation}"] = {}
+        for perturbation in list(edge_dict):
+            self._recoverPerturbation(
+                modification_type, perturbation, edge_dict[perturbation]
+            )
 
-            # Generating the modified network
-            edges_to_modify = edge_dict[perturbation]
+        noise_information = self.noisy_network_sets_obj.noise_information
+        noise_levels = noise_information.get("noise_levels", [0.1, 0.5])
 
-            if modification_type == "added_edges":
-                modified_network_nx, modified_network_ig = (
-                    self._NetworkWithAddedEdgesObject(edges_to_modify)
-                )
-            elif modification_type == "removed_edges":
-                modified_network_nx, modified_network_ig = (
-                    self._NetworkWithRemovedEdgesObject(edges_to_modify)
+        adaptive_repeats = noise_information.get("adaptive_repeats")
+        if adaptive_repeats is not None:
+            for percentage in noise_levels:
+                self._addRepeatsUntilStable(
+                    modification_type, percentage, adaptive_repeats
                 )
 
-            # Recover Local Structure
-            self._recoverLocalStructure(
-                G_nx=modified_network_nx,
-                G_ig=modified_network_ig,
-                modification_type=modification_type,
-                perturbation=perturbation,
+        # Bisect the noise grid where the metric breaks down, e.g.
+        # {"metric": "local_structure.leiden_algorithm.ari.mean",
+        #  "resolution": 0.01, "threshold": 0.5, "max_levels": 20}
+        adaptive_levels = noise_information.get("adaptive_levels")
+        if adaptive_levels is not None:
+            refinement = refineNoiseGrid(
+                lambda percentage: self._evaluateNoiseLevel(
+                    modification_type, percentage, adaptive_levels["metric"]
+                ),
+                initial_levels=noise_levels,
+                resolution=adaptive_levels["resolution"],
+                threshold=adaptive_levels.get("threshold"),
+                max_levels=adaptive_levels.get("max_levels"),
             )
+            summary = self.recovery_results.setdefault("adaptive_levels", {})
+            summary[modification_type] = refinement
 
-            # Recover Local Neighborhood
-            self._recoverLocalNeighborhood(
-                G_nx=modified_network_nx,
-                modification_type=modification_type,
-                perturbation=perturbation,
+    def _recoverPerturbation(self, modification_type, perturbation, edges_to_modify):
+        # Create entry in the results dictionary
+        self.recovery_results[modification_type][f"noise_{perturbation}"] = {}
+
+        # Generating the modified network
+        if modification_type == "added_edges":
+            modified_network_nx, modified_network_ig = (
+                self._NetworkWithAddedEdgesObject(edges_to_modify)
             )
+        elif modification_type == "removed_edges":
+            modified_network_nx, modified_network_ig = (
+                self._NetworkWithRemovedEdgesObject(edges_to_modify)
+            )
+
+        # Recover Local Structure
+        self._recoverLocalStructure(
+            G_nx=modified_network_nx,
+            G_ig=modified_network_ig,
+            modification_type=modification_type,
+            perturbation=perturbation,
+        )
+
+        # Recover Local Neighborhood
+        self._recoverLocalNeighborhood(
+            G_nx=modified_network_nx,
+            modification_type=modification_type,
+            perturbation=perturbation,
+        )
+
+        # Recover Global Structure
+        self._recoverGlobalStructure(
+            G_ig=modified_network_ig,
+            modification_type=modification_type,
+            perturbation=perturbation,
+        )
+
+    ###############################################
+    # Sequential sampling of the noise repeats ####
+    # Adds repeats to a noise level while the #####
+    # target metric's standard error is too high ##
+    ###############################################
+
+    def _addRepeatsUntilStable(self, modification_type, percentage, adaptive_repeats):
+        """
+        `adaptive_repeats` holds 'metric' (dotted path into the results of one
+        perturbation, e.g. 'local_structure.leiden_algorithm.ari.mean'),
+        'max_standard_error', 'min_repeats' and 'max_repeats'.
+        """
 
-            # Recover Global Structure
-            self._recoverGlobalStructure(
-                G_nx=modified_network_nx,
-                modification_type=modification_type,
-                perturbation=perturbation,
+        def _evaluateRepeats(repetitions):
+            values = []
+            for repetition in repetitions:
+                key = self._ensureRepeat(modification_type, percentage, repetition)
+                values.append(
+                    _metricFromResults(
+                        self.recovery_results[modification_type][key],
+                        adaptive_repeats["metric"],
+                    )
+                )
+            return values
+
+        sampling = sampleUntilStandardError(
+            _evaluateRepeats,
+            range(adaptive_repeats.get("max_repeats", 30)),
+            max_standard_error=adaptive_repeats["max_standard_error"],
+            min_samples=adaptive_repeats.get("min_repeats", 3),
+        )
+        summary = self.recovery_results.setdefault("adaptive_repeats", {})
+        summary.setdefault(modification_type, {})[f"noise_{percentage}"] = {
+            "num_repeats": len(sampling["used"]),
+            "mean": float(np.nanmean(sampling["values"]))
+            if np.any(~np.isnan(sampling["values"]))
+            else None,
+            "standard_error": sampling["standard_error"],
+            "converged": sampling["converged"],
+        }
+
+    ###############################################
+    # Adaptive refinement of the noise levels #####
+    ###############################################
+
+    def _evaluateNoiseLevel(self, modification_type, percentage, metric_path):
+        """
+        Mean of the metric over all repeats of a noise level. Levels that were
+        not part of the initial grid are generated and evaluated first.
+        """
+        noise_information = self.noisy_network_sets_obj.noise_information
+        prefix = f"noise_{percentage}_"
+        if not any(key.startswith(prefix) for key in self.recovery_results[modification_type]):
+            adaptive_repeats = noise_information.get("adaptive_repeats")
+            if adaptive_repeats is not None:
+                self._addRepeatsUntilStable(modification_type, percentage, adaptive_repeats)
+            else:
+                for repetition in range(noise_information.get("num_repeats", 3)):
+                    self._ensureRepeat(modification_type, percentage, repetition)
+
+        values = [
+            _metricFromResults(results, metric_path)
+            for key, results in self.recovery_results[modification_type].items()
+            if key.startswith(prefix)
+        ]
+        values = np.asarray(values, dtype=float)
+        return float(np.nanmean(values)) if np.any(~np.isnan(values)) else np.nan
+
+    def _ensureRepeat(self, modification_type, percentage, repetition):
+        """Generates and evaluates a repeat unless it exists; returns its result key."""
+        key = f"noise_{percentage}_{repetition}"
+        if key not in self.recovery_results[modification_type]:
+            marker = self.noisy_network_sets_obj.addRepeat(
+                modification_type, percentage, repetition
+            )
+            self._recoverPerturbation(
+                modification_type, marker, self._edgeDict(modification_type)[marker]
             )
+        return key
+
+    def _edgeDict(self, modification_type):
+        if modification_type == "added_edges":
+            return self.noisy_network_sets_obj.random_added_edges_dict
+        return self.noisy_network_sets_obj.random_removed_edges_dict
 
     ###############################################
     ####### Network properties evaluated ##########
@@ -91,6 +209,8 @@ class NoisyNetworkRecovery:
             G_ig=G_ig,
             original_communities=self.original_network_obj.original_communities,
             random_seed_list=self.original_network_obj.random_seed_list,
+            adaptive_seeds=self.original_network_obj.adaptive_seeds,
+            extend_baseline=self.original_network_obj.extendBaselineCommunities,
         )
         self.recovery_results[modification_type][f"noise_{perturbation}"][
             "local_structure"
@@ -101,6 +221,7 @@ class NoisyNetworkRecovery:
         neighborhood_results = localNeighborhoodAnalysis(
             modified_network_nx=G_nx,
             original_neighborhood=original_neighborhood,
+            start_points=self.original_network_obj.rwr_start_points or None,
         )
         self.recovery_results[modification_type][f"noise_{perturbation}"][
             "local_neighborhood"
@@ -108,11 +229,16 @@ class NoisyNetworkRecovery:
 
     def _recoverGlobalStructure(
         self,
-        G_nx,
+        G_ig,
         modification_type,
         perturbation,
     ):
-        global_structure_results = generateGlobalStructureMetrics(G_nx, samples=100)
+        # Array backend: igraph's edge list is read in C, no networkx traversal
+        global_structure_results = generateGlobalStructureMetrics(
+            np.asarray(G_ig.get_edgelist(), dtype=np.int64),
+            samples=100,
+            num_nodes=G_ig.vcount(),
+        )
         self.recovery_results[modification_type][f"noise_{perturbation}"][
             "global_structure"
         ] = global_structure_results
@@ -127,3 +253,11 @@ class NoisyNetworkRecovery:
         modified_network_nx = self.original_network_obj.original_network_nx.copy()
         modified_network_nx.remove_edges_from(edges_to_modify)
         return modified_network_nx, ig.Graph.from_networkx(modified_network_nx)
+
+
+def _metricFromResults(results, metric_path):
+    """Looks up a dotted path like 'local_structure.leiden_algorithm.ari.mean'."""
+    value = results
+    for key in metric_path.split("."):
+        value = value[key]
+    return np.nan if value is None else float(value)
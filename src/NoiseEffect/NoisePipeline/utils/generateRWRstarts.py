@@ -1,49 +1,88 @@
 import numpy as np
-import random
+import networkx as nx
+from scipy import sparse
+from NoiseEffect.utils.sparse_graph import adjacencyMatrix
 
 
-def generateRWRstarts(random_seed_list, G):
+def generateRWRstarts(random_seed_list, G, rng=None):
+    """
+    Start node sets for the random walks with restart.
+
+    For as many nodes as there are random seeds, spread evenly over the
+    degree ranking, three start sets are generated: the node itself, a random
+    half of the node plus its first neighbors, and a random half of the node
+    plus its first and second neighbors.
+
+    Args:
+        random_seed_list (list[int]): Determines the number of start nodes and,
+            without `rng`, seeds the sampling of the neighbor halves.
+        G (networkx.Graph | scipy.sparse matrix): The network. For a sparse
+            matrix, nodes are the row indices.
+        rng (np.random.Generator, optional): Generator for the sampling.
+            Defaults to `np.random.default_rng(random_seed_list)`, so the same
+            seed list always gives the same start sets.
+
+    Returns:
+        list[list]: The single node, first neighbor and second neighbor start
+        sets, in this order.
+    """
+    if rng is None:
+        rng = np.random.default_rng(list(random_seed_list))
+    # int32 so neighbor counts in the sparse products can not overflow
+    A = adjacencyMatrix(G).astype(np.int32)
+    nodelist = list(G.nodes()) if isinstance(G, nx.Graph) else None
     number_of_starts = len(random_seed_list)
-    degree_sequence = sorted(
-        G.nodes(),
-        key=lambda n: G.degree(n),
-        reverse=True,
-    )
+
+    # Stable sort by decreasing degree, ties keep the node order
+    degrees = np.diff(A.indptr)
+    degree_sequence = np.argsort(-degrees, kind="stable")
+
     # Single node start points
     start_point_indices = np.linspace(
         0, len(degree_sequence) - 1, number_of_starts, dtype=int
     )
-    single_start_points = [[degree_sequence[i]] for i in start_point_indices]
-    # Single node plus first neighbors
-    first_neighbors_full = []
-    count = 0
-    for node in single_start_points:
-        count += 1
-        neighbors = list(G.neighbors(node[0]))
-        first_neighbors_full.append(list(set(node + neighbors)))
-    # print(f"Generated first neighbor start points for {count} nodes.")
-
-    second_neighbors_full = []
-    count = 0
-    for list_of_nodes in first_neighbors_full:
-        count += 1
-        second_neighbors = []
-        for first_neighbor in list_of_nodes[1:]:
-            second_neighbors.extend(G.neighbors(first_neighbor))
-        second_neighbors_full.append(list(set(list_of_nodes + second_neighbors)))
-    # print(f"Generated second neighbor start points for {count} nodes.")
-
-    first_neighbors_start_points = [
-        random.sample(_, max(1, len(_) // 2)) for _ in first_neighbors_full
-    ]
-    second_neighbors_start_points = [
-        random.sample(_, max(1, len(_) // 2)) for _ in second_neighbors_full
-    ]
+    start_nodes = degree_sequence[start_point_indices]
+
+    # Start node plus first neighbors, one column per start node
+    start_indicator = sparse.csr_matrix(
+        (
+            np.ones(number_of_starts, dtype=np.int32),
+            (start_nodes, np.arange(number_of_starts)),
+        ),
+        shape=(A.shape[0], number_of_starts),
+    )
+    first_neighbors = ((A @ start_indicator + start_indicator) > 0).tocsc()
+    # Second neighbors of all start nodes in one sparse product
+    first_neighbors = first_neighbors.astype(np.int32)
+    second_neighbors = ((A @ first_neighbors + first_neighbors) > 0).tocsc()
+
+    single_start_points = [[node] for node in start_nodes]
+    first_neighbors_start_points = _sampleHalfOfColumns(first_neighbors, rng)
+    second_neighbors_start_points = _sampleHalfOfColumns(second_neighbors, rng)
 
     all_start_points = (
         single_start_points
         + first_neighbors_start_points
         + second_neighbors_start_points
     )
+    return [_toNodeLabels(start, nodelist) for start in all_start_points]
+
+
+def _sampleHalfOfColumns(indicator, rng):
+    """Random half (at least one) of the nodes in every column of a CSC indicator matrix."""
+    indicator.sort_indices()
+    samples = []
+    for column in range(indicator.shape[1]):
+        candidates = indicator.indices[
+            indicator.indptr[column] : indicator.indptr[column + 1]
+        ]
+        samples.append(
+            rng.choice(candidates, size=max(1, len(candidates) // 2), replace=False)
+        )
+    return samples
+
 
-    return all_start_points
+def _toNodeLabels(indices, nodelist):
+    if nodelist is None:
+        return [int(i) for i in indices]
+    return [nodelist[i] for i in indices]
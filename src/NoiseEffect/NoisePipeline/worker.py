@@ -2,7 +2,7 @@ import traceback
 import NoiseEffect.NoisePipeline.individual_run_setup as ia
 
 
-def workerFunction(request, random_seed_list):
+def workerFunction(request, random_seed_list, adaptive_seeds=None):
     try:
         noise_information = request.pop("noise_information")
         network_request = request
@@ -11,6 +11,7 @@ def workerFunction(request, random_seed_list):
             network_request=network_request,
             noise_information=noise_information,
             random_seed_list=random_seed_list,
+            adaptive_seeds=adaptive_seeds,
         )
         analysis_obj.run()
         return (analysis_obj.identifier, analysis_obj.results)
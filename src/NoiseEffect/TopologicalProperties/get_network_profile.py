@@ -4,12 +4,18 @@ import scipy.stats as stats
 import scipy.sparse.linalg as sla
 import igraph as ig
 import random
+from NoiseEffect.utils.sparse_graph import networkxToCSR
+from NoiseEffect.utils.path_lengths import sampledPathLengths
+from NoiseEffect.utils.hyperanf import hyperANF
 
 
-def get_network_profile(G):
+def get_network_profile(G, path_length_method="sampled"):
     """
     Calculates a comprehensive topology profile for a NetworkX graph G.
     Uses SciPy and igraph for heavy computations to ensure extreme efficiency.
+
+    path_length_method: "sampled" (BFS from 500 GCC nodes) or "hyperanf"
+    (HyperLogLog sketch over all reachable pairs, for large or fragmented graphs).
     """
     # Ensure graph is undirected and simple for baseline metrics
     G = nx.Graph(G)
@@ -65,19 +71,22 @@ def get_network_profile(G):
     modularity = partition.modularity
 
     print("Calculating path lengths and efficiency...")
-    # 5. PATH LENGTH / EFFICIENCY (Approximation via Sampling)
+    # 5. PATH LENGTH / EFFICIENCY (Approximation via Sampling or HyperANF)
     # Exact all-pairs shortest paths on 20k nodes is O(V*E) and takes too long.
     # We sample 500 nodes from the GCC to get a highly accurate approximation.
-    sample_size = min(500, len(gcc_nodes))
-    sampled_nodes = random.sample(list(gcc_nodes), sample_size)
-
-    path_lengths = []
-    for node in sampled_nodes:
-        # nx.single_source_shortest_path_length is highly optimized C-like BFS in NetworkX
-        lengths = nx.single_source_shortest_path_length(G, node)
-        path_lengths.extend(lengths.values())
-
-    avg_path_length = np.mean(path_lengths) if path_lengths else 0.0
+    A, nodelist = networkxToCSR(G)
+    if path_length_method == "hyperanf":
+        path_lengths = hyperANF(A)
+    else:
+        sample_size = min(500, len(gcc_nodes))
+        sampled_nodes = random.sample(list(gcc_nodes), sample_size)
+
+        # All sampled sources in chunked multi-source BFS calls on the CSR matrix
+        node_to_idx = {node: i for i, node in enumerate(nodelist)}
+        path_lengths = sampledPathLengths(
+            A, sources=[node_to_idx[node] for node in sampled_nodes]
+        )
+    avg_path_length = path_lengths["mean"]
 
     # Compile results
     profile = {
@@ -94,6 +103,7 @@ def get_network_profile(G):
         "Algebraic_Connectivity": alg_connectivity,
         "Spectral_Gap": spectral_gap,
         "Avg_Path_Length_Sampled": avg_path_length,
+        "Effective_Diameter_Sampled": path_lengths["effective_diameter"],
     }
 
     return profile
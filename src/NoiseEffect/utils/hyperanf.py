@@ -0,0 +1,149 @@
+import numpy as np
+from scipy import sparse
+
+from NoiseEffect.utils.path_lengths import effectiveDiameter
+
+# Adjacency entries gathered per block, bounds the (entries x registers) buffer
+_EDGE_BLOCK_SIZE = 250_000
+
+
+def hyperANF(
+    A: sparse.csr_matrix,
+    log2_registers: int = 7,
+    max_iterations: int = None,
+    seed: int = 0,
+) -> dict:
+    """
+    Estimates the neighbourhood function and distance statistics of a graph
+    with HyperLogLog counters (HyperANF).
+
+    Every node keeps a HyperLogLog counter of the nodes within distance t.
+    One iteration merges each counter with those of its neighbours (a
+    register-wise maximum over the CSR rows), so after t iterations the sum
+    of all counter estimates approximates the number of pairs at distance
+    <= t. The graph is processed in as many passes over the edges as its
+    diameter, independent of how fragmented it is.
+
+    Args:
+        A (scipy.sparse.csr_matrix): Symmetric adjacency matrix.
+        log2_registers (int, optional): log2 of the registers per counter. The
+            relative error of a single counter is about 1.04 / sqrt(2**log2_registers);
+            all nodes of a component share the same counter in the end, so
+            this is also the error of the totals. Defaults to 7 (about 9%).
+        max_iterations (int, optional): Upper limit on the number of
+            iterations. Defaults to running until no counter changes.
+        seed (int, optional): Seed of the node hash function. Defaults to 0.
+
+    Returns:
+        dict: A dictionary containing:
+            - 'neighbourhood_function' (np.ndarray): Estimated number of
+              ordered pairs at distance <= t, indexed by t.
+            - 'distance_distribution' (np.ndarray): Estimated number of pairs
+              per distance (entry 0 is 0).
+            - 'mean' (float): Estimated mean distance over reachable pairs.
+            - 'effective_diameter' (float): Interpolated distance within which
+              90% of the reachable pairs lie.
+            - 'num_reachable_pairs' (float): Estimated number of ordered pairs
+              (source, target), target != source, connected by a path.
+            - 'iterations' (int): Number of iterations run.
+    """
+    A = sparse.csr_matrix(A)
+    num_nodes = A.shape[0]
+    registers = _initialRegisters(num_nodes, log2_registers, seed)
+
+    neighbourhood_function = [_estimateTotal(registers)]
+    iterations = 0
+    while max_iterations is None or iterations < max_iterations:
+        updated = _mergeNeighbours(A, registers)
+        iterations += 1
+        if np.array_equal(updated, registers):
+            break
+        registers = updated
+        neighbourhood_function.append(_estimateTotal(registers))
+
+    # Counter estimates are noisy; the true function is non-decreasing
+    neighbourhood_function = np.maximum.accumulate(neighbourhood_function)
+    distribution = np.diff(neighbourhood_function, prepend=neighbourhood_function[0])
+
+    num_pairs = distribution.sum()
+    mean = (
+        float(np.dot(np.arange(distribution.size), distribution) / num_pairs)
+        if num_pairs > 0
+        else 0.0
+    )
+    return {
+        "neighbourhood_function": neighbourhood_function,
+        "distance_distribution": distribution,
+        "mean": mean,
+        "effective_diameter": effectiveDiameter(distribution),
+        "num_reachable_pairs": float(num_pairs),
+        "iterations": iterations,
+    }
+
+
+####### Helper functions ##########
+
+
+def _hash64(values, seed):
+    """SplitMix64 finaliser, vectorised over an integer array."""
+    with np.errstate(over="ignore"):
+        z = values.astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15) * np.uint64(seed + 1)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return z ^ (z >> np.uint64(31))
+
+
+def _initialRegisters(num_nodes, log2_registers, seed):
+    """HyperLogLog counters that each contain only their own node."""
+    num_registers = 1 << log2_registers
+    hashes = _hash64(np.arange(num_nodes), seed)
+    register_index = (hashes & np.uint64(num_registers - 1)).astype(np.int64)
+    remaining = hashes >> np.uint64(log2_registers)
+
+    # Rank = position of the lowest set bit of the remaining hash bits
+    lowest_bit = remaining & (~remaining + np.uint64(1))
+    rank = np.full(num_nodes, 64 - log2_registers + 1, dtype=np.uint8)
+    nonzero = remaining != 0
+    rank[nonzero] = np.log2(lowest_bit[nonzero].astype(np.float64)).astype(np.uint8) + 1
+
+    registers = np.zeros((num_nodes, num_registers), dtype=np.uint8)
+    registers[np.arange(num_nodes), register_index] = rank
+    return registers
+
+
+def _mergeNeighbours(A, registers):
+    """Register-wise maximum of every counter with its neighbours' counters."""
+    updated = registers.copy()
+    degrees = np.diff(A.indptr)
+    mean_degree = max(1, int(degrees.mean())) if degrees.size else 1
+    rows_per_block = max(1, _EDGE_BLOCK_SIZE // mean_degree)
+
+    for start in range(0, A.shape[0], rows_per_block):
+        stop = min(start + rows_per_block, A.shape[0])
+        has_neighbours = np.flatnonzero(degrees[start:stop]) + start
+        if has_neighbours.size == 0:
+            continue
+        gathered = registers[A.indices[A.indptr[start] : A.indptr[stop]]]
+        # reduceat needs offsets into the gathered block, empty rows excluded
+        offsets = A.indptr[has_neighbours] - A.indptr[start]
+        neighbour_max = np.maximum.reduceat(gathered, offsets, axis=0)
+        updated[has_neighbours] = np.maximum(updated[has_neighbours], neighbour_max)
+    return updated
+
+
+def _estimateTotal(registers):
+    """Sum of the HyperLogLog cardinality estimates of all counters."""
+    num_registers = registers.shape[1]
+    if num_registers >= 128:
+        alpha = 0.7213 / (1 + 1.079 / num_registers)
+    else:
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(num_registers, 0.7213)
+
+    harmonic = np.ldexp(1.0, -registers.astype(np.int32)).sum(axis=1)
+    estimates = alpha * num_registers**2 / harmonic
+
+    # Linear counting for small cardinalities
+    empty = (registers == 0).sum(axis=1)
+    small = (estimates <= 2.5 * num_registers) & (empty > 0)
+    estimates[small] = num_registers * np.log(num_registers / empty[small])
+    return float(estimates.sum())
@@ -0,0 +1,107 @@
+import numpy as np
+
+
+def refineNoiseGrid(
+    evaluate,
+    initial_levels,
+    resolution: float,
+    threshold: float = None,
+    max_levels: int = None,
+) -> dict:
+    """
+    Adaptively refines a grid of noise levels around the breakdown of a metric.
+
+    Starting from a coarse grid, the interval in which the metric crosses
+    `threshold` (or, without a threshold, changes the most) is bisected until
+    it is narrower than `resolution`. Only the midpoints that are needed are
+    evaluated, so a breakdown point is located with far fewer perturbed
+    networks than on a dense fixed grid.
+
+    Args:
+        evaluate (callable): Maps a noise level to the (mean) metric value.
+        initial_levels (list[float]): The coarse starting grid.
+        resolution (float): Target width of the refined interval.
+        threshold (float, optional): Metric value that defines the breakdown.
+            Defaults to None (refine where the metric changes most).
+        max_levels (int, optional): Upper limit on the total number of
+            evaluated levels. Defaults to no limit.
+
+    Returns:
+        dict: A dictionary containing:
+            - 'levels' (list[float]): All evaluated noise levels, sorted.
+            - 'values' (list[float]): The metric value per level.
+            - 'interval' (tuple | None): The final refined interval.
+            - 'threshold_estimate' (float | None): Linearly interpolated noise
+              level at which the metric crosses `threshold`.
+    """
+    evaluated = {}
+    for level in sorted(set(initial_levels)):
+        if max_levels is not None and len(evaluated) >= max_levels:
+            break
+        evaluated[level] = float(evaluate(level))
+
+    interval = _intervalToRefine(evaluated, threshold)
+    while interval is not None and interval[1] - interval[0] > resolution:
+        if max_levels is not None and len(evaluated) >= max_levels:
+            break
+        # Rounding keeps the levels usable as dictionary keys and file names
+        midpoint = round((interval[0] + interval[1]) / 2, 10)
+        if midpoint in evaluated:
+            break
+        evaluated[midpoint] = float(evaluate(midpoint))
+        interval = _intervalToRefine(evaluated, threshold)
+
+    levels = sorted(evaluated)
+    threshold_estimate = None
+    if threshold is not None and interval is not None:
+        threshold_estimate = _interpolateCrossing(
+            interval, evaluated[interval[0]], evaluated[interval[1]], threshold
+        )
+
+    return {
+        "levels": levels,
+        "values": [evaluated[level] for level in levels],
+        "interval": interval,
+        "threshold_estimate": threshold_estimate,
+    }
+
+
+####### Helper functions ##########
+
+
+def _intervalToRefine(evaluated, threshold):
+    """
+    Picks the neighbouring pair of levels to bisect next: the widest interval
+    containing a threshold crossing, or the one with the largest change.
+    """
+    levels = sorted(evaluated)
+    if len(levels) < 2:
+        return None
+
+    best_interval, best_score = None, -np.inf
+    for lower, upper in zip(levels[:-1], levels[1:]):
+        value_lower, value_upper = evaluated[lower], evaluated[upper]
+        if np.isnan(value_lower) or np.isnan(value_upper):
+            continue
+
+        if threshold is not None:
+            crosses = (value_lower - threshold) * (value_upper - threshold) <= 0
+            if not crosses:
+                continue
+            score = upper - lower
+        else:
+            score = abs(value_upper - value_lower)
+
+        if score > best_score:
+            best_interval, best_score = (lower, upper), score
+
+    return best_interval
+
+
+def _interpolateCrossing(interval, value_lower, value_upper, threshold):
+    """Noise level at which the straight line between both values hits the threshold."""
+    lower, upper = interval
+    if value_upper == value_lower:
+        return (lower + upper) / 2
+    fraction = (threshold - value_lower) / (value_upper - value_lower)
+    return float(lower + fraction * (upper - lower))
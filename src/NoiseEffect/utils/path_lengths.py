@@ -0,0 +1,112 @@
+import numpy as np
+from joblib import Parallel, delayed
+from scipy import sparse
+from scipy.sparse.csgraph import shortest_path
+
+# Sources per BFS call, bounds the (sources x nodes) distance block in memory
+_SOURCE_CHUNK_SIZE = 64
+
+
+def sampledPathLengths(
+    A: sparse.csr_matrix,
+    sources=None,
+    n_jobs: int = 1,
+    chunk_size: int = _SOURCE_CHUNK_SIZE,
+) -> dict:
+    """
+    Shortest path length statistics from a set of BFS sources.
+
+    All sources of a chunk are handled by one call to scipy's compiled BFS;
+    only the histogram of distances is kept per chunk, so memory stays at
+    one (chunk_size x nodes) block. Chunks can be distributed over worker
+    processes for large graphs.
+
+    Args:
+        A (scipy.sparse.csr_matrix): Symmetric, unweighted adjacency matrix.
+        sources (array-like, optional): Node indices to start the BFS from.
+            Defaults to all nodes (exact statistics).
+        n_jobs (int, optional): Number of worker processes. Defaults to 1.
+        chunk_size (int, optional): Sources per BFS call.
+
+    Returns:
+        dict: A dictionary containing:
+            - 'mean' (float): Mean distance over all reachable pairs
+              (source, target) with target != source.
+            - 'distance_distribution' (np.ndarray): Number of such pairs per
+              distance, indexed by distance (entry 0 is always 0).
+            - 'effective_diameter' (float): Interpolated distance within which
+              90% of the reachable pairs lie.
+            - 'num_unreachable' (int): Number of (source, target) pairs without
+              a path.
+    """
+    A = sparse.csr_matrix(A)
+    if sources is None:
+        sources = np.arange(A.shape[0])
+    sources = np.asarray(sources, dtype=np.int64)
+    chunks = [
+        sources[start : start + chunk_size]
+        for start in range(0, sources.size, max(1, chunk_size))
+    ]
+
+    if n_jobs == 1 or len(chunks) < 2:
+        histograms = [_distanceHistogram(A, chunk) for chunk in chunks]
+    else:
+        histograms = Parallel(n_jobs=n_jobs)(
+            delayed(_distanceHistogram)(A, chunk) for chunk in chunks
+        )
+
+    num_unreachable = sum(unreachable for _, unreachable in histograms)
+    length = max((histogram.size for histogram, _ in histograms), default=1)
+    distribution = np.zeros(length, dtype=np.int64)
+    for histogram, _ in histograms:
+        distribution[: histogram.size] += histogram
+    distribution[0] = 0
+
+    num_pairs = distribution.sum()
+    mean = (
+        float(np.dot(np.arange(distribution.size), distribution) / num_pairs)
+        if num_pairs
+        else 0.0
+    )
+    return {
+        "mean": mean,
+        "distance_distribution": distribution,
+        "effective_diameter": effectiveDiameter(distribution),
+        "num_unreachable": int(num_unreachable),
+    }
+
+
+def effectiveDiameter(distance_distribution, quantile: float = 0.9) -> float:
+    """
+    Distance within which `quantile` of all pairs lie, linearly interpolated
+    between integer distances.
+
+    Args:
+        distance_distribution (np.ndarray): Number of pairs per distance.
+        quantile (float, optional): Fraction of pairs. Defaults to 0.9.
+
+    Returns:
+        float: The effective diameter (0 for an empty distribution).
+    """
+    counts = np.asarray(distance_distribution, dtype=np.float64)
+    total = counts.sum()
+    if total == 0:
+        return 0.0
+    cumulative = np.cumsum(counts) / total
+    d = int(np.searchsorted(cumulative, quantile))
+    if d == 0:
+        return 0.0
+    below = cumulative[d - 1]
+    return float(d - 1 + (quantile - below) / (cumulative[d] - below))
+
+
+####### Helper functions ##########
+
+
+def _distanceHistogram(A, sources):
+    """Histogram of finite BFS distances from `sources` and the number of unreachable pairs."""
+    # A is symmetric, so directed=True avoids an internal symmetrisation
+    distances = shortest_path(A, directed=True, unweighted=True, indices=sources)
+    finite = np.isfinite(distances)
+    histogram = np.bincount(distances[finite].astype(np.int64))
+    return histogram, int(distances.size - finite.sum())
@@ -0,0 +1,454 @@
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+from scipy.sparse.linalg import cg, splu
+
+RWR_SOLVERS = ("power", "cg", "direct", "auto")
+
+# Automatic solver selection, see `selectRWRSolver`
+_POWER_MIN_RESTART = 0.5
+_DIRECT_MAX_NODES = 5_000
+_DIRECT_MIN_RHS = 100
+
+
+def initialVector(p_init, nodelist) -> np.ndarray:
+    """
+    Start vector for the RWR iteration in `nodelist` order.
+
+    Args:
+        p_init (dict | np.ndarray): Previous solution, either as node -> score
+            dictionary (nodes missing from it start at 0) or as a vector that
+            is already in `nodelist` order.
+        nodelist (list): Node order of the matrix.
+
+    Returns:
+        np.ndarray: The start vector.
+    """
+    if isinstance(p_init, dict):
+        return np.fromiter(
+            (p_init.get(node, 0.0) for node in nodelist),
+            dtype=np.float64,
+            count=len(nodelist),
+        )
+    return np.asarray(p_init, dtype=np.float64).copy()
+
+
+def powerIterationRWR(M, p0, restart, tol, max_iter, p_init=None):
+    """
+    Iterates p <- (1 - restart) * M @ p + restart * p0 until the L1 change is
+    below `tol`.
+
+    Starting from a previous solution (e.g. the baseline network's) instead
+    of p0 needs far fewer iterations when M changed only a little.
+
+    Args:
+        M (scipy.sparse matrix): Propagation matrix (P.T for row normalization,
+            S for symmetric normalization).
+        p0 (np.ndarray): Restart vector.
+        restart (float): Restart probability.
+        tol (float): Convergence tolerance on the L1 change.
+        max_iter (int): Maximum number of iterations.
+        p_init (np.ndarray, optional): Start vector. Defaults to p0.
+
+    Returns:
+        tuple: (p, converged, iterations)
+    """
+    p = p0.copy() if p_init is None else p_init
+    converged = False
+    i = -1
+    for i in range(max_iter):
+        p_next = (1 - restart) * M @ p + restart * p0
+        if np.linalg.norm(p_next - p, ord=1) < tol:
+            converged = True
+            break
+        p = p_next
+    return p, converged, i + 1
+
+
+def powerIterationRWRBatch(M, P0, restart, tol, max_iter, P_init=None):
+    """
+    Power iteration for several restart vectors at once (the columns of P0).
+
+    Only the columns that have not converged yet are multiplied in each
+    iteration, and every column stops at exactly the iterate at which the
+    single-vector `powerIterationRWR` would stop.
+
+    Args:
+        M (scipy.sparse matrix): Propagation matrix.
+        P0 (np.ndarray): Restart vectors, shape (n, groups).
+        restart, tol, max_iter: As in `powerIterationRWR`.
+        P_init (np.ndarray, optional): Start vectors. Defaults to P0.
+
+    Returns:
+        tuple: (P, converged per column, iterations per column)
+    """
+    P = P0.copy() if P_init is None else np.array(P_init, dtype=np.float64)
+    num_columns = P0.shape[1]
+    converged = np.zeros(num_columns, dtype=bool)
+    iterations = np.zeros(num_columns, dtype=int)
+    active = np.arange(num_columns)
+    # Same operation order as the single version, so columns match it exactly
+    M_scaled = (1 - restart) * M
+
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        P_next = M_scaled @ P[:, active] + restart * P0[:, active]
+        difference = P_next - P[:, active]
+        change = np.array(
+            [np.linalg.norm(difference[:, j], ord=1) for j in range(active.size)]
+        )
+        iterations[active] += 1
+
+        done = change < tol
+        converged[active[done]] = True
+        # Converged columns keep their previous iterate, as in the single version
+        P[:, active[~done]] = P_next[:, ~done]
+        active = active[~done]
+    return P, converged, iterations
+
+
+def localPushRWR(M, p0, restart, tol, max_iter, p_init):
+    """
+    Corrects a previous RWR solution by pushing only its residual.
+
+    For the fixed point p = (1 - restart) * M @ p + restart * p0 and a
+    previous solution p_init (computed on a slightly different matrix), the
+    residual r = (1 - restart) * M @ p_init + restart * p0 - p_init is only
+    non-zero around the changed edges. The correction d solves
+    d = (1 - restart) * M @ d + r; it is built by repeatedly moving the
+    residual of all nodes above tol / n into d and spreading it to their
+    neighbors, which only touches the columns of M of those nodes.
+
+    Args:
+        M (scipy.sparse matrix): Propagation matrix.
+        p0 (np.ndarray): Restart vector.
+        restart (float): Restart probability.
+        tol (float): Stop once the L1 norm of the residual is below tol.
+        max_iter (int): Maximum number of push rounds.
+        p_init (np.ndarray): Previous solution.
+
+    Returns:
+        tuple: (p, converged, push rounds)
+    """
+    M = sparse.csc_matrix(M)
+    n = M.shape[0]
+    p = np.array(p_init, dtype=np.float64)
+    residual = (1 - restart) * (M @ p) + restart * p0 - p
+    threshold = tol / max(n, 1)
+
+    converged = False
+    rounds = 0
+    while rounds < max_iter:
+        if np.abs(residual).sum() < tol:
+            converged = True
+            break
+        active = np.flatnonzero(np.abs(residual) > threshold)
+        if active.size == 0:
+            converged = True
+            break
+        pushed = residual[active]
+        p[active] += pushed
+        residual[active] = 0.0
+        residual += (1 - restart) * (M[:, active] @ pushed)
+        rounds += 1
+    return p, converged, rounds
+
+
+def componentLabels(A):
+    """
+    Connected component of every node of the graph with adjacency matrix A.
+
+    Compute it once where A is built and pass it to `solveRWR`,
+    `seedComponentNodes` and `localPushOnSeedComponents` for all seed
+    groups on that graph.
+
+    Args:
+        A (scipy.sparse matrix): Symmetric adjacency matrix.
+
+    Returns:
+        np.ndarray: Component label per node.
+    """
+    _, labels = connected_components(A, directed=False)
+    return labels
+
+
+def seedComponentNodes(labels, seed_indices):
+    """
+    Indices of the nodes in the connected components of the seeds.
+
+    Args:
+        labels (np.ndarray): Component label per node, see `componentLabels`.
+        seed_indices (array-like): Indices of the seed nodes.
+
+    Returns:
+        np.ndarray: Sorted node indices.
+    """
+    return np.flatnonzero(np.isin(labels, labels[seed_indices]))
+
+
+def localPushOnSeedComponents(
+    A, p0, restart, tol, max_iter, p_init, normalization="row", labels=None
+):
+    """
+    `localPushRWR` restricted to the connected components of the seeds.
+
+    Args:
+        A (scipy.sparse matrix): Symmetric adjacency matrix without isolated nodes.
+        p0 (np.ndarray): Restart vector, its non-zero entries are the seeds.
+        restart, tol, max_iter: As in `localPushRWR`.
+        p_init (np.ndarray): Previous solution on all nodes.
+        normalization (str, optional): "row" or "symmetric".
+        labels (np.ndarray, optional): Component labels of A. Computed if
+            not given.
+
+    Returns:
+        dict: 'p', 'converged', 'iterations' (push rounds), 'residual' (L1
+            norm of the fixed-point residual) and 'solved_nodes'.
+    """
+    A = sparse.csr_matrix(A)
+    n = A.shape[0]
+    if labels is None:
+        labels = componentLabels(A)
+    nodes = seedComponentNodes(labels, np.flatnonzero(p0))
+    if nodes.size < n:
+        A = A[nodes][:, nodes]
+        p0 = p0[nodes]
+        p_init = np.asarray(p_init)[nodes]
+    M = rwrOperator(A, normalization)
+    p_sub, converged, rounds = localPushRWR(M, p0, restart, tol, max_iter, p_init)
+    residual = np.abs(p_sub - (1 - restart) * (M @ p_sub) - restart * p0).sum()
+
+    p = np.zeros(n)
+    p[nodes] = p_sub
+    return {
+        "p": p,
+        "converged": converged,
+        "iterations": rounds,
+        "residual": float(residual),
+        "solved_nodes": nodes.size,
+    }
+
+
+def rwrOperator(A, normalization):
+    """
+    Propagation matrix M of p <- (1 - restart) * M @ p + restart * p0.
+
+    Args:
+        A (scipy.sparse matrix): Symmetric adjacency matrix without isolated nodes.
+        normalization (str): "row" (M = (D^-1 A).T) or "symmetric"
+            (M = D^-1/2 A D^-1/2).
+
+    Returns:
+        scipy.sparse matrix: M
+    """
+    d = A @ np.ones(A.shape[0])
+    if normalization == "row":
+        return (sparse.diags(1.0 / d) @ A).T
+    if normalization == "symmetric":
+        d_inv_sqrt = sparse.diags(1.0 / np.sqrt(d))
+        return d_inv_sqrt @ A @ d_inv_sqrt
+    raise ValueError(f"Unknown normalization: {normalization}")
+
+
+def selectRWRSolver(num_nodes, num_rhs, restart):
+    """
+    Picks a solver for `solver="auto"`.
+
+    With a high restart probability the power iteration contracts by
+    (1 - restart) per step and needs only a handful of sparse products. A
+    sparse LU factorization pays off when it is shared by many right-hand
+    sides of a small graph; otherwise conjugate gradient needs about
+    sqrt(1 / restart) times fewer products than the power iteration.
+    """
+    if restart >= _POWER_MIN_RESTART:
+        return "power"
+    if num_nodes <= _DIRECT_MAX_NODES and num_rhs >= _DIRECT_MIN_RHS:
+        return "direct"
+    return "cg"
+
+
+def solveRWR(
+    A,
+    P0,
+    restart,
+    tol,
+    max_iter,
+    normalization="row",
+    solver="auto",
+    P_init=None,
+    labels=None,
+):
+    """
+    Solves (I - (1 - restart) M) P = restart * P0 for every column of P0.
+
+    Both normalizations lead to a symmetric positive definite system: for
+    the symmetric one K = I - (1 - restart) S directly, for the row one
+    K = D - (1 - restart) A with P = D @ Y. "cg" solves K with conjugate
+    gradient (Jacobi preconditioned) per column, "direct" factorizes K once
+    (sparse LU) and reuses it for all columns, "power" is the fixed-point
+    iteration. Factorizations of scale-free graphs fill in quickly, so
+    "direct" is only worth it for small graphs.
+
+    Each column is only solved on the connected components that contain its
+    seeds (the non-zero entries of the column) and is zero everywhere else,
+    so fragmented graphs are proportionally cheaper. Columns whose seeds lie
+    in the same components are solved together.
+
+    Args:
+        A (scipy.sparse matrix): Symmetric adjacency matrix without isolated nodes.
+        P0 (np.ndarray): Restart vectors, shape (n, groups).
+        restart, tol, max_iter: As in `powerIterationRWR`; for "cg", tol is
+            the relative residual tolerance.
+        normalization (str, optional): "row" or "symmetric".
+        solver (str, optional): One of RWR_SOLVERS. Defaults to "auto".
+        P_init (np.ndarray, optional): Start vectors ("power" and "cg").
+        labels (np.ndarray, optional): Component labels of A, see
+            `componentLabels`. Computed if not given.
+
+    Returns:
+        dict: A dictionary containing:
+            - 'P' (np.ndarray): The solutions, shape (n, groups).
+            - 'converged' (np.ndarray): Per column.
+            - 'iterations' (np.ndarray): Sparse products (or solves) per column.
+            - 'residual' (np.ndarray): L1 norm of the fixed-point residual per column.
+            - 'solver' (str): The solver that was used.
+            - 'solved_nodes' (np.ndarray): Size of the subgraph solved per column.
+    """
+    if solver not in RWR_SOLVERS:
+        raise ValueError(f"Unknown solver: {solver}")
+    A = sparse.csr_matrix(A)
+    n, num_rhs = P0.shape
+
+    # No probability mass ever leaves the components of the seeds, so every
+    # column is solved on the subgraph of its seeds' components only
+    if labels is None:
+        labels = componentLabels(A)
+    column_groups = {}
+    for column in range(num_rhs):
+        seed_components = tuple(np.unique(labels[P0[:, column] != 0]))
+        column_groups.setdefault(seed_components, []).append(column)
+    subgraphs = [
+        (np.flatnonzero(np.isin(labels, components)), columns)
+        for components, columns in column_groups.items()
+    ]
+    if solver == "auto":
+        largest = max((nodes.size for nodes, _ in subgraphs), default=n)
+        solver = selectRWRSolver(largest, num_rhs, restart)
+
+    P = np.zeros_like(P0, dtype=np.float64)
+    converged = np.zeros(num_rhs, dtype=bool)
+    iterations = np.zeros(num_rhs, dtype=int)
+    residual = np.zeros(num_rhs)
+    solved_nodes = np.zeros(num_rhs, dtype=int)
+    for nodes, columns in subgraphs:
+        if nodes.size == n:
+            # Seeds in a component spanning the whole graph, nothing to cut
+            A_sub, rows = A, slice(None)
+        else:
+            A_sub, rows = A[nodes][:, nodes], nodes
+        solution = _solveRWRSystem(
+            A_sub,
+            P0[rows][:, columns],
+            restart,
+            tol,
+            max_iter,
+            normalization,
+            solver,
+            None if P_init is None else P_init[rows][:, columns],
+        )
+        if nodes.size == n:
+            P[:, columns] = solution["P"]
+        else:
+            P[np.ix_(nodes, columns)] = solution["P"]
+        converged[columns] = solution["converged"]
+        iterations[columns] = solution["iterations"]
+        residual[columns] = solution["residual"]
+        solved_nodes[columns] = nodes.size
+    return {
+        "P": P,
+        "converged": converged,
+        "iterations": iterations,
+        "residual": residual,
+        "solver": solver,
+        "solved_nodes": solved_nodes,
+    }
+
+
+####### Helper functions ##########
+
+
+def _solveRWRSystem(A, P0, restart, tol, max_iter, normalization, solver, P_init):
+    """`solveRWR` with a fixed solver on a graph without isolated nodes."""
+    n, num_rhs = P0.shape
+    M = rwrOperator(A, normalization)
+
+    if solver == "power":
+        P, converged, iterations = powerIterationRWRBatch(
+            M, P0, restart, tol, max_iter, P_init=P_init
+        )
+    else:
+        # SPD system K @ Y = restart * P0 with P = scale * Y
+        if normalization == "row":
+            scale = A @ np.ones(n)
+            K = sparse.diags(scale) - (1 - restart) * A
+        else:
+            scale = np.ones(n)
+            K = sparse.identity(n) - (1 - restart) * M
+        B = restart * P0
+
+        if solver == "direct":
+            # Symmetric fill-reducing ordering without pivoting, K is SPD
+            factorization = splu(
+                sparse.csc_matrix(K),
+                permc_spec="MMD_AT_PLUS_A",
+                diag_pivot_thresh=0.0,
+                options={"SymmetricMode": True},
+            )
+            Y = factorization.solve(B)
+            converged = np.ones(num_rhs, dtype=bool)
+            iterations = np.ones(num_rhs, dtype=int)
+        else:
+            K = sparse.csr_matrix(K)
+            # Jacobi preconditioner
+            preconditioner = sparse.diags(1.0 / K.diagonal())
+            Y = np.empty_like(B)
+            converged = np.zeros(num_rhs, dtype=bool)
+            iterations = np.zeros(num_rhs, dtype=int)
+            for column in range(num_rhs):
+                counter = _IterationCounter()
+                x0 = None if P_init is None else P_init[:, column] / scale
+                Y[:, column], info = cg(
+                    K,
+                    B[:, column],
+                    x0=x0,
+                    rtol=tol,
+                    atol=0.0,
+                    maxiter=max_iter,
+                    M=preconditioner,
+                    callback=counter,
+                )
+                converged[column] = info == 0
+                iterations[column] = counter.count
+        P = scale[:, None] * Y
+
+    difference = P - (1 - restart) * (M @ P) - restart * P0
+    residual = np.array(
+        [np.linalg.norm(difference[:, j], ord=1) for j in range(num_rhs)]
+    )
+    return {
+        "P": P,
+        "converged": converged,
+        "iterations": iterations,
+        "residual": residual,
+    }
+
+
+class _IterationCounter:
+    """Callback counting the iterations of scipy's iterative solvers."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, _):
+        self.count += 1
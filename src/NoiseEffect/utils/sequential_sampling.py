@@ -0,0 +1,134 @@
+import numpy as np
+from scipy import stats
+
+
+def standardError(values) -> float:
+    """
+    Standard error of the mean, ignoring NaN values (infinite for fewer than
+    two valid values).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    if values.size < 2:
+        return np.inf
+    return float(np.std(values, ddof=1) / np.sqrt(values.size))
+
+
+def confidenceHalfWidth(values, confidence: float = 0.95) -> float:
+    """
+    Half-width of the Student-t confidence interval of the mean.
+
+    NaN values are ignored. Fewer than two valid values give an infinite
+    half-width, i.e. the estimate is never considered stable.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    if values.size < 2:
+        return np.inf
+    return float(stats.t.ppf(0.5 + confidence / 2, df=values.size - 1) * standardError(values))
+
+
+def sampleUntilConfident(
+    evaluate_batch,
+    candidates,
+    tolerance: float,
+    batch_size: int = 5,
+    min_samples: int = 10,
+    max_samples: int = None,
+    confidence: float = 0.95,
+) -> dict:
+    """
+    Evaluates candidates in batches until the confidence interval of the
+    running mean is narrow enough.
+
+    Candidates are consumed in their given order, so the outcome is
+    reproducible for a fixed candidate list (e.g. a list of random seeds).
+
+    Args:
+        evaluate_batch (callable): Takes a list of candidates and returns one
+            value per candidate (NaN for unusable results).
+        candidates (list): Pool of candidates, e.g. random seeds.
+        tolerance (float): Stop once the half-width of the confidence
+            interval of the mean is at most this value.
+        batch_size (int, optional): Candidates added per step. Defaults to 5.
+        min_samples (int, optional): Candidates evaluated before the first
+            check. Defaults to 10.
+        max_samples (int, optional): Upper limit on evaluated candidates.
+            Defaults to all candidates.
+        confidence (float, optional): Confidence level. Defaults to 0.95.
+
+    Returns:
+        dict: A dictionary containing:
+            - 'used' (list): The evaluated candidates.
+            - 'values' (np.ndarray): Their values.
+            - 'half_width' (float): Final half-width of the confidence interval.
+            - 'converged' (bool): Whether the tolerance was reached.
+    """
+    return _sampleUntil(
+        evaluate_batch,
+        candidates,
+        lambda values: confidenceHalfWidth(values, confidence),
+        tolerance,
+        batch_size,
+        min_samples,
+        max_samples,
+    )
+
+
+def sampleUntilStandardError(
+    evaluate_batch,
+    candidates,
+    max_standard_error: float,
+    batch_size: int = 1,
+    min_samples: int = 3,
+    max_samples: int = None,
+) -> dict:
+    """
+    Same as `sampleUntilConfident`, but stops once the standard error of the
+    mean is at most `max_standard_error`. The returned 'half_width' entry is
+    replaced by 'standard_error'.
+    """
+    result = _sampleUntil(
+        evaluate_batch,
+        candidates,
+        standardError,
+        max_standard_error,
+        batch_size,
+        min_samples,
+        max_samples,
+    )
+    result["standard_error"] = result.pop("half_width")
+    return result
+
+
+####### Helper functions ##########
+
+
+def _sampleUntil(
+    evaluate_batch, candidates, spread, tolerance, batch_size, min_samples, max_samples
+) -> dict:
+    """Batched sampling loop shared by the stopping rules above."""
+    candidates = list(candidates)
+    if max_samples is None or max_samples > len(candidates):
+        max_samples = len(candidates)
+    batch_size = max(1, batch_size)
+
+    used, values = [], []
+    next_size = min(max(min_samples, 1), max_samples)
+    current_spread = np.inf
+    while len(used) < max_samples:
+        batch = candidates[len(used) : next_size]
+        values.extend(evaluate_batch(batch))
+        used.extend(batch)
+
+        current_spread = spread(values)
+        if current_spread <= tolerance:
+            break
+        next_size = min(len(used) + batch_size, max_samples)
+
+    return {
+        "used": used,
+        "values": np.asarray(values, dtype=np.float64),
+        "half_width": current_spread,
+        "converged": bool(current_spread <= tolerance),
+    }
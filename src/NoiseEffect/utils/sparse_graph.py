@@ -0,0 +1,79 @@
+import numpy as np
+import networkx as nx
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+
+def edgesToCSR(edges, num_nodes: int) -> sparse.csr_matrix:
+    """
+    Symmetric, unweighted CSR adjacency matrix from an edge array.
+
+    Duplicate edges and self-loops are dropped, so the result is the
+    adjacency matrix of the corresponding simple undirected graph.
+
+    Args:
+        edges (np.ndarray): Array of shape (m, 2) with integer node indices.
+        num_nodes (int): Number of nodes (indices 0..num_nodes-1).
+
+    Returns:
+        scipy.sparse.csr_matrix: The int8 adjacency matrix with sorted indices.
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    rows = np.concatenate([edges[:, 0], edges[:, 1]])
+    cols = np.concatenate([edges[:, 1], edges[:, 0]])
+    A = sparse.csr_matrix(
+        (np.ones(rows.size, dtype=np.int8), (rows, cols)), shape=(num_nodes, num_nodes)
+    )
+    # Duplicates are summed on conversion, reset them to 1
+    A.data[:] = 1
+    A.sort_indices()
+    return A
+
+
+def networkxToCSR(G: nx.Graph):
+    """
+    CSR adjacency matrix of a networkx graph.
+
+    Returns:
+        tuple: (adjacency matrix, list of nodes in matrix order)
+    """
+    nodelist = list(G.nodes())
+    node_to_idx = {node: i for i, node in enumerate(nodelist)}
+    edges = np.fromiter(
+        (node_to_idx[node] for edge in G.edges() for node in edge[:2]),
+        dtype=np.int64,
+        count=2 * G.number_of_edges(),
+    ).reshape(-1, 2)
+    return edgesToCSR(edges, len(nodelist)), nodelist
+
+
+def adjacencyMatrix(graph, num_nodes: int = None) -> sparse.csr_matrix:
+    """
+    CSR adjacency matrix of a networkx graph, a scipy sparse matrix or an
+    edge array.
+
+    Args:
+        graph: networkx graph (nodes in `G.nodes()` order), sparse adjacency
+            matrix (returned as CSR) or (m, 2) array of integer node indices.
+        num_nodes (int, optional): Number of nodes, required for edge arrays.
+
+    Returns:
+        scipy.sparse.csr_matrix: The adjacency matrix.
+    """
+    if isinstance(graph, nx.Graph):
+        return networkxToCSR(graph)[0]
+    if sparse.issparse(graph):
+        return sparse.csr_matrix(graph)
+    if num_nodes is None:
+        raise ValueError("num_nodes is required for an edge array.")
+    return edgesToCSR(graph, num_nodes)
+
+
+def largestComponent(A: sparse.csr_matrix) -> np.ndarray:
+    """Sorted node indices of the largest connected component."""
+    if A.shape[0] == 0:
+        return np.array([], dtype=np.int64)
+    _, labels = connected_components(A, directed=False)
+    largest = np.argmax(np.bincount(labels))
+    return np.flatnonzero(labels == largest)
@@ -0,0 +1,36 @@
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from NoiseEffect.CommunityDetection.compare_perturbed_to_baseline import (
+    evaluate_network_repeats,
+)
+
+
+def test_parallel_repeats_give_the_serial_results():
+    """
+    The memory-mapped worker path returns the serial results, in repeat order.
+    """
+    G = nx.planted_partition_graph(3, 20, 0.5, 0.05, seed=0)
+    edges = np.array(G.edges())
+    rng = np.random.default_rng(0)
+    frames = []
+    for repeat in (3, 0, 1):
+        keep = rng.random(len(edges)) > 0.1
+        frames.append(
+            pd.DataFrame(
+                {"source": edges[keep, 0], "target": edges[keep, 1], "repeat": repeat}
+            )
+        )
+    df_pert = pd.concat(frames, ignore_index=True)
+    baseline_labels = np.repeat(np.arange(3), 20)
+
+    serial = evaluate_network_repeats(
+        df_pert, 60, "louvain", [0, 1, 2], baseline_labels, n_jobs=1
+    )
+    parallel = evaluate_network_repeats(
+        df_pert, 60, "louvain", [0, 1, 2], baseline_labels, n_jobs=2
+    )
+
+    assert [result["repeat_id"] for result in serial] == [0, 1, 3]
+    pd.testing.assert_frame_equal(pd.DataFrame(parallel), pd.DataFrame(serial))
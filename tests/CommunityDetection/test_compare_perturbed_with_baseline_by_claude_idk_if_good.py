@@ -0,0 +1,24 @@
+import networkx as nx
+
+from NoiseEffect.CommunityDetection.compare_perturbed_with_baseline_by_claude_idk_if_good import (
+    load_baseline_index,
+    read_baseline_edges,
+)
+from NoiseEffect.NoiseNetworks.main import _loadBaseline
+
+
+def test_baseline_index_matches_noise_networks(tmp_path):
+    """
+    A baseline written by nx.write_edgelist (whitespace separated, with edge
+    data) gets the node indices of NoiseNetworks._loadBaseline.
+    """
+    G = nx.relabel_nodes(nx.karate_club_graph(), lambda node: f"GENE{node}")
+    baseline_path = tmp_path / "baseline.txt"
+    nx.write_edgelist(G, baseline_path)
+
+    edges = read_baseline_edges(baseline_path)
+    assert len(edges) == G.number_of_edges()
+    assert not edges.isna().any().any()
+
+    _, _, node_to_idx = _loadBaseline(str(baseline_path))
+    assert load_baseline_index(baseline_path) == node_to_idx
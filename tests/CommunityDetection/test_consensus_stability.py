@@ -0,0 +1,63 @@
+import igraph as ig
+import numpy as np
+import pytest
+
+from NoiseEffect.CommunityDetection.consensus_stability import (
+    coAssociationMatrix,
+    coAssociationOnEdges,
+    consensusStability,
+)
+
+
+@pytest.fixture
+def barbell_graph():
+    """
+    Two triangles {0, 1, 2} and {3, 4, 5} connected by the bridge (2, 3).
+    """
+    return ig.Graph(n=6, edges=[(0, 1), (0, 2), (1, 2), (3, 4), (3, 5), (4, 5), (2, 3)])
+
+
+def test_consensus_of_agreeing_runs(barbell_graph):
+    """
+    If all runs agree, every edge is fully stable and the consensus is that partition.
+    """
+    labels = np.array([[0, 0, 0, 1, 1, 1]] * 4)
+    result = consensusStability(barbell_graph, labels)
+
+    assert np.allclose(result["edge_stability"], 1.0)
+    assert np.allclose(result["node_stability"], 1.0)
+    assert sorted(map(sorted, result["consensus_partition"])) == [[0, 1, 2], [3, 4, 5]]
+
+
+def test_unstable_bridge(barbell_graph):
+    """
+    A bridge that is co-clustered in half of the runs has stability 0 and is
+    cut in the consensus partition.
+    """
+    labels = np.array(
+        [
+            [0, 0, 0, 1, 1, 1],
+            [0, 0, 0, 0, 0, 0],
+        ]
+    )
+    result = consensusStability(barbell_graph, labels)
+
+    bridge = [i for i, (u, v) in enumerate(result["edges"]) if {u, v} == {2, 3}][0]
+    assert result["edge_coassociation"][bridge] == pytest.approx(0.5)
+    assert result["edge_stability"][bridge] == pytest.approx(0.0)
+    assert result["node_stability"][2] < result["node_stability"][0]
+    assert len(result["consensus_partition"]) == 2
+
+
+def test_edge_coassociation_matches_full_matrix():
+    """
+    The edge-restricted co-association equals the entries of the sparse
+    co-association matrix.
+    """
+    rng = np.random.default_rng(0)
+    labels = rng.integers(0, 4, size=(5, 40))
+    edges = rng.integers(0, 40, size=(100, 2))
+
+    matrix = coAssociationMatrix(labels)
+    expected = np.asarray(matrix[edges[:, 0], edges[:, 1]]).ravel()
+    assert np.allclose(coAssociationOnEdges(labels, edges), expected)
@@ -0,0 +1,153 @@
+import igraph as ig
+import networkx as nx
+import numpy as np
+import pytest
+
+from NoiseEffect.CommunityDetection.detection_algorithms import (
+    _membershipToPartition,
+    labelPropagationPartitioning,
+    leidenAlgorithmPartioning,
+    leidenResolutionSweep,
+    louvainPartioning,
+)
+
+SEEDS = [0, 1, 7, 42]
+
+
+@pytest.fixture
+def interleaved_barbell():
+    """
+    Two 6-cliques joined by the bridge (0, 1). The communities are the even
+    and the odd vertex IDs, so a partition left in permuted IDs would mix them.
+    """
+    evens, odds = list(range(0, 12, 2)), list(range(1, 12, 2))
+    edges = [
+        (u, v) for clique in (evens, odds) for u in clique for v in clique if u < v
+    ]
+    return ig.Graph(n=12, edges=edges + [(0, 1)])
+
+
+@pytest.mark.parametrize(
+    "partitioning", [louvainPartioning, labelPropagationPartitioning]
+)
+def test_partitions_in_original_vertex_ids(interleaved_barbell, partitioning):
+    """
+    The communities found on the shuffled graphs are reported in the
+    vertex IDs of the input graph, which is left unchanged.
+    """
+    edges_before = interleaved_barbell.get_edgelist()
+    partitions = partitioning(interleaved_barbell, SEEDS)
+
+    assert list(partitions) == SEEDS
+    for partition in partitions.values():
+        assert {frozenset(community) for community in partition} == {
+            frozenset(range(0, 12, 2)),
+            frozenset(range(1, 12, 2)),
+        }
+    assert interleaved_barbell.get_edgelist() == edges_before
+
+
+@pytest.mark.parametrize(
+    "partitioning", [louvainPartioning, labelPropagationPartitioning]
+)
+def test_parallel_seeds_give_the_serial_partitions(partitioning):
+    """
+    Every seed gives the same partition with one and with two worker processes.
+    """
+    graph = ig.Graph.Famous("Zachary")
+    serial = partitioning(graph, SEEDS, n_jobs=1)
+    parallel = partitioning(graph, SEEDS, n_jobs=2)
+    assert parallel == serial
+
+
+def test_membership_to_partition():
+    """
+    Communities are ordered by their ID and hold the vertices carrying it.
+    """
+    partition = _membershipToPartition(np.array([2, 0, 2, 1, 0]))
+    assert partition == [{1, 4}, {3}, {0, 2}]
+
+
+@pytest.fixture
+def planted_partition():
+    """
+    Four planted communities of 50 vertices each.
+    """
+    G = nx.planted_partition_graph(4, 50, 0.3, 0.02, seed=0)
+    return ig.Graph(n=200, edges=list(G.edges()))
+
+
+def _membership(partition, n):
+    membership = np.empty(n, dtype=int)
+    for community_id, community in enumerate(partition):
+        membership[list(community)] = community_id
+    return membership
+
+
+def test_igraph_modularity_matches_leidenalg(planted_partition):
+    """
+    The igraph backend optimizes modularity (as CPM with degree weights and
+    resolution 1 / 2m) as well as leidenalg does.
+    """
+    for seed in SEEDS:
+        qualities = {
+            backend: planted_partition.modularity(
+                _membership(
+                    leidenAlgorithmPartioning(
+                        planted_partition, [seed], 2, backend=backend
+                    )[seed],
+                    200,
+                )
+            )
+            for backend in ("igraph", "leidenalg")
+        }
+        assert qualities["igraph"] == pytest.approx(qualities["leidenalg"], abs=1e-3)
+        assert qualities["igraph"] > 0.5
+
+
+def test_cpm_resolution_controls_the_number_of_communities(planted_partition):
+    """
+    With CPM, a higher resolution never gives fewer communities: from one
+    community at a low resolution up to singletons at resolution 1.
+    """
+    resolutions = [0.01, 0.05, 0.1, 0.2, 0.5, 1.0]
+    sweep = leidenResolutionSweep(planted_partition, SEEDS, resolutions)
+
+    for seed in SEEDS:
+        counts = [len(sweep[resolution][seed]) for resolution in resolutions]
+        assert counts == sorted(counts)
+        assert counts[0] == 1
+        assert counts[-1] == 200
+        # The planted communities are found in between
+        assert 4 in counts
+
+
+@pytest.mark.parametrize("backend", ["igraph", "leidenalg"])
+def test_sweep_keyed_by_resolution_and_seed(planted_partition, backend):
+    """
+    The sweep holds a full partition for every resolution and seed, equal to
+    a single run with that resolution.
+    """
+    resolutions = [0.05, 0.1]
+    sweep = leidenResolutionSweep(
+        planted_partition, [3, 5], resolutions, backend=backend
+    )
+
+    assert list(sweep) == resolutions
+    for resolution in resolutions:
+        assert list(sweep[resolution]) == [3, 5]
+        for seed, partition in sweep[resolution].items():
+            assert sorted(v for community in partition for v in community) == list(
+                range(200)
+            )
+            assert (
+                partition
+                == leidenAlgorithmPartioning(
+                    planted_partition,
+                    [seed],
+                    2,
+                    backend=backend,
+                    objective_function="CPM",
+                    resolution=resolution,
+                )[seed]
+            )
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+from sklearn.metrics import adjusted_mutual_info_score
+
+from NoiseEffect.CommunityDetection.mutual_information import (
+    adjustedMutualInformation,
+    expectedMutualInformation,
+)
+
+
+@pytest.mark.parametrize(
+    "n_nodes, n_clusters_1, n_clusters_2, seed",
+    [
+        (50, 3, 4, 0),
+        (200, 20, 15, 1),
+        (500, 150, 120, 2),
+        (1000, 5, 300, 3),
+    ],
+)
+def test_matches_sklearn(n_nodes, n_clusters_1, n_clusters_2, seed):
+    """
+    The exact mode has to reproduce sklearn's AMI on random labelings with
+    both few and many clusters.
+    """
+    rng = np.random.default_rng(seed)
+    labels_1 = rng.integers(0, n_clusters_1, n_nodes)
+    labels_2 = rng.integers(0, n_clusters_2, n_nodes)
+
+    expected = adjusted_mutual_info_score(labels_1, labels_2)
+    assert adjustedMutualInformation(labels_1, labels_2) == pytest.approx(
+        expected, abs=1e-10
+    )
+
+
+def test_correlated_partitions_match_sklearn():
+    """
+    Two noisy copies of the same partition give a high AMI, identical to sklearn.
+    """
+    rng = np.random.default_rng(7)
+    truth = np.repeat(np.arange(40), 25)
+    noisy = truth.copy()
+    flip = rng.random(truth.size) < 0.2
+    noisy[flip] = rng.integers(0, 40, flip.sum())
+
+    expected = adjusted_mutual_info_score(truth, noisy)
+    assert adjustedMutualInformation(truth, noisy) == pytest.approx(expected, abs=1e-10)
+    assert expected > 0.5
+
+
+def test_identical_and_trivial_partitions():
+    """
+    Identical partitions have AMI 1, and the single-cluster limit case follows sklearn.
+    """
+    labels = np.array([0, 0, 1, 1, 2, 2])
+    assert adjustedMutualInformation(labels, labels) == pytest.approx(1.0)
+    assert adjustedMutualInformation(np.zeros(6), np.zeros(6)) == 1.0
+    assert adjustedMutualInformation(np.zeros(6), labels) == pytest.approx(
+        adjusted_mutual_info_score(np.zeros(6), labels)
+    )
+
+
+def test_approximation_stays_within_tolerance():
+    """
+    The approximate expected mutual information must stay within the
+    requested absolute error of the exact value.
+    """
+    rng = np.random.default_rng(11)
+    sizes_1 = rng.integers(1, 400, 60)
+    sizes_2 = rng.integers(1, 400, 80)
+    n_samples = int(sizes_1.sum())
+    # Both partitions need to cover the same nodes
+    sizes_2 = np.append(sizes_2, max(n_samples - sizes_2.sum(), 0))
+    n_samples = max(n_samples, int(sizes_2.sum()))
+    sizes_1 = np.append(sizes_1, n_samples - sizes_1.sum())
+
+    exact = expectedMutualInformation(sizes_1, sizes_2, n_samples)
+    for tol in (1e-2, 1e-4, 1e-6):
+        approx = expectedMutualInformation(sizes_1, sizes_2, n_samples, approximation_tol=tol)
+        assert abs(approx - exact) <= tol
+
+
+def test_mismatched_lengths_raise():
+    """
+    Labelings over a different number of nodes cannot be compared.
+    """
+    with pytest.raises(ValueError):
+        adjustedMutualInformation([0, 1, 1], [0, 1])
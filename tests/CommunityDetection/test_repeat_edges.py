@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+
+from NoiseEffect.CommunityDetection.repeat_edges import RepeatEdgeArrays
+
+
+def _shuffledRepeats():
+    """
+    Edges of the repeats 2, 0 and 5, written out of order.
+    """
+    return pd.DataFrame(
+        {
+            "source": [0, 1, 0, 3, 2, 1, 4],
+            "target": [1, 2, 2, 4, 3, 3, 6],
+            "repeat": [2, 0, 2, 5, 0, 2, 5],
+        }
+    )
+
+
+def test_from_data_frame_groups_repeats():
+    """
+    Out-of-order repeats are grouped in ascending repeat order and keep the
+    order of their own edges.
+    """
+    repeat_edges = RepeatEdgeArrays.fromDataFrame(_shuffledRepeats())
+
+    assert repeat_edges.edges.dtype == np.int32
+    assert repeat_edges.offsets.tolist() == [0, 2, 5, 7]
+    assert repeat_edges.repeat_ids.tolist() == [0, 2, 5]
+    assert len(repeat_edges) == 3
+    assert repeat_edges.edgesOf(0).tolist() == [[1, 2], [2, 3]]
+    assert repeat_edges.edgesOf(1).tolist() == [[0, 1], [0, 2], [1, 3]]
+    assert repeat_edges.edgesOf(2).tolist() == [[3, 4], [4, 6]]
+    assert list(repeat_edges.slices()) == [(0, 0, 2), (2, 2, 5), (5, 5, 7)]
+
+
+def test_default_number_of_nodes():
+    """
+    Without n_nodes, the largest node ID over all repeats decides.
+    """
+    assert RepeatEdgeArrays.fromDataFrame(_shuffledRepeats()).n_nodes == 7
+    assert RepeatEdgeArrays.fromDataFrame(_shuffledRepeats(), n_nodes=10).n_nodes == 10
+    empty = RepeatEdgeArrays.fromDataFrame(_shuffledRepeats().iloc[:0])
+    assert empty.n_nodes == 0
+    assert len(empty) == 0
+
+
+def test_memmap_round_trip(tmp_path):
+    """
+    The memory-mapped copy is read-only and holds the same repeats.
+    """
+    repeat_edges = RepeatEdgeArrays.fromDataFrame(_shuffledRepeats())
+    mapped = repeat_edges.toMemmap(tmp_path / "cache")
+
+    assert isinstance(mapped.edges, np.memmap)
+    assert not mapped.edges.flags.writeable
+    np.testing.assert_array_equal(mapped.edges, repeat_edges.edges)
+    np.testing.assert_array_equal(mapped.offsets, repeat_edges.offsets)
+    np.testing.assert_array_equal(mapped.repeat_ids, repeat_edges.repeat_ids)
+    assert mapped.n_nodes == repeat_edges.n_nodes
+    for index in range(len(repeat_edges)):
+        np.testing.assert_array_equal(
+            mapped.edgesOf(index), repeat_edges.edgesOf(index)
+        )
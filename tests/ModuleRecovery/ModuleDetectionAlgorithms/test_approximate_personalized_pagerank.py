@@ -0,0 +1,76 @@
+import networkx as nx
+import pytest
+
+from NoiseEffect.ModuleRecovery.ModuleDetectionAlgorithms.approximate_personalized_pagerank import (
+    approximatePersonalizedPageRank,
+)
+from NoiseEffect.ModuleRecovery.ModuleDetectionAlgorithms.random_walk_with_restart_row_normalization import (
+    randomWalkWithRestartRowNormalization,
+)
+from NoiseEffect.ModuleRecovery.start_algorithm import startAlgorithm
+
+
+@pytest.fixture
+def graph():
+    """
+    A string-labeled scale-free graph.
+    """
+    return nx.relabel_nodes(nx.powerlaw_cluster_graph(500, 3, 0.2, seed=1), str)
+
+
+@pytest.mark.parametrize("restart", [0.85, 0.3])
+def test_scores_within_error_bounds(graph, restart):
+    """
+    Every approximate score underestimates the exact RWR score by at most
+    epsilon * degree, and the total error is the remaining residual.
+    """
+    seeds = ["3", "40", "250"]
+    epsilon = 1e-6
+    approximate = approximatePersonalizedPageRank(
+        graph, seeds, restart=restart, epsilon=epsilon
+    )
+    exact = randomWalkWithRestartRowNormalization(
+        graph, seeds, restart=restart, tol=1e-12
+    )
+
+    total_error = 0.0
+    for node, score in exact.nodes_ranked.items():
+        error = score - approximate.nodes_ranked.get(node, 0.0)
+        assert -1e-9 <= error <= epsilon * graph.degree(node) + 1e-9
+        total_error += error
+    # The seeds' own scores are not part of the ranking
+    assert total_error <= approximate.metadata["residual_l1"] + 1e-9
+    assert approximate.metadata["max_error_per_degree"] == epsilon
+
+
+def test_top_k_matches_exact_rwr(graph):
+    """
+    With a small epsilon the top-k module is the same as the exact one.
+    """
+    seeds = ["10", "11", "12", "13"]
+    approximate = approximatePersonalizedPageRank(graph, seeds, epsilon=1e-9)
+    exact = randomWalkWithRestartRowNormalization(graph, seeds, tol=1e-12)
+    assert approximate.get_top_k(20) == exact.get_top_k(20)
+
+
+def test_only_touches_the_seed_neighborhood():
+    """
+    Nodes of other components are never reached and not ranked.
+    """
+    G = nx.disjoint_union(nx.path_graph(5), nx.complete_graph(50))
+    G = nx.relabel_nodes(G, str)
+    result = approximatePersonalizedPageRank(G, ["0"], epsilon=1e-12)
+
+    assert set(result.nodes_ranked) == {"1", "2", "3", "4"}
+    assert result.metadata["touched_nodes"] == 5
+    assert list(result.nodes_ranked) == ["1", "2", "3", "4"]
+
+
+def test_registered_in_start_algorithm(graph):
+    """
+    The algorithm is available under its name and returns a ranked result.
+    """
+    result = startAlgorithm("ApproximatePersonalizedPageRank", graph, ["1", "2"])
+    assert result.algorithm_type == "ranked"
+    assert "1" not in result.nodes_ranked
+    assert result.metadata["algorithm"] == "ApproximatePersonalizedPageRank"
@@ -0,0 +1,73 @@
+import networkx as nx
+import numpy as np
+import pytest
+import scipy.stats
+
+from NoiseEffect.ModuleRecovery.ModuleDetectionAlgorithms.diamond import (
+    diamond,
+    diamond_incremental,
+    pvalue,
+)
+
+
+@pytest.mark.parametrize("k", [1, 7, 150])
+@pytest.mark.parametrize("s", [1, 12, 80])
+def test_pvalue_is_hypergeometric_tail(k, s):
+    """
+    The p-value is the probability of at least kb seeds among k draws.
+    """
+    N = 5000
+    for kb in range(min(k, s) + 3):
+        expected = scipy.stats.hypergeom.sf(kb - 1, N, s, k)
+        assert pvalue(kb, k, N, s) == pytest.approx(expected, rel=1e-9, abs=1e-300)
+
+
+@pytest.mark.parametrize("graph_seed", range(4))
+@pytest.mark.parametrize("alpha", [1, 2])
+def test_incremental_matches_reference(graph_seed, alpha):
+    """
+    The incremental engine adds the same nodes, in the same order and with
+    the same p-values, as the reference implementation.
+    """
+    rng = np.random.default_rng(graph_seed)
+    G = nx.powerlaw_cluster_graph(600, 2 + graph_seed % 3, 0.3, seed=graph_seed)
+    G = nx.relabel_nodes(G, str)
+    seeds = [str(n) for n in rng.choice(600, size=5 + 10 * graph_seed, replace=False)]
+
+    reference = diamond(G, seeds, X=100, alpha=alpha)
+    incremental = diamond_incremental(G, seeds, X=100, alpha=alpha)
+
+    assert incremental.nodes_diamond == reference.nodes_diamond
+    assert incremental.metadata == reference.metadata
+
+
+def test_incremental_ties_match_reference():
+    """
+    In a regular graph many candidates share the same (kb, k) and p-value.
+    """
+    G = nx.relabel_nodes(nx.random_regular_graph(4, 300, seed=1), str)
+    seeds = ["0", "1", "2"]
+
+    reference = diamond(G, seeds, X=60)
+    incremental = diamond_incremental(G, seeds, X=60)
+    assert incremental.nodes_diamond == reference.nodes_diamond
+
+
+def test_incremental_stops_when_component_is_exhausted():
+    G = nx.relabel_nodes(nx.disjoint_union(nx.path_graph(4), nx.path_graph(10)), str)
+    result = diamond_incremental(G, ["0"], X=50)
+    assert [node for node, _ in result.nodes_diamond] == ["1", "2", "3"]
+    assert diamond_incremental(G, ["missing"]) == []
+
+
+def test_incremental_equal_p_values_match_reference():
+    """
+    In this small dense graph with many seeds, two (kb, k) combinations get
+    exactly the same p-value once and the reference selection decides.
+    """
+    G = nx.relabel_nodes(nx.gnp_random_graph(40, 0.5, seed=0), str)
+    seeds = [str(n) for n in range(0, 40, 2)]
+
+    reference = diamond(G, seeds, X=20)
+    incremental = diamond_incremental(G, seeds, X=20)
+    assert incremental.nodes_diamond == reference.nodes_diamond
@@ -0,0 +1,162 @@
+import os
+import stat
+import sys
+import networkx as nx
+import pytest
+
+from NoiseEffect.ModuleRecovery.ModuleDetectionAlgorithms.domino import (
+    DominoSliceCache,
+    domino,
+)
+from NoiseEffect.ModuleRecovery.ModuleDetectionAlgorithms.domino_runner import (
+    dominoBatch,
+)
+
+
+def _writeExecutable(path, source):
+    with open(path, "w") as f:
+        f.write(f"#!{sys.executable}\n{source}")
+    os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+
+
+@pytest.fixture
+def domino_env(tmp_path):
+    """
+    A DOMINO environment whose slicer counts its calls and whose DOMINO run
+    returns the seeds as a single module. The seed "slow" makes the run
+    hang, the seed "fail" makes it crash and the seed "empty" makes it end
+    without a module. Every run logs its start and end time.
+    """
+    calls_file = tmp_path / "slicer_calls.txt"
+    runs_file = tmp_path / "domino_runs.txt"
+    _writeExecutable(
+        tmp_path / "slicer",
+        f"""
+import sys
+args = dict(zip(sys.argv[1::2], sys.argv[2::2]))
+with open({str(calls_file)!r}, "a") as f:
+    f.write(args["--network_file"] + "\\n")
+with open(args["--output_file"], "w") as f:
+    f.write("slices\\n")
+""",
+    )
+    _writeExecutable(
+        tmp_path / "python",
+        f"""
+import os, sys, time
+start = time.time()
+args = dict(zip(sys.argv[2::2], sys.argv[3::2]))
+assert open(args["--slices_file"]).read() == "slices\\n"
+seeds = [line.strip() for line in open(args["--active_genes_files"])]
+if "gslow" in seeds:
+    time.sleep(60)
+if "gfail" in seeds:
+    print("loading network")
+    sys.exit("something went wrong")
+if "gempty" in seeds:
+    print("no significant module found")
+    sys.exit(0)
+time.sleep(0.3)
+with open({str(runs_file)!r}, "a") as f:
+    f.write(f"{{start}} {{time.time()}} {{args['--output_folder']}}\\n")
+out = os.path.join(args["--output_folder"], "active_genes")
+os.makedirs(out)
+with open(os.path.join(out, "modules.out"), "w") as f:
+    f.write("[" + ", ".join(seeds) + "]\\n")
+""",
+    )
+    return str(tmp_path / "python"), calls_file, runs_file
+
+
+def _slicerCalls(calls_file):
+    return calls_file.read_text().splitlines() if calls_file.exists() else []
+
+
+def test_network_is_sliced_once_for_all_seed_groups(domino_env):
+    DOMINO_PYTHON, calls_file, _ = domino_env
+    G = nx.relabel_nodes(nx.karate_club_graph(), str)
+
+    with DominoSliceCache() as cache:
+        for seeds in (["1", "2"], ["5"], ["30", "31", "32"]):
+            result = domino(G, seeds, DOMINO_PYTHON=DOMINO_PYTHON, slice_cache=cache)
+            assert result.nodes_set == [seeds]
+
+        # A reloaded copy with another edge order is the same network
+        H = nx.Graph()
+        H.add_edges_from((v, u) for u, v in reversed(list(G.edges())))
+        domino(H, ["1"], DOMINO_PYTHON=DOMINO_PYTHON, slice_cache=cache)
+        assert len(_slicerCalls(calls_file)) == 1
+
+        # A perturbed network is sliced separately
+        H.remove_edge("0", "1")
+        domino(H, ["1"], DOMINO_PYTHON=DOMINO_PYTHON, slice_cache=cache)
+        assert len(_slicerCalls(calls_file)) == 2
+        assert len(cache) == 2
+
+    # Leaving the network removes the cached files
+    assert len(cache) == 0
+    for sif_path in _slicerCalls(calls_file):
+        assert not os.path.exists(os.path.dirname(sif_path))
+
+
+def test_without_cache_every_run_slices(domino_env):
+    DOMINO_PYTHON, calls_file, _ = domino_env
+    G = nx.relabel_nodes(nx.karate_club_graph(), str)
+
+    domino(G, ["1"], DOMINO_PYTHON=DOMINO_PYTHON)
+    domino(G, ["2"], DOMINO_PYTHON=DOMINO_PYTHON)
+
+    sif_paths = _slicerCalls(calls_file)
+    assert len(sif_paths) == 2
+    assert not any(os.path.exists(path) for path in sif_paths)
+
+
+def test_batch_runs_seed_groups_in_parallel(domino_env, tmp_path):
+    DOMINO_PYTHON, calls_file, runs_file = domino_env
+    G = nx.relabel_nodes(nx.karate_club_graph(), str)
+    seed_groups = {f"group_{i}": [str(i), str(i + 10)] for i in range(4)}
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+
+    results = dominoBatch(
+        G,
+        seed_groups,
+        DOMINO_PYTHON=DOMINO_PYTHON,
+        n_workers=4,
+        workspace_dir=str(workspace),
+    )
+
+    assert list(results) == list(seed_groups)
+    for seed_id, seeds in seed_groups.items():
+        assert results[seed_id].nodes_set == [seeds]
+        assert results[seed_id].metadata["status"] == "ok"
+    assert len(_slicerCalls(calls_file)) == 1
+
+    # Runs overlap in time and worked in the given workspace, which is cleaned up
+    runs = [line.split() for line in runs_file.read_text().splitlines()]
+    intervals = sorted((float(start), float(end)) for start, end, _ in runs)
+    assert any(
+        later[0] < earlier[1] for earlier, later in zip(intervals, intervals[1:])
+    )
+    assert all(folder.startswith(str(workspace)) for _, _, folder in runs)
+    assert list(workspace.iterdir()) == []
+
+
+def test_batch_reports_timeouts_and_failures(domino_env):
+    DOMINO_PYTHON, _, _ = domino_env
+    G = nx.relabel_nodes(nx.karate_club_graph(), str)
+    seed_groups = {"ok": ["1"], "slow": ["slow"], "fail": ["fail"], "empty": ["empty"]}
+
+    results = dominoBatch(G, seed_groups, DOMINO_PYTHON=DOMINO_PYTHON, timeout=3)
+
+    assert results["ok"].metadata["status"] == "ok"
+    assert "stdout" not in results["ok"].metadata
+    assert results["slow"].metadata["status"] == "timeout"
+    assert results["slow"].nodes_set == set()
+    assert results["fail"].metadata["status"] == "failed"
+    assert "loading network" in results["fail"].metadata["stdout"]
+    assert "something went wrong" in results["fail"].metadata["stderr"]
+    # The reason for a missing module is kept as well
+    assert results["empty"].metadata["status"] == "no_module"
+    assert "no significant module" in results["empty"].metadata["stdout"]
+    assert results["empty"].metadata["stderr"] == ""
@@ -0,0 +1,121 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from NoiseEffect.ModuleRecovery.ModuleDetectionAlgorithms.random_walk_with_restart_batched import (
+    randomWalkWithRestartBatch,
+)
+from NoiseEffect.ModuleRecovery.ModuleDetectionAlgorithms.random_walk_with_restart_row_normalization import (
+    randomWalkWithRestartRowNormalization,
+)
+from NoiseEffect.ModuleRecovery.ModuleDetectionAlgorithms.random_walk_with_restart_symmetric_normalization import (
+    randomWalkWithRestartSymmetricNormalization,
+)
+from NoiseEffect.ModuleRecovery.run_algorithm_and_compare import (
+    _runBatchedRWRAndSaveResults,
+)
+
+
+@pytest.fixture
+def graph_and_groups():
+    """
+    A string-labeled graph and seed groups of different sizes.
+    """
+    G = nx.relabel_nodes(nx.powerlaw_cluster_graph(300, 3, 0.2, seed=1), str)
+    rng = np.random.default_rng(0)
+    groups = {
+        f"group_{i}": [str(n) for n in rng.choice(300, size=size, replace=False)]
+        for i, size in enumerate([1, 3, 10, 25])
+    }
+    return G, groups
+
+
+@pytest.mark.parametrize(
+    "normalization, single_rwr",
+    [
+        ("row", randomWalkWithRestartRowNormalization),
+        ("symmetric", randomWalkWithRestartSymmetricNormalization),
+    ],
+)
+def test_batch_matches_single_group_calls(graph_and_groups, normalization, single_rwr):
+    """
+    Every column of the batch stops at the same iterate as a separate call.
+    """
+    G, groups = graph_and_groups
+    batch = randomWalkWithRestartBatch(G, groups, normalization=normalization)
+
+    assert list(batch) == list(groups)
+    for seed_id, seed_nodes in groups.items():
+        single = single_rwr(G, seed_nodes)
+        assert batch[seed_id].nodes_ranked == single.nodes_ranked
+        assert batch[seed_id].metadata == single.metadata
+
+
+def test_batch_warm_start_and_local_push(graph_and_groups):
+    """
+    Warm-started and pushed groups converge to the cold-start scores.
+    """
+    G, groups = graph_and_groups
+    baseline = randomWalkWithRestartBatch(G, groups, tol=1e-10)
+    p_init = {seed_id: result.scores for seed_id, result in baseline.items()}
+
+    perturbed = G.copy()
+    perturbed.remove_edges_from(list(G.edges())[:10])
+    cold = randomWalkWithRestartBatch(perturbed, groups, tol=1e-10)
+    for local_push in (False, True):
+        warm = randomWalkWithRestartBatch(
+            perturbed, groups, tol=1e-10, p_init=p_init, local_push=local_push
+        )
+        for seed_id in groups:
+            for node, score in cold[seed_id].nodes_ranked.items():
+                assert warm[seed_id].nodes_ranked[node] == pytest.approx(score, abs=1e-8)
+
+
+@pytest.mark.parametrize("normalization", ["row", "symmetric"])
+def test_warm_start_needs_fewer_iterations(graph_and_groups, normalization):
+    """
+    Started from the full baseline solution, seeds included, every group
+    converges in fewer iterations than from its seed vector.
+    """
+    G, groups = graph_and_groups
+    baseline = randomWalkWithRestartBatch(
+        G, groups, normalization=normalization, solver="power"
+    )
+    p_init = {seed_id: result.scores for seed_id, result in baseline.items()}
+    for seed_id, seed_nodes in groups.items():
+        assert all(seed in p_init[seed_id] for seed in seed_nodes)
+        assert not any(seed in baseline[seed_id].nodes_ranked for seed in seed_nodes)
+
+    perturbed = G.copy()
+    perturbed.remove_edges_from(list(G.edges())[::50])
+    cold = randomWalkWithRestartBatch(
+        perturbed, groups, normalization=normalization, solver="power"
+    )
+    warm = randomWalkWithRestartBatch(
+        perturbed, groups, normalization=normalization, solver="power", p_init=p_init
+    )
+    for seed_id in groups:
+        assert (
+            warm[seed_id].metadata["iterations"] < cold[seed_id].metadata["iterations"]
+        )
+
+
+def test_batched_rows_keep_seed_group_order(graph_and_groups):
+    """
+    Empty seed groups get the usual placeholder row at their position.
+    """
+    G, groups = graph_and_groups
+    groups = {"empty": [], **groups}
+    rows = _runBatchedRWRAndSaveResults(
+        perturbed_G=G,
+        algorithm_name="RandomWalkWithRestartRowNormalization",
+        noise_type="removed_edges",
+        noise_level=0.1,
+        repeat="rep0",
+        filename="network.parquet",
+        seed_groups=groups,
+    )
+
+    assert [row["metadata_seed"]["seed_id"] for row in rows] == list(groups)
+    assert rows[0]["metadata_run"]["converged"] == "No Seeds"
+    assert all(row["metadata_run"]["converged"] is True for row in rows[1:])
@@ -0,0 +1,176 @@
+import gzip
+import json
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+
+from NoiseEffect.ModuleRecovery import main
+from NoiseEffect.ModuleRecovery.main import (
+    _computeBaselineModules,
+    benchmarkModuleDetectionAlgorithms,
+)
+
+ALGORITHMS = {
+    "1stNeighbors": True,
+    "DIAMOnD": True,
+    "RandomWalkWithRestartRowNormalization": True,
+    "ApproximatePersonalizedPageRank": True,
+}
+
+
+@pytest.fixture
+def benchmark_inputs(tmp_path):
+    """
+    A baseline edge list and two parquet files with three perturbed
+    repeats each.
+    """
+    G = nx.relabel_nodes(nx.powerlaw_cluster_graph(150, 3, 0.2, seed=1), str)
+    baseline_path = tmp_path / "ppi.txt"
+    nx.write_edgelist(G, baseline_path, data=False)
+
+    perturbed_directory = tmp_path / "perturbed"
+    perturbed_directory.mkdir()
+    rng = np.random.default_rng(0)
+    edges = list(G.edges())
+    for noise_type in ("removed_edges", "added_edges"):
+        rows = []
+        for repeat in range(3):
+            keep = rng.random(len(edges)) > 0.1
+            rows += [(u, v, repeat) for (u, v), k in zip(edges, keep) if k]
+        pd.DataFrame(rows, columns=["source", "target", "repeat"]).to_parquet(
+            perturbed_directory / f"ppi_{noise_type}_noise_0p1.parquet", index=False
+        )
+
+    seed_groups = {"a": ["1", "2", "3"], "b": ["10", "20"], "c": ["100", "not_in_ppi"]}
+    return str(baseline_path), str(perturbed_directory), seed_groups
+
+
+def _readResults(output_directory, algorithm):
+    path = output_directory / f"results_test_{algorithm}.jsonl.gz"
+    with gzip.open(path, "rt") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_parallel_workers_give_the_serial_results(benchmark_inputs, tmp_path):
+    """
+    With several worker processes the merged result files contain the same
+    lines, in the same order, as with the serial loop.
+    """
+    baseline_path, perturbed_directory, seed_groups = benchmark_inputs
+    outputs = {}
+    for n_workers in (1, 3):
+        output_directory = tmp_path / f"out_{n_workers}"
+        benchmarkModuleDetectionAlgorithms(
+            baseline_network_path=baseline_path,
+            perturbed_networks_directory=perturbed_directory,
+            algorithms_config=ALGORITHMS,
+            seed_groups=seed_groups,
+            output_file_location=str(output_directory),
+            experiment_identifier="test",
+            n_workers=n_workers,
+        )
+        outputs[n_workers] = output_directory
+
+    for algorithm in ALGORITHMS:
+        serial = _readResults(outputs[1], algorithm)
+        parallel = _readResults(outputs[3], algorithm)
+        # Baseline plus 6 perturbed networks, 3 seed groups each
+        assert len(serial) == 7 * 3
+        assert parallel == serial
+
+    # The shards are removed after merging
+    assert sorted(p.name for p in outputs[3].iterdir()) == sorted(
+        p.name for p in outputs[1].iterdir()
+    )
+
+
+def test_baseline_keeps_full_rwr_solution_as_warm_start(benchmark_inputs, tmp_path):
+    """
+    The warm start holds the scores of all nodes, seeds included, while the
+    saved baseline ranking leaves the seeds out.
+    """
+    baseline_path, _, seed_groups = benchmark_inputs
+    seed_groups = {"a": seed_groups["a"], "b": seed_groups["b"]}
+    baseline_cache = _computeBaselineModules(
+        baseline_network_path=baseline_path,
+        baseline_G=nx.read_edgelist(baseline_path),
+        algorithms_config=ALGORITHMS,
+        seed_groups=seed_groups,
+        output_file_location=str(tmp_path),
+        experiment_identifier="test",
+    )
+
+    assert list(baseline_cache) == ["RandomWalkWithRestartRowNormalization"]
+    saved = _readResults(tmp_path, "RandomWalkWithRestartRowNormalization")
+    for row in saved:
+        seed_id = row["metadata_seed"]["seed_id"]
+        scores = baseline_cache["RandomWalkWithRestartRowNormalization"][seed_id]
+        assert sum(scores.values()) == pytest.approx(1.0)
+        assert all(seed in scores for seed in seed_groups[seed_id])
+        assert not any(seed in row["module_results"] for seed in seed_groups[seed_id])
+
+
+def test_parallel_run_ignores_shards_of_a_crashed_run(benchmark_inputs, tmp_path):
+    """
+    Shards left behind by an interrupted run are not merged into the results.
+    """
+    baseline_path, perturbed_directory, seed_groups = benchmark_inputs
+    stale_shard = tmp_path / ".shards_test" / "task_0000000"
+    stale_shard.mkdir(parents=True)
+    with gzip.open(stale_shard / "results_test_1stNeighbors.jsonl.gz", "wt") as f:
+        f.write(json.dumps({"stale": True}) + "\n")
+
+    benchmarkModuleDetectionAlgorithms(
+        baseline_network_path=baseline_path,
+        perturbed_networks_directory=perturbed_directory,
+        algorithms_config={"1stNeighbors": True},
+        seed_groups=seed_groups,
+        output_file_location=str(tmp_path),
+        experiment_identifier="test",
+        n_workers=2,
+    )
+
+    results = _readResults(tmp_path, "1stNeighbors")
+    assert len(results) == 7 * 3
+    assert not any("stale" in row for row in results)
+    assert not (tmp_path / ".shards_test").exists()
+
+
+@pytest.mark.parametrize(
+    "n_workers, domino_workers, expected",
+    [(4, None, 2), (16, None, 1), (4, 3, 3), (1, None, None)],
+)
+def test_domino_workers_share_the_cpus_of_the_worker_processes(
+    benchmark_inputs, tmp_path, monkeypatch, n_workers, domino_workers, expected
+):
+    """
+    In parallel mode every worker process gets its share of the CPUs for
+    DOMINO, unless domino_workers is given.
+    """
+    baseline_path, perturbed_directory, seed_groups = benchmark_inputs
+    settings = {}
+    monkeypatch.setattr(main.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(
+        main,
+        "_computeModulesOnPerturbedNetworksParallel",
+        lambda **kwargs: settings.update(kwargs),
+    )
+    monkeypatch.setattr(
+        main,
+        "_computeModulesOnPerturbedNetworks",
+        lambda **kwargs: settings.update(kwargs),
+    )
+
+    benchmarkModuleDetectionAlgorithms(
+        baseline_network_path=baseline_path,
+        perturbed_networks_directory=perturbed_directory,
+        algorithms_config={"1stNeighbors": True},
+        seed_groups=seed_groups,
+        output_file_location=str(tmp_path),
+        experiment_identifier="test",
+        domino_workers=domino_workers,
+        n_workers=n_workers,
+    )
+
+    assert settings["domino_workers"] == expected
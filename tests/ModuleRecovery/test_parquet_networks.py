@@ -0,0 +1,58 @@
+import networkx as nx
+import pandas as pd
+import pytest
+
+from NoiseEffect.ModuleRecovery.main import _loadPerturbedNetworkFromFile
+from NoiseEffect.ModuleRecovery.utils import _networkMapFromDirectory
+
+
+@pytest.fixture
+def perturbed_directory(tmp_path):
+    """
+    One parquet file with three repeats, as written by
+    generateNoiseNetworksFromBaseline, next to an old-style edge list.
+    """
+    repeats = {
+        0: [("A", "B"), ("B", "C")],
+        1: [("A", "C")],
+        2: [("C", "D"), ("D", "E"), ("A", "E")],
+    }
+    df = pd.DataFrame(
+        [(u, v, r) for r, edges in repeats.items() for u, v in edges],
+        columns=["source", "target", "repeat"],
+    )
+    # Repeats are not required to be stored in order
+    df = df.iloc[::-1].reset_index(drop=True)
+    df["repeat"] = df["repeat"].astype("uint8")
+    df.to_parquet(tmp_path / "ppi_removed_edges_noise_0p05.parquet", index=False)
+
+    (tmp_path / "ppi_added_edges_noise0p1_repeat3.tsv").write_text("A\tB\n")
+    return tmp_path, repeats
+
+
+def test_parquet_repeats_become_tasks(perturbed_directory):
+    """
+    Every repeat of a parquet file is listed as its own task.
+    """
+    directory, _ = perturbed_directory
+    tasks = _networkMapFromDirectory(str(directory))
+
+    assert tasks == [
+        ("ppi_added_edges_noise0p1_repeat3.tsv", "added_edges", 0.1, "rep3", "ppi"),
+        ("ppi_removed_edges_noise_0p05.parquet", "removed_edges", 0.05, "rep0", "ppi"),
+        ("ppi_removed_edges_noise_0p05.parquet", "removed_edges", 0.05, "rep1", "ppi"),
+        ("ppi_removed_edges_noise_0p05.parquet", "removed_edges", 0.05, "rep2", "ppi"),
+    ]
+
+
+def test_parquet_repeat_graphs(perturbed_directory):
+    """
+    The graph of a repeat contains exactly that repeat's edges.
+    """
+    directory, repeats = perturbed_directory
+    for filename, _, _, repeat, _ in _networkMapFromDirectory(str(directory)):
+        G = _loadPerturbedNetworkFromFile(str(directory), filename, repeat)
+        if filename.endswith(".parquet"):
+            expected = nx.Graph(repeats[int(repeat[3:])])
+            assert nx.utils.edges_equal(G.edges(), expected.edges())
+            assert set(G.nodes()) == set(expected.nodes())
@@ -0,0 +1,60 @@
+import random
+from collections import Counter
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from NoiseEffect.NoisePipeline.RecoveryMethods.GlobalStructure.global_structure_metrics import (
+    generateGlobalStructureMetrics,
+)
+
+
+@pytest.fixture
+def fragmented_graph():
+    """
+    A sparse random graph with many small components and isolated nodes.
+    """
+    return nx.gnm_random_graph(400, 350, seed=7)
+
+
+def test_component_histogram_matches_networkx(fragmented_graph):
+    """
+    The component size histogram equals the networkx one, isolated nodes included.
+    """
+    expected = dict(Counter(len(c) for c in nx.connected_components(fragmented_graph)))
+    metrics = generateGlobalStructureMetrics(fragmented_graph, samples=10)
+
+    assert metrics["number_of_components"] == expected
+
+
+def test_input_formats_give_identical_metrics(fragmented_graph):
+    """
+    networkx graphs, sparse matrices and edge arrays are interchangeable.
+    """
+    edges = np.array(fragmented_graph.edges())
+    num_nodes = fragmented_graph.number_of_nodes()
+    inputs = [
+        (fragmented_graph, None),
+        (nx.to_scipy_sparse_array(fragmented_graph), None),
+        (edges, num_nodes),
+    ]
+
+    results = []
+    for graph, n in inputs:
+        random.seed(0)
+        results.append(generateGlobalStructureMetrics(graph, samples=20, num_nodes=n))
+    assert results[0] == results[1] == results[2]
+
+
+def test_edge_array_requires_number_of_nodes():
+    """
+    Isolated nodes can not be inferred from an edge array.
+    """
+    with pytest.raises(ValueError):
+        generateGlobalStructureMetrics(np.array([[0, 1], [1, 2]]))
+
+
+def test_unknown_path_length_method():
+    with pytest.raises(ValueError):
+        generateGlobalStructureMetrics(nx.path_graph(5), path_length_method="exact")
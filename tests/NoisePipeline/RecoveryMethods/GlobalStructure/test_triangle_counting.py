@@ -0,0 +1,71 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from NoiseEffect.utils.sparse_graph import edgesToCSR, networkxToCSR
+from NoiseEffect.NoisePipeline.RecoveryMethods.GlobalStructure.triangle_counting import (
+    clusteringMetrics,
+    triangleCounts,
+)
+from NoiseEffect.NoisePipeline.RecoveryMethods.GlobalStructure.global_structure_metrics import (
+    generateGlobalStructureMetrics,
+)
+
+
+@pytest.fixture
+def clustered_graph():
+    """
+    A graph with many triangles and a heterogeneous degree distribution.
+    """
+    return nx.powerlaw_cluster_graph(500, 4, 0.4, seed=3)
+
+
+def test_triangle_counts_match_networkx(clustered_graph):
+    """
+    Per-node triangle counts equal networkx's exact counts.
+    """
+    A, nodelist = networkxToCSR(clustered_graph)
+    expected = nx.triangles(clustered_graph)
+
+    counts = triangleCounts(A)
+    assert [counts[i] for i in range(len(nodelist))] == [expected[n] for n in nodelist]
+
+
+def test_clustering_matches_networkx(clustered_graph):
+    """
+    Local, average clustering and transitivity are exact.
+    """
+    A, nodelist = networkxToCSR(clustered_graph)
+    metrics = clusteringMetrics(A)
+    local = nx.clustering(clustered_graph)
+
+    assert np.allclose(metrics["local_clustering"], [local[n] for n in nodelist])
+    assert metrics["average_clustering"] == pytest.approx(nx.average_clustering(clustered_graph))
+    assert metrics["transitivity"] == pytest.approx(nx.transitivity(clustered_graph))
+    assert metrics["num_triangles"] == sum(nx.triangles(clustered_graph).values()) // 3
+
+
+def test_edge_array_input_ignores_duplicates_and_self_loops():
+    """
+    Duplicate edges and self-loops in an edge array do not create triangles.
+    """
+    edges = np.array([[0, 1], [1, 2], [2, 0], [0, 1], [1, 0], [2, 2], [2, 3]])
+    metrics = clusteringMetrics(edgesToCSR(edges, num_nodes=5))
+
+    assert list(triangleCounts(edgesToCSR(edges, 5))) == [1, 1, 1, 0, 0]
+    assert metrics["local_clustering"][2] == pytest.approx(1 / 3)
+    assert metrics["transitivity"] == pytest.approx(3 / 5)
+
+
+def test_global_metrics_use_largest_component(clustered_graph):
+    """
+    Clustering is reported on the largest connected component only.
+    """
+    G = clustered_graph.copy()
+    # A separate triangle would raise the average clustering of the whole graph
+    G.add_edges_from([(1000, 1001), (1001, 1002), (1002, 1000)])
+    lcc = G.subgraph(max(nx.connected_components(G), key=len))
+
+    metrics = generateGlobalStructureMetrics(G, samples=10)
+    assert metrics["average_clustering_coeff_lcc"] == pytest.approx(nx.average_clustering(lcc))
+    assert metrics["transitivity_lcc"] == pytest.approx(nx.transitivity(lcc))
@@ -188,6 +188,9 @@ def test_calculateSimilarityMetrics_orchestration(
     assert result == expected_result
 
 
+@patch(
+    "NoiseEffect.NoisePipeline.RecoveryMethods.LocalNeighborhood.local_neighborhood.randomWalkGraph"
+)
 @patch(
     "NoiseEffect.NoisePipeline.RecoveryMethods.LocalNeighborhood.local_neighborhood.randomWalkWithRestart"
 )
@@ -198,7 +201,7 @@ def test_calculateSimilarityMetrics_orchestration(
     "NoiseEffect.NoisePipeline.RecoveryMethods.LocalNeighborhood.local_neighborhood.ast.literal_eval"
 )
 def test_localNeighborhoodAnalysis_orchestration(
-    mock_literal_eval, mock_calculate_similarity, mock_rwr
+    mock_literal_eval, mock_calculate_similarity, mock_rwr, mock_walk_graph
 ):
     """
     Tests that localNeighborhoodAnalysis loops correctly, calls RWR
@@ -238,9 +241,24 @@ def test_localNeighborhoodAnalysis_orchestration(
     mock_literal_eval.assert_any_call("[0]")
     mock_literal_eval.assert_any_call("[1, 2]")
 
+    # The network is prepared once for both walks
+    mock_walk_graph.assert_called_once_with(mock_network)
     assert mock_rwr.call_count == 2
-    mock_rwr.assert_any_call(G=mock_network, seed_nodes=seeds_1)
-    mock_rwr.assert_any_call(G=mock_network, seed_nodes=seeds_2)
+    # Each walk is warm-started from the baseline solution of its start set
+    mock_rwr.assert_any_call(
+        G=mock_network,
+        seed_nodes=seeds_1,
+        p_init=original_neighborhood["[0]"],
+        local_push=False,
+        walk_graph=mock_walk_graph.return_value,
+    )
+    mock_rwr.assert_any_call(
+        G=mock_network,
+        seed_nodes=seeds_2,
+        p_init=original_neighborhood["[1, 2]"],
+        local_push=False,
+        walk_graph=mock_walk_graph.return_value,
+    )
 
     assert mock_calculate_similarity.call_count == 2
 
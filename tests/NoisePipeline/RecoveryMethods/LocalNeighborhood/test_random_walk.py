@@ -3,6 +3,7 @@ import networkx as nx
 import numpy as np
 
 from NoiseEffect.NoisePipeline.RecoveryMethods.LocalNeighborhood.random_walk import (
+    randomWalkGraph,
     randomWalkWithRestart,
 )
 
@@ -112,3 +113,47 @@ def test_rwr_math_on_two_nodes():
 
     assert np.isclose(result[0], expected_a)
     assert np.isclose(result[1], expected_b)
+
+
+def test_rwr_warm_start_and_local_push_match_cold_start():
+    """
+    Starting from the baseline solution, by power iteration or by pushing only
+    the residual of the removed edges, gives the same vector as a cold start.
+    """
+    G = nx.connected_watts_strogatz_graph(300, 6, 0.1, seed=4)
+    seed_nodes = [0, 5]
+    baseline = randomWalkWithRestart(G, seed_nodes, tol=1e-10)
+
+    perturbed = G.copy()
+    perturbed.remove_edges_from(list(G.edges())[:5])
+    cold = randomWalkWithRestart(perturbed, seed_nodes, tol=1e-10)
+    warm = randomWalkWithRestart(perturbed, seed_nodes, tol=1e-10, p_init=baseline)
+    pushed = randomWalkWithRestart(
+        perturbed, seed_nodes, tol=1e-10, p_init=baseline, local_push=True
+    )
+
+    for node in perturbed.nodes():
+        assert np.isclose(warm[node], cold[node], atol=1e-8)
+        assert np.isclose(pushed[node], cold[node], atol=1e-8)
+
+
+def test_rwr_local_push_requires_initial_vector(sample_graph):
+    with pytest.raises(ValueError):
+        randomWalkWithRestart(sample_graph, [0], local_push=True)
+
+
+def test_rwr_shared_walk_graph_on_fragmented_network():
+    """
+    Walks given the prepared network give the same result as building it
+    per walk, and nodes outside the seeds' components get no probability.
+    """
+    G = nx.disjoint_union_all([nx.path_graph(4), nx.cycle_graph(5), nx.empty_graph(2)])
+    walk_graph = randomWalkGraph(G)
+
+    for seed_nodes in ([0], [4, 6], [9], [0, 10]):
+        shared = randomWalkWithRestart(G, seed_nodes, walk_graph=walk_graph)
+        assert shared == randomWalkWithRestart(G, seed_nodes)
+        assert np.isclose(sum(shared.values()), 1.0)
+
+    shared = randomWalkWithRestart(G, [4, 6], walk_graph=walk_graph)
+    assert all(shared[node] == 0 for node in G if not 4 <= node <= 8)
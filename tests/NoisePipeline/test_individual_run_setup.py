@@ -81,7 +81,7 @@ def test_run_orchestration(
 
     # Check that OriginalNetwork was instantiated correctly and its method was called.
     mock_original_network_class.assert_called_once_with(
-        sample_network_request, list_of_seeds
+        sample_network_request, list_of_seeds, adaptive_seeds=None
     )
     mock_original_network_instance.generateEvaluationBaseline.assert_called_once()
 
@@ -0,0 +1,55 @@
+import networkx as nx
+import numpy as np
+
+from NoiseEffect.NoisePipeline.utils.generateRWRstarts import generateRWRstarts
+from NoiseEffect.utils.sparse_graph import networkxToCSR
+
+
+def _neighborhood(G, nodes):
+    return set(nodes).union(*(G.neighbors(n) for n in nodes))
+
+
+def test_start_sets_are_drawn_from_neighborhoods():
+    """
+    Single starts follow the degree ranking, the sampled halves come from the
+    first and second neighborhoods of the start node.
+    """
+    G = nx.barabasi_albert_graph(300, 3, seed=1)
+    seeds = list(range(10))
+    starts = generateRWRstarts(seeds, G)
+
+    ranking = sorted(G.nodes(), key=lambda n: G.degree(n), reverse=True)
+    expected_nodes = [ranking[i] for i in np.linspace(0, 299, 10, dtype=int)]
+    assert [s[0] for s in starts[:10]] == expected_nodes
+
+    for i, node in enumerate(expected_nodes):
+        first = _neighborhood(G, [node])
+        second = _neighborhood(G, first)
+        assert set(starts[10 + i]) <= first
+        assert len(starts[10 + i]) == max(1, len(first) // 2)
+        assert set(starts[20 + i]) <= second
+        assert len(starts[20 + i]) == max(1, len(second) // 2)
+
+
+def test_start_sets_are_reproducible():
+    """
+    The same seed list or generator seed gives the same start sets.
+    """
+    G = nx.gnm_random_graph(200, 600, seed=2)
+    seeds = [11, 22, 33]
+
+    assert generateRWRstarts(seeds, G) == generateRWRstarts(seeds, G)
+    assert generateRWRstarts(
+        seeds, G, rng=np.random.default_rng(5)
+    ) == generateRWRstarts(seeds, G, rng=np.random.default_rng(5))
+
+
+def test_sparse_input_matches_networkx_input():
+    """
+    A CSR adjacency matrix yields the same start sets as the integer-labeled graph.
+    """
+    G = nx.gnm_random_graph(150, 400, seed=3)
+    A, _ = networkxToCSR(G)
+    seeds = [1, 2, 3, 4]
+
+    assert generateRWRstarts(seeds, A) == generateRWRstarts(seeds, G)
@@ -0,0 +1,55 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from NoiseEffect.utils.hyperanf import hyperANF
+from NoiseEffect.utils.path_lengths import sampledPathLengths
+from NoiseEffect.utils.sparse_graph import edgesToCSR, networkxToCSR
+
+
+def test_estimates_close_to_exact_statistics():
+    """
+    Averaged over hash seeds, the sketch agrees with exact all-source BFS.
+    """
+    A, _ = networkxToCSR(nx.powerlaw_cluster_graph(1000, 3, 0.3, seed=1))
+    exact = sampledPathLengths(A)
+    estimates = [hyperANF(A, log2_registers=8, seed=seed) for seed in range(5)]
+
+    assert np.mean([e["mean"] for e in estimates]) == pytest.approx(exact["mean"], rel=0.05)
+    assert np.mean([e["num_reachable_pairs"] for e in estimates]) == pytest.approx(
+        exact["distance_distribution"].sum(), rel=0.1
+    )
+
+
+def test_stops_after_diameter_iterations():
+    """
+    Counters stop changing once the longest shortest path has been covered.
+    """
+    path = np.array([[i, i + 1] for i in range(9)])
+    result = hyperANF(edgesToCSR(path, num_nodes=10))
+
+    # Nine growing steps plus the pass that detects convergence
+    assert result["iterations"] == 10
+    assert result["neighbourhood_function"].size == 10
+    assert np.all(np.diff(result["neighbourhood_function"]) >= 0)
+
+
+def test_isolated_nodes_have_no_reachable_pairs():
+    """
+    A graph without edges has a trivial neighbourhood function.
+    """
+    result = hyperANF(edgesToCSR(np.empty((0, 2)), num_nodes=20))
+
+    assert result["num_reachable_pairs"] == 0
+    assert result["mean"] == 0.0
+    assert result["iterations"] == 1
+
+
+def test_same_seed_is_reproducible():
+    """
+    The node hash only depends on the seed.
+    """
+    A, _ = networkxToCSR(nx.gnm_random_graph(200, 300, seed=4))
+    first, second = hyperANF(A, seed=3), hyperANF(A, seed=3)
+
+    assert np.array_equal(first["neighbourhood_function"], second["neighbourhood_function"])
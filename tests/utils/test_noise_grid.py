@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from NoiseEffect.utils.noise_grid import refineNoiseGrid
+
+
+def test_threshold_crossing_is_bisected_to_resolution():
+    """
+    A step-like metric is located to the requested resolution with far fewer
+    evaluations than a dense grid would need.
+    """
+    breakdown = 0.437
+
+    def metric(level):
+        return 1.0 / (1.0 + np.exp((level - breakdown) * 200))
+
+    result = refineNoiseGrid(
+        metric, initial_levels=[0.1, 0.3, 0.5, 0.7, 0.9], resolution=0.01, threshold=0.5
+    )
+
+    lower, upper = result["interval"]
+    assert upper - lower <= 0.01
+    assert lower <= breakdown <= upper
+    assert result["threshold_estimate"] == pytest.approx(breakdown, abs=0.01)
+    # 5 coarse levels plus a handful of bisection steps
+    assert len(result["levels"]) <= 12
+
+
+def test_without_threshold_refines_steepest_interval():
+    """
+    Without a threshold, the interval with the largest change gets refined.
+    """
+    result = refineNoiseGrid(
+        lambda level: 0.0 if level < 0.62 else 1.0,
+        initial_levels=[0.0, 0.5, 1.0],
+        resolution=0.05,
+    )
+
+    lower, upper = result["interval"]
+    assert lower < 0.62 <= upper
+    assert upper - lower <= 0.05
+    assert result["threshold_estimate"] is None
+
+
+def test_max_levels_limits_evaluations():
+    """
+    The total number of evaluated levels never exceeds max_levels.
+    """
+    calls = []
+
+    def metric(level):
+        calls.append(level)
+        return level
+
+    result = refineNoiseGrid(
+        metric, initial_levels=[0.0, 1.0], resolution=1e-6, threshold=0.3, max_levels=6
+    )
+
+    assert len(calls) == 6
+    assert len(result["levels"]) == 6
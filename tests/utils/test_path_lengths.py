@@ -0,0 +1,73 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from NoiseEffect.utils.path_lengths import effectiveDiameter, sampledPathLengths
+from NoiseEffect.utils.sparse_graph import edgesToCSR, networkxToCSR
+
+
+@pytest.fixture
+def graph_with_isolated_part():
+    """
+    A connected random graph plus a separate path of three nodes.
+    """
+    G = nx.connected_watts_strogatz_graph(200, 4, 0.1, seed=5)
+    G.add_edges_from([(500, 501), (501, 502)])
+    return G
+
+
+def test_mean_and_distribution_match_networkx(graph_with_isolated_part):
+    """
+    Distances from the sampled sources equal networkx's BFS distances.
+    """
+    G = graph_with_isolated_part
+    A, nodelist = networkxToCSR(G)
+    sources = [0, 17, 42, len(nodelist) - 1]
+
+    expected = []
+    for source in sources:
+        lengths = nx.single_source_shortest_path_length(G, nodelist[source])
+        expected.extend(d for d in lengths.values() if d > 0)
+
+    result = sampledPathLengths(A, sources=sources, chunk_size=3)
+    assert result["mean"] == pytest.approx(np.mean(expected))
+    assert np.array_equal(
+        result["distance_distribution"], np.bincount(expected, minlength=1)
+    )
+    # Every source misses the nodes of the other component
+    assert result["num_unreachable"] == 3 * 3 + 200
+
+
+def test_parallel_chunks_give_same_result():
+    """
+    Distributing source chunks over workers does not change the statistics.
+    """
+    A, _ = networkxToCSR(nx.gnm_random_graph(300, 900, seed=2))
+    serial = sampledPathLengths(A, chunk_size=50)
+    parallel = sampledPathLengths(A, chunk_size=50, n_jobs=2)
+
+    assert serial["mean"] == pytest.approx(parallel["mean"])
+    assert np.array_equal(
+        serial["distance_distribution"], parallel["distance_distribution"]
+    )
+
+
+def test_effective_diameter_interpolates():
+    """
+    The 90% quantile is interpolated between integer distances.
+    """
+    # 50% of pairs at distance 1, 50% at distance 2
+    assert effectiveDiameter([0, 5, 5]) == pytest.approx(1.8)
+    assert effectiveDiameter([0, 10]) == pytest.approx(0.9)
+    assert effectiveDiameter([0]) == 0.0
+
+
+def test_path_graph():
+    """
+    All-source statistics on a path 0 - 1 - 2 - 3.
+    """
+    A = edgesToCSR(np.array([[0, 1], [1, 2], [2, 3]]), num_nodes=4)
+    result = sampledPathLengths(A)
+
+    assert list(result["distance_distribution"]) == [0, 6, 4, 2]
+    assert result["mean"] == pytest.approx(20 / 12)
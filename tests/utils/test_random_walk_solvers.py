@@ -0,0 +1,169 @@
+import networkx as nx
+import numpy as np
+import pytest
+from scipy.sparse.csgraph import connected_components
+
+from NoiseEffect.ModuleRecovery.ModuleDetectionAlgorithms.random_walk_with_restart_batched import (
+    randomWalkWithRestartBatch,
+)
+from NoiseEffect.ModuleRecovery.ModuleDetectionAlgorithms.random_walk_with_restart_row_normalization import (
+    randomWalkWithRestartRowNormalization,
+)
+from NoiseEffect.utils import random_walk_solvers
+from NoiseEffect.utils.random_walk_solvers import (
+    _solveRWRSystem,
+    localPushOnSeedComponents,
+    selectRWRSolver,
+    solveRWR,
+)
+from NoiseEffect.utils.sparse_graph import networkxToCSR
+
+
+@pytest.fixture
+def adjacency_and_restarts():
+    """
+    Adjacency matrix of a connected graph and three restart vectors.
+    """
+    A, _ = networkxToCSR(nx.connected_watts_strogatz_graph(400, 6, 0.2, seed=3))
+    P0 = np.zeros((400, 3))
+    P0[[0], 0] = 1.0
+    P0[[10, 20], 1] = 0.5
+    P0[[5, 50, 150, 250], 2] = 0.25
+    return A.astype(float), P0
+
+
+@pytest.mark.parametrize("normalization", ["row", "symmetric"])
+@pytest.mark.parametrize("restart", [0.15, 0.85])
+def test_solvers_agree(adjacency_and_restarts, normalization, restart):
+    """
+    Power iteration, conjugate gradient and the direct solver reach the same fixed point.
+    """
+    A, P0 = adjacency_and_restarts
+    solutions = {
+        solver: solveRWR(A, P0, restart, 1e-10, 5000, normalization, solver)
+        for solver in ("power", "cg", "direct")
+    }
+
+    for solver, solution in solutions.items():
+        assert solution["solver"] == solver
+        assert solution["converged"].all()
+        assert solution["residual"].max() < 1e-8
+        np.testing.assert_allclose(solution["P"], solutions["direct"]["P"], atol=1e-8)
+
+
+def test_automatic_solver_selection():
+    assert selectRWRSolver(num_nodes=10**6, num_rhs=1, restart=0.85) == "power"
+    assert selectRWRSolver(num_nodes=1_000, num_rhs=500, restart=0.15) == "direct"
+    assert selectRWRSolver(num_nodes=10**6, num_rhs=500, restart=0.15) == "cg"
+
+
+def test_unknown_solver(adjacency_and_restarts):
+    A, P0 = adjacency_and_restarts
+    with pytest.raises(ValueError):
+        solveRWR(A, P0, 0.85, 1e-6, 100, solver="gmres")
+
+
+def test_solver_metadata_in_module_result():
+    """
+    The RWR result records the solver, its iterations and the final residual.
+    """
+    G = nx.relabel_nodes(nx.karate_club_graph(), str)
+    result = randomWalkWithRestartRowNormalization(
+        G, ["0", "33"], restart=0.3, solver="cg"
+    )
+
+    assert result.metadata["solver"] == "cg"
+    assert result.metadata["converged"] is True
+    assert result.metadata["iterations"] > 0
+    assert result.metadata["residual"] < 1e-5
+
+
+@pytest.mark.parametrize("solver", ["power", "cg", "direct"])
+def test_solved_on_seed_components_only(solver):
+    """
+    Columns are solved on the components of their seeds and match the
+    solution on the full, fragmented graph.
+    """
+    G = nx.disjoint_union_all(
+        [
+            nx.connected_watts_strogatz_graph(size, 4, 0.2, seed=size)
+            for size in (300, 60, 40)
+        ]
+    )
+    A, _ = networkxToCSR(G)
+    A = A.astype(float)
+    P0 = np.zeros((400, 3))
+    P0[[0, 1], 0] = 0.5
+    P0[[300, 360], 1] = 0.5
+    P0[[370], 2] = 1.0
+
+    solution = solveRWR(A, P0, 0.3, 1e-10, 5000, "row", solver)
+    full = _solveRWRSystem(A, P0, 0.3, 1e-10, 5000, "row", solver, None)
+
+    np.testing.assert_array_equal(solution["solved_nodes"], [300, 100, 40])
+    np.testing.assert_allclose(solution["P"], full["P"], atol=1e-9)
+    assert (solution["P"][300:, 0] == 0).all()
+    assert (solution["P"][:360, 2] == 0).all()
+
+
+def test_components_labelled_once_per_network(monkeypatch):
+    """
+    A batch labels the components of its network once for all seed groups,
+    iterated or pushed.
+    """
+    calls = []
+
+    def countingConnectedComponents(*args, **kwargs):
+        calls.append(1)
+        return connected_components(*args, **kwargs)
+
+    monkeypatch.setattr(
+        random_walk_solvers, "connected_components", countingConnectedComponents
+    )
+    G = nx.relabel_nodes(nx.karate_club_graph(), str)
+    groups = {"a": ["0"], "b": ["5", "6"], "c": ["33"]}
+    baseline = randomWalkWithRestartBatch(G, groups)
+    calls.clear()
+
+    G.remove_edge("0", "1")
+    randomWalkWithRestartBatch(
+        G, groups, p_init={"a": baseline["a"].scores, "b": baseline["b"].scores}
+    )
+    randomWalkWithRestartBatch(
+        G,
+        groups,
+        p_init={"a": baseline["a"].scores, "b": baseline["b"].scores},
+        local_push=True,
+    )
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("normalization", ["row", "symmetric"])
+def test_local_push_on_seed_components_only(normalization):
+    """
+    The local push only works on the components of the seeds and reaches
+    the solution of the full, fragmented graph.
+    """
+    G = nx.disjoint_union_all(
+        [
+            nx.connected_watts_strogatz_graph(size, 4, 0.2, seed=size)
+            for size in (300, 60)
+        ]
+    )
+    A, _ = networkxToCSR(G)
+    A = A.astype(float)
+    p0 = np.zeros(360)
+    p0[[300, 310]] = 0.5
+    exact = _solveRWRSystem(
+        A, p0[:, None], 0.85, 1e-12, 5000, normalization, "direct", None
+    )["P"][:, 0]
+    perturbed_start = exact + 1e-3 * (exact > 0)
+
+    solution = localPushOnSeedComponents(
+        A, p0, 0.85, 1e-10, 1000, perturbed_start, normalization
+    )
+
+    assert solution["solved_nodes"] == 60
+    assert solution["converged"]
+    assert (solution["p"][:300] == 0).all()
+    np.testing.assert_allclose(solution["p"], exact, atol=1e-9)
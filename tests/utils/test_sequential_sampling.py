@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from NoiseEffect.utils.sequential_sampling import (
+    confidenceHalfWidth,
+    sampleUntilConfident,
+    sampleUntilStandardError,
+    standardError,
+)
+
+
+def test_half_width_ignores_nan_and_needs_two_values():
+    """
+    NaN values are dropped; with fewer than two values the interval is infinite.
+    """
+    assert confidenceHalfWidth([0.5]) == np.inf
+    assert confidenceHalfWidth([0.5, np.nan]) == np.inf
+    assert confidenceHalfWidth([0.5, 0.5, np.nan]) == 0.0
+
+
+def test_constant_values_stop_after_minimum():
+    """
+    A perfectly stable estimate stops right after the minimum number of samples.
+    """
+    calls = []
+
+    def evaluate(batch):
+        calls.append(list(batch))
+        return [1.0] * len(batch)
+
+    result = sampleUntilConfident(evaluate, range(50), tolerance=0.01, min_samples=10)
+
+    assert result["converged"]
+    assert result["used"] == list(range(10))
+    assert calls == [list(range(10))]
+
+
+def test_noisy_values_run_until_maximum():
+    """
+    If the tolerance can not be met, all candidates up to the maximum are used
+    in the given order and the result is flagged as not converged.
+    """
+    rng = np.random.default_rng(0)
+
+    result = sampleUntilConfident(
+        lambda batch: rng.random(len(batch)).tolist(),
+        range(100),
+        tolerance=1e-6,
+        batch_size=7,
+        min_samples=10,
+        max_samples=30,
+    )
+
+    assert not result["converged"]
+    assert result["used"] == list(range(30))
+    assert result["values"].shape == (30,)
+
+
+def test_stops_once_interval_is_narrow_enough():
+    """
+    The returned half-width respects the tolerance when converged.
+    """
+    rng = np.random.default_rng(1)
+    result = sampleUntilConfident(
+        lambda batch: (0.8 + 0.05 * rng.standard_normal(len(batch))).tolist(),
+        range(1000),
+        tolerance=0.02,
+        batch_size=5,
+        min_samples=5,
+    )
+
+    assert result["converged"]
+    assert result["half_width"] <= 0.02
+    assert 5 <= len(result["used"]) < 1000
+    assert result["half_width"] == pytest.approx(confidenceHalfWidth(result["values"]))
+
+
+def test_standard_error_rule_adds_one_repeat_at_a_time():
+    """
+    The standard-error rule evaluates the minimum first and then single
+    repeats until the standard error is below the threshold.
+    """
+    batches = []
+    values = iter([0.0, 1.0, 0.0, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5])
+
+    def evaluate(batch):
+        batches.append(list(batch))
+        return [next(values) for _ in batch]
+
+    result = sampleUntilStandardError(
+        evaluate, range(10), max_standard_error=0.12, min_samples=3
+    )
+
+    assert batches[0] == [0, 1, 2]
+    assert all(len(batch) == 1 for batch in batches[1:])
+    assert result["converged"]
+    assert result["standard_error"] == pytest.approx(standardError(result["values"]))
+    assert result["standard_error"] <= 0.12